@@ -41,6 +41,9 @@ REVIEWS_DIR = DATA_DIR / "reviews"
 USAGE_DIR = DATA_DIR / "usage"
 REGISTRY_FILE = DATA_DIR / "registry.json"
 
+# SKILL.md 前置元数据解析器：优先使用 libyaml 的 C 实现，未编译 libyaml 时回退到纯 Python
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 # 创建目录
 for dir_path in [DATA_DIR, UPLOADS_DIR, SKILLS_DIR, REVIEWS_DIR, USAGE_DIR]:
     dir_path.mkdir(parents=True, exist_ok=True)
@@ -127,7 +130,7 @@ def parse_skill_md(zip_file: zipfile.ZipFile) -> tuple:
             yaml_end = skill_md_content.find('---', 3)
             if yaml_end != -1:
                 yaml_content = skill_md_content[3:yaml_end]
-                metadata = yaml.safe_load(yaml_content)
+                metadata = yaml.load(yaml_content, Loader=YAML_LOADER)
 
                 name = metadata.get('name')
                 description = metadata.get('description', '')
@@ -10,9 +10,10 @@ Skills Arena Manager - 核心管理器
 """
 
 import json
+import os
 import uuid
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 
@@ -50,6 +51,12 @@ class ArenaManager:
         self.leaderboards_dir = self.data_dir / "leaderboards"
         self.leaderboards_dir.mkdir(exist_ok=True)
 
+        # 已解析 JSON 文件缓存：目录 -> {文件路径: ((mtime_ns, size), 数据)}
+        self._json_cache: Dict[Path, Dict[str, Tuple[Tuple[int, int], Dict]]] = {}
+
+        # 排行榜缓存：scenario_id -> (场景文件签名, Skill ID 列表, Skill 文件签名, 排行榜)
+        self._leaderboard_cache: Dict[str, Tuple] = {}
+
     def create_scenario(self, title: str, description: str, category: str) -> Dict:
         """
         创建评比场景
@@ -62,23 +69,8 @@ class ArenaManager:
         Returns:
             场景数据
         """
-        scenario_id = f"scenario-{uuid.uuid4().hex[:12]}"
-
-        scenario = {
-            "scenario_id": scenario_id,
-            "title": title,
-            "description": description,
-            "category": category,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            "status": "active",
-            "registered_skills": [],  # 注册的 Skills 列表
-            "metrics": {
-                "total_reviews": 0,
-                "total_skills": 0,
-                "avg_rating": 0.0
-            }
-        }
+        scenario = self._new_scenario(title, description, category)
+        scenario_id = scenario["scenario_id"]
 
         self._save_scenario(scenario_id, scenario)
 
@@ -100,23 +92,8 @@ class ArenaManager:
         Returns:
             Skill 数据
         """
-        skill_id = f"skill-{uuid.uuid4().hex[:12]}"
-
-        skill = {
-            "skill_id": skill_id,
-            "skill_name": skill_name,
-            "description": description,
-            "author": author,
-            "registered_at": datetime.now().isoformat(),
-            "metrics": {
-                "total_reviews": 0,
-                "avg_rating": 0.0,
-                "avg_accuracy": 0.0,
-                "avg_efficiency": 0.0,
-                "avg_creativity": 0.0
-            },
-            "categories": []  # 参与的场景分类
-        }
+        skill = self._new_skill(skill_name, description, author)
+        skill_id = skill["skill_id"]
 
         self._save_skill(skill_id, skill)
 
@@ -206,24 +183,8 @@ class ArenaManager:
             raise ValueError("Rating must be between 1 and 5")
 
         # 创建评价
-        review_id = f"review-{uuid.uuid4().hex[:12]}"
-
-        review = {
-            "review_id": review_id,
-            "scenario_id": scenario_id,
-            "skill_id": skill_id,
-            "user_id": user_id,
-            "rating": rating,
-            "metrics": {
-                "accuracy": metrics.get("accuracy", 0.0),
-                "efficiency": metrics.get("efficiency", 0.0),
-                "creativity": metrics.get("creativity", 0.0)
-            },
-            "comment": comment,
-            "created_at": datetime.now().isoformat(),
-            "helpful_count": 0,  # 有用投票
-            "flagged": False  # 是否被标记
-        }
+        review = self._new_review(scenario_id, skill_id, user_id, rating, metrics, comment)
+        review_id = review["review_id"]
 
         # 保存评价
         self._save_review(review_id, review)
@@ -259,23 +220,35 @@ class ArenaManager:
         if not reviews:
             return
 
-        # 计算平均值
+        skill["metrics"] = self._compute_skill_metrics(reviews)
+        skill["updated_at"] = datetime.now().isoformat()
+
+        self._save_skill(skill_id, skill)
+
+    @staticmethod
+    def _compute_skill_metrics(reviews: List[Dict]) -> Dict:
+        """
+        根据评价列表计算 Skill 的平均指标
+
+        Args:
+            reviews: 该 Skill 的评价列表（非空）
+
+        Returns:
+            指标字典
+        """
         total_reviews = len(reviews)
         total_rating = sum(r["rating"] for r in reviews)
         total_accuracy = sum(r["metrics"]["accuracy"] for r in reviews)
         total_efficiency = sum(r["metrics"]["efficiency"] for r in reviews)
         total_creativity = sum(r["metrics"]["creativity"] for r in reviews)
 
-        skill["metrics"] = {
+        return {
             "total_reviews": total_reviews,
             "avg_rating": round(total_rating / total_reviews, 2),
             "avg_accuracy": round(total_accuracy / total_reviews, 2),
             "avg_efficiency": round(total_efficiency / total_reviews, 2),
             "avg_creativity": round(total_creativity / total_reviews, 2)
         }
-        skill["updated_at"] = datetime.now().isoformat()
-
-        self._save_skill(skill_id, skill)
 
     def get_reviews_for_skill(self, skill_id: str) -> List[Dict]:
         """
@@ -309,11 +282,88 @@ class ArenaManager:
         if not scenario:
             raise ValueError(f"Scenario {scenario_id} not found")
 
-        skill_ids = scenario["registered_skills"]
-        leaderboard_data = []
+        skills = {}
+        for skill_id in scenario["registered_skills"]:
+            skill = self.load_skill(skill_id)
+            if skill:
+                skills[skill_id] = skill
+
+        leaderboard = self.build_leaderboard(scenario, skills)
+        self._save_leaderboard(leaderboard)
 
+        return leaderboard
+
+    def get_leaderboard(self, scenario_id: str) -> Dict:
+        """
+        获取排行榜（带缓存）
+
+        场景文件和其中各 Skill 的数据文件都未修改时，直接返回上次生成的排行榜，
+        每次读取只需 stat 这些文件，不再解析 Skill 数据，也不再重复保存排行榜。
+        数据变化（包括其他进程写入）后自动重新生成。返回的数据是缓存中的共享
+        对象，调用方只应读取。
+
+        Args:
+            scenario_id: 场景 ID
+
+        Returns:
+            排行榜数据
+        """
+        scenario_sig = self._file_signature(self.scenarios_dir / f"{scenario_id}.json")
+        if scenario_sig is None:
+            raise ValueError(f"Scenario {scenario_id} not found")
+
+        cached = self._leaderboard_cache.get(scenario_id)
+        if cached is not None and cached[0] == scenario_sig:
+            if self._skill_signatures(cached[1]) == cached[2]:
+                return cached[3]
+
+        # 先记录签名再读取数据：读取期间发生的修改会让下次请求重新生成
+        scenario = self.load_scenario(scenario_id)
+        if not scenario:
+            raise ValueError(f"Scenario {scenario_id} not found")
+        skill_ids = tuple(scenario["registered_skills"])
+        skill_sigs = self._skill_signatures(skill_ids)
+
+        skills = {}
         for skill_id in skill_ids:
             skill = self.load_skill(skill_id)
+            if skill:
+                skills[skill_id] = skill
+
+        leaderboard = self.build_leaderboard(scenario, skills)
+        self._save_leaderboard(leaderboard)
+
+        self._leaderboard_cache[scenario_id] = (scenario_sig, skill_ids, skill_sigs, leaderboard)
+        return leaderboard
+
+    def _skill_signatures(self, skill_ids) -> Tuple:
+        """各 Skill 数据文件的签名"""
+        return tuple(self._file_signature(self.skills_dir / f"{skill_id}.json") for skill_id in skill_ids)
+
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+        """文件的 (mtime_ns, size)，文件不存在时返回 None"""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def build_leaderboard(self, scenario: Dict, skills: Dict[str, Dict]) -> Dict:
+        """
+        根据内存中的场景和 Skill 数据构建排行榜（不读写文件）
+
+        Args:
+            scenario: 场景数据
+            skills: Skill 数据，按 skill_id 索引；缺少的 Skill 会被跳过
+
+        Returns:
+            排行榜数据
+        """
+        leaderboard_data = []
+
+        for skill_id in scenario["registered_skills"]:
+            skill = skills.get(skill_id)
             if skill and skill["metrics"]["total_reviews"] > 0:
                 leaderboard_data.append({
                     "skill_id": skill_id,
@@ -332,8 +382,8 @@ class ArenaManager:
         for idx, item in enumerate(leaderboard_data, 1):
             item["rank"] = idx
 
-        leaderboard = {
-            "scenario_id": scenario_id,
+        return {
+            "scenario_id": scenario["scenario_id"],
             "scenario_title": scenario["title"],
             "category": scenario["category"],
             "generated_at": datetime.now().isoformat(),
@@ -341,16 +391,279 @@ class ArenaManager:
             "leaderboard": leaderboard_data
         }
 
-        # 保存排行榜
+    def _save_leaderboard(self, leaderboard: Dict) -> str:
+        """保存排行榜，返回排行榜 ID"""
         leaderboard_id = f"leaderboard-{uuid.uuid4().hex[:12]}"
         leaderboard_path = self.leaderboards_dir / f"{leaderboard_id}.json"
         with open(leaderboard_path, 'w', encoding='utf-8') as f:
             json.dump(leaderboard, f, indent=2, ensure_ascii=False)
 
         print(f"✓ Generated leaderboard: {leaderboard_id}")
-        print(f"  Total skills: {len(leaderboard_data)}")
+        print(f"  Total skills: {leaderboard['total_skills']}")
 
-        return leaderboard
+        return leaderboard_id
+
+    def bulk_create_scenarios(self, scenarios: List[Dict]) -> List[Dict]:
+        """
+        批量创建评比场景
+
+        Args:
+            scenarios: 场景定义列表，每项包含 title、description、category
+
+        Returns:
+            创建的场景数据列表（与输入顺序一致）
+        """
+        created = [
+            self._new_scenario(s["title"], s["description"], s["category"])
+            for s in scenarios
+        ]
+        for scenario in created:
+            self._save_scenario(scenario["scenario_id"], scenario)
+
+        print(f"✓ Created {len(created)} scenarios")
+
+        return created
+
+    def bulk_register_skills(self, skills: List[Dict]) -> List[Dict]:
+        """
+        批量注册 Skills
+
+        Args:
+            skills: Skill 定义列表，每项包含 skill_name、description，可选 author
+
+        Returns:
+            注册的 Skill 数据列表（与输入顺序一致）
+        """
+        created = [
+            self._new_skill(s["skill_name"], s["description"], s.get("author", "anonymous"))
+            for s in skills
+        ]
+        for skill in created:
+            self._save_skill(skill["skill_id"], skill)
+
+        print(f"✓ Registered {len(created)} skills")
+
+        return created
+
+    def bulk_add_skills_to_scenarios(self, links: List[Tuple[str, str]]) -> Dict[str, Dict]:
+        """
+        批量将 Skills 添加到场景
+
+        每个涉及的场景和 Skill 只读取和写入一次，而不是每个关联都读写一次。
+
+        Args:
+            links: (scenario_id, skill_id) 列表
+
+        Returns:
+            更新后的场景数据，按 scenario_id 索引
+        """
+        scenarios: Dict[str, Dict] = {}
+        skills: Dict[str, Dict] = {}
+        now = datetime.now().isoformat()
+
+        for scenario_id, skill_id in links:
+            scenario = self._load_cached(scenarios, scenario_id, self.load_scenario, "Scenario")
+            skill = self._load_cached(skills, skill_id, self.load_skill, "Skill")
+
+            # 检查是否已注册
+            if skill_id in scenario["registered_skills"]:
+                print(f"⚠ Skill {skill_id} already in scenario {scenario_id}")
+                continue
+
+            scenario["registered_skills"].append(skill_id)
+            scenario["updated_at"] = now
+            scenario["metrics"]["total_skills"] = len(scenario["registered_skills"])
+
+            skill["categories"].append(scenario["category"])
+            skill["registered_at"] = now
+
+        for scenario_id, scenario in scenarios.items():
+            self._save_scenario(scenario_id, scenario)
+        for skill_id, skill in skills.items():
+            self._save_skill(skill_id, skill)
+
+        print(f"✓ Added {len(links)} skill/scenario links")
+
+        return scenarios
+
+    def bulk_submit_reviews(self, reviews: List[Dict]) -> List[Dict]:
+        """
+        批量提交用户评价
+
+        与逐条调用 submit_review 不同，场景和 Skill 只读写一次，Skill 指标在
+        所有评价写入后通过一次评价目录扫描统一重算（逐条提交时每条评价都要
+        重新扫描全部评价）。
+
+        Args:
+            reviews: 评价列表，每项包含 scenario_id、skill_id、user_id、rating、
+                     metrics，可选 comment
+
+        Returns:
+            创建的评价数据列表（与输入顺序一致）
+        """
+        created, _, _ = self._apply_reviews(reviews)
+        return created
+
+    def submit_reviews_with_leaderboards(self, reviews: List[Dict]) -> Dict[str, Dict]:
+        """
+        批量提交评价，并直接用内存中的结果生成相关场景的排行榜
+
+        等价于 bulk_submit_reviews 之后对每个涉及的场景调用
+        generate_leaderboard，但复用提交过程中已更新的场景和 Skill 数据，
+        不再逐个场景重新读取 Skill 文件。
+
+        Args:
+            reviews: 评价列表，格式同 bulk_submit_reviews
+
+        Returns:
+            排行榜数据，按 scenario_id 索引
+        """
+        _, scenarios, skills = self._apply_reviews(reviews)
+
+        leaderboards = {}
+        for scenario_id, scenario in scenarios.items():
+            # 场景中未被本批评价涉及的 Skill 仍需从文件读取
+            for skill_id in scenario["registered_skills"]:
+                if skill_id not in skills:
+                    skill = self.load_skill(skill_id)
+                    if skill:
+                        skills[skill_id] = skill
+
+            leaderboard = self.build_leaderboard(scenario, skills)
+            self._save_leaderboard(leaderboard)
+            leaderboards[scenario_id] = leaderboard
+
+        return leaderboards
+
+    def _apply_reviews(self, reviews: List[Dict]) -> Tuple[List[Dict], Dict[str, Dict], Dict[str, Dict]]:
+        """
+        写入一批评价并更新相关场景和 Skill
+
+        Returns:
+            (创建的评价列表, 更新后的场景, 更新后的 Skill)，后两者按 ID 索引
+        """
+        scenarios: Dict[str, Dict] = {}
+        skills: Dict[str, Dict] = {}
+        created = []
+
+        # 先全部校验，避免写入一半后失败
+        for r in reviews:
+            scenario = self._load_cached(scenarios, r["scenario_id"], self.load_scenario, "Scenario")
+            self._load_cached(skills, r["skill_id"], self.load_skill, "Skill")
+
+            if r["skill_id"] not in scenario["registered_skills"]:
+                raise ValueError(f"Skill {r['skill_id']} not registered in scenario {r['scenario_id']}")
+
+            if not (1 <= r["rating"] <= 5):
+                raise ValueError("Rating must be between 1 and 5")
+
+        now = datetime.now().isoformat()
+        for r in reviews:
+            review = self._new_review(
+                r["scenario_id"], r["skill_id"], r["user_id"],
+                r["rating"], r["metrics"], r.get("comment", "")
+            )
+            self._save_review(review["review_id"], review)
+            created.append(review)
+
+            scenario = scenarios[r["scenario_id"]]
+            scenario["metrics"]["total_reviews"] += 1
+            scenario["updated_at"] = now
+
+        for scenario_id, scenario in scenarios.items():
+            self._save_scenario(scenario_id, scenario)
+
+        # 一次扫描收集所有相关 Skill 的评价（包含已有评价）
+        reviews_by_skill: Dict[str, List[Dict]] = {skill_id: [] for skill_id in skills}
+        for review_file in self.reviews_dir.glob("review-*.json"):
+            with open(review_file, 'r', encoding='utf-8') as f:
+                review = json.load(f)
+            if review["skill_id"] in reviews_by_skill:
+                reviews_by_skill[review["skill_id"]].append(review)
+
+        for skill_id, skill in skills.items():
+            skill["metrics"] = self._compute_skill_metrics(reviews_by_skill[skill_id])
+            skill["updated_at"] = now
+            self._save_skill(skill_id, skill)
+
+        print(f"✓ Submitted {len(created)} reviews")
+
+        return created, scenarios, skills
+
+    @staticmethod
+    def _load_cached(cache: Dict[str, Dict], item_id: str, loader, kind: str) -> Dict:
+        """从缓存读取，未命中时加载，不存在则抛出 ValueError"""
+        item = cache.get(item_id)
+        if item is None:
+            item = loader(item_id)
+            if not item:
+                raise ValueError(f"{kind} {item_id} not found")
+            cache[item_id] = item
+        return item
+
+    def _new_scenario(self, title: str, description: str, category: str) -> Dict:
+        """构造场景数据（不保存）"""
+        now = datetime.now().isoformat()
+        return {
+            "scenario_id": f"scenario-{uuid.uuid4().hex[:12]}",
+            "title": title,
+            "description": description,
+            "category": category,
+            "created_at": now,
+            "updated_at": now,
+            "status": "active",
+            "registered_skills": [],  # 注册的 Skills 列表
+            "metrics": {
+                "total_reviews": 0,
+                "total_skills": 0,
+                "avg_rating": 0.0
+            }
+        }
+
+    def _new_skill(self, skill_name: str, description: str, author: str) -> Dict:
+        """构造 Skill 数据（不保存）"""
+        return {
+            "skill_id": f"skill-{uuid.uuid4().hex[:12]}",
+            "skill_name": skill_name,
+            "description": description,
+            "author": author,
+            "registered_at": datetime.now().isoformat(),
+            "metrics": {
+                "total_reviews": 0,
+                "avg_rating": 0.0,
+                "avg_accuracy": 0.0,
+                "avg_efficiency": 0.0,
+                "avg_creativity": 0.0
+            },
+            "categories": []  # 参与的场景分类
+        }
+
+    def _new_review(
+        self,
+        scenario_id: str,
+        skill_id: str,
+        user_id: str,
+        rating: float,
+        metrics: Dict[str, float],
+        comment: str
+    ) -> Dict:
+        """构造评价数据（不保存）"""
+        return {
+            "review_id": f"review-{uuid.uuid4().hex[:12]}",
+            "scenario_id": scenario_id,
+            "skill_id": skill_id,
+            "user_id": user_id,
+            "rating": rating,
+            "metrics": {
+                "accuracy": metrics.get("accuracy", 0.0),
+                "efficiency": metrics.get("efficiency", 0.0),
+                "creativity": metrics.get("creativity", 0.0)
+            },
+            "comment": comment,
+            "created_at": datetime.now().isoformat(),
+            "helpful_count": 0,  # 有用投票
+            "flagged": False  # 是否被标记
+        }
 
     def load_scenario(self, scenario_id: str) -> Optional[Dict]:
         """加载场景"""
@@ -360,6 +673,40 @@ class ArenaManager:
         with open(scenario_path, 'r', encoding='utf-8') as f:
             return json.load(f)
 
+    def get_scenario(self, scenario_id: str) -> Optional[Dict]:
+        """
+        读取场景（只读，供查询接口使用）
+
+        与 load_scenario 相同，但按 (mtime, size) 复用已解析的内容；
+        返回的是缓存中的共享对象，调用方不得修改。需要修改后保存时用 load_scenario。
+        """
+        return self._read_json_cached(self.scenarios_dir / f"{scenario_id}.json")
+
+    def _read_json_cached(self, path: Path) -> Optional[Dict]:
+        """
+        读取单个 JSON 文件，与 _list_json 共用按 (mtime, size) 校验的缓存
+
+        Args:
+            path: JSON 文件路径
+
+        Returns:
+            解析后的数据（共享对象，只应读取）；文件不存在时返回 None
+        """
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+
+        key = (st.st_mtime_ns, st.st_size)
+        cache = self._json_cache.setdefault(path.parent, {})
+        cached = cache.get(str(path))
+        if cached is None or cached[0] != key:
+            with open(path, 'r', encoding='utf-8') as f:
+                cached = (key, json.load(f))
+            cache[str(path)] = cached
+
+        return cached[1]
+
     def load_skill(self, skill_id: str) -> Optional[Dict]:
         """加载 Skill"""
         skill_path = self.skills_dir / f"{skill_id}.json"
@@ -388,19 +735,76 @@ class ArenaManager:
 
     def list_scenarios(self) -> List[Dict]:
         """列出所有场景"""
-        scenarios = []
-        for scenario_file in self.scenarios_dir.glob("scenario-*.json"):
-            with open(scenario_file, 'r', encoding='utf-8') as f:
-                scenarios.append(json.load(f))
-        return scenarios
+        return self._list_json(self.scenarios_dir, "scenario-")
 
     def list_skills(self) -> List[Dict]:
         """列出所有 Skills"""
-        skills = []
-        for skill_file in self.skills_dir.glob("skill-*.json"):
-            with open(skill_file, 'r', encoding='utf-8') as f:
-                skills.append(json.load(f))
-        return skills
+        return self._list_json(self.skills_dir, "skill-")
+
+    def _list_json(self, directory: Path, prefix: str) -> List[Dict]:
+        """
+        读取目录下所有 <prefix>*.json 文件
+
+        用 os.scandir 单次遍历目录，并按 (mtime, size) 缓存已解析的内容，
+        未修改的文件不再重复读取和解析。返回的数据是缓存中的共享对象，
+        调用方只应读取。
+
+        Args:
+            directory: 数据目录
+            prefix: 文件名前缀
+
+        Returns:
+            解析后的数据列表
+        """
+        cache = self._json_cache.get(directory, {})
+        fresh = {}
+        items = []
+
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not (entry.name.startswith(prefix) and entry.name.endswith(".json")):
+                    continue
+
+                st = entry.stat()
+                key = (st.st_mtime_ns, st.st_size)
+                cached = cache.get(entry.path)
+                if cached is None or cached[0] != key:
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        cached = (key, json.load(f))
+
+                fresh[entry.path] = cached
+                items.append(cached[1])
+
+        # 只保留仍然存在的文件
+        self._json_cache[directory] = fresh
+        return items
+
+    def get_arena_overview(self, top_n: int = 3) -> Dict:
+        """
+        获取擂台概览：所有场景、所有 Skills 以及每个场景的排行榜前 N 名
+
+        场景和 Skills 各只扫描一次，排行榜直接由内存数据构建，不写入文件。
+
+        Args:
+            top_n: 每个场景返回的排行榜条目数
+
+        Returns:
+            {"scenarios": [...], "skills": [...], "leaderboards": {scenario_id: [...]}}
+        """
+        scenarios = self.list_scenarios()
+        skills = self.list_skills()
+        skills_by_id = {skill["skill_id"]: skill for skill in skills}
+
+        leaderboards = {
+            scenario["scenario_id"]: self.build_leaderboard(scenario, skills_by_id)["leaderboard"][:top_n]
+            for scenario in scenarios
+        }
+
+        return {
+            "scenarios": scenarios,
+            "skills": skills,
+            "leaderboards": leaderboards
+        }
 
     def get_scenario_reviews(self, scenario_id: str, skill_id: str = None) -> List[Dict]:
         """
@@ -411,15 +815,14 @@ class ArenaManager:
             skill_id: 可选，筛选特定 Skill
 
         Returns:
-            评价列表
+            评价列表（元素是 _list_json 缓存中的共享对象，只应读取）
         """
-        reviews = []
-        for review_file in self.reviews_dir.glob("review-*.json"):
-            with open(review_file, 'r', encoding='utf-8') as f:
-                review = json.load(f)
-                if review["scenario_id"] == scenario_id:
-                    if skill_id is None or review["skill_id"] == skill_id:
-                        reviews.append(review)
+        # 未修改的评价文件直接复用已解析的内容，不再逐个重新读取
+        reviews = [
+            review for review in self._list_json(self.reviews_dir, "review-")
+            if review["scenario_id"] == scenario_id
+            and (skill_id is None or review["skill_id"] == skill_id)
+        ]
         # 按时间倒序
         reviews.sort(key=lambda x: x["created_at"], reverse=True)
         return reviews
@@ -4,6 +4,7 @@
 -- Description: Complete schema for social features including agents, skills, comments, votes, downloads, following, and communities
 
 -- Drop existing tables if they exist (for clean reinitialization)
+DROP MATERIALIZED VIEW IF EXISTS hot_feed_mv;
 DROP TABLE IF EXISTS votes CASCADE;
 DROP TABLE IF EXISTS comments CASCADE;
 DROP TABLE IF EXISTS downloads CASCADE;
@@ -78,6 +79,7 @@ CREATE TABLE skills (
     vote_score INTEGER DEFAULT 0,           -- upvotes - downvotes
 
     -- Hot algorithm (Reddit-style)
+    order_component DOUBLE PRECISION DEFAULT 0,  -- log10(max(|vote_score|, 1)), maintained by trigger
     hot_score NUMERIC(15, 6),               -- Hot score for feed ranking
     controversy NUMERIC(5, 4),              -- 0-1 controversy score
 
@@ -246,8 +248,9 @@ CREATE TABLE votes (
     voted_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
 
-    -- Ensure one vote per agent per target (UNIQUE constraint)
-    UNIQUE(agent_id, target_type, target_id)
+    -- Ensure one vote per agent per target (UNIQUE constraint); vote_type is
+    -- carried in the index so existing-vote lookups can be index-only scans
+    UNIQUE(agent_id, target_type, target_id) INCLUDE (vote_type)
 );
 
 -- Indexes for votes
@@ -397,6 +400,20 @@ CREATE TRIGGER update_votes_updated_at BEFORE UPDATE ON votes
 CREATE TRIGGER update_communities_updated_at BEFORE UPDATE ON communities
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
+-- Function to keep the vote part of the hot score in sync with vote counts.
+-- Votes only pay for this O(1) log; the age part is applied by the periodic
+-- hot score sweep (FeedAlgorithm.update_hot_scores).
+CREATE OR REPLACE FUNCTION update_order_component_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.order_component = LOG(GREATEST(ABS(COALESCE(NEW.upvotes, 0) - COALESCE(NEW.downvotes, 0)), 1));
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER update_skills_order_component BEFORE INSERT OR UPDATE OF upvotes, downvotes ON skills
+    FOR EACH ROW EXECUTE FUNCTION update_order_component_column();
+
 -- ============================================================================
 -- FUNCTIONS (Utility functions for social features)
 -- ============================================================================
@@ -518,6 +535,39 @@ LEFT JOIN following f1 ON f1.followee_id = a.agent_id
 LEFT JOIN following f2 ON f2.follower_id = a.agent_id
 GROUP BY a.agent_id, a.username, a.karma;
 
+-- Materialized view: Top of the hot feed, pre-joined with uploader info.
+-- Refreshed (CONCURRENTLY, which needs the unique index) by the same job that
+-- runs FeedAlgorithm.update_hot_scores().
+CREATE MATERIALIZED VIEW hot_feed_mv AS
+SELECT
+    s.skill_id,
+    s.skill_name,
+    s.description,
+    s.upvotes,
+    s.downvotes,
+    s.vote_score,
+    s.hot_score,
+    s.created_at,
+    s.community,
+    s.categories,
+    s.visibility,
+    s.rating,
+    s.usage_count,
+    s.comments_count,
+    s.views,
+    s.downloads_count,
+    a.username AS uploader_name,
+    a.display_name AS uploader_display_name,
+    a.agent_id AS uploader_id
+FROM skills s
+JOIN agents a ON s.agent_id = a.agent_id
+WHERE s.visibility = 'public'
+ORDER BY s.hot_score DESC
+LIMIT 1000;
+
+CREATE UNIQUE INDEX idx_hot_feed_mv_skill_id ON hot_feed_mv(skill_id);
+CREATE INDEX idx_hot_feed_mv_hot_score ON hot_feed_mv(hot_score DESC);
+
 -- ============================================================================
 -- SAMPLE DATA (Optional - for testing)
 -- ============================================================================
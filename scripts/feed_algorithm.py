@@ -5,10 +5,15 @@ This module implements the feed ranking algorithm used to display skills
 in various orders (hot, new, top) similar to Reddit's feed system.
 """
 import math
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Optional
 from scripts.database.db import db
 
+# Time-decay constant of the hot algorithm (hours per order of magnitude)
+GRAVITY = 1.8
+_INV_GRAVITY = 1.0 / GRAVITY
+_log10 = math.log10
+
 
 class FeedAlgorithm:
     """
@@ -18,13 +23,88 @@ class FeedAlgorithm:
     where score = upvotes - downvotes and gravity = 1.8
     """
 
-    GRAVITY = 1.8
+    GRAVITY = GRAVITY
+
+    # sort_by option -> ORDER BY clause
+    SORT_ORDER_BY = {
+        'hot': "hot_score DESC",
+        'new': "created_at DESC",
+        'top': "vote_score DESC",
+    }
+
+    # Number of rows kept in the hot_feed_mv materialized view
+    HOT_FEED_VIEW_SIZE = 1000
+
+    HOT_FEED_VIEW_QUERY = """
+        SELECT *
+        FROM hot_feed_mv
+        ORDER BY hot_score DESC
+        LIMIT $1 OFFSET $2
+    """
+
+    def __init__(self, use_hot_feed_view: bool = False):
+        """
+        Initialize the feed algorithm.
+
+        Builds the text of every feed query variant (sort option x with/without
+        community filter) once. Reusing identical statement text lets asyncpg's
+        per-connection statement cache (statement_cache_size, default 100)
+        skip the server-side parse/plan on every call after the first.
 
-    def __init__(self):
-        """Initialize the feed algorithm."""
-        pass
+        Args:
+            use_hot_feed_view: Serve unfiltered 'hot' pages from the
+                hot_feed_mv materialized view instead of the live join. The
+                view is only as fresh as the last update_hot_scores() call, so
+                enable this only when that sweep runs periodically.
+        """
+        self.use_hot_feed_view = use_hot_feed_view
+        self._feed_queries = {
+            (sort_by, has_community): self._build_feed_query(order_by, has_community)
+            for sort_by, order_by in self.SORT_ORDER_BY.items()
+            for has_community in (False, True)
+        }
+
+    @staticmethod
+    def _build_feed_query(order_by: str, has_community: bool) -> str:
+        """Build the feed query text for one sort/filter combination."""
+        community_filter = "AND s.community = $3" if has_community else ""
+
+        return f"""
+            SELECT
+                s.skill_id,
+                s.skill_name,
+                s.description,
+                s.upvotes,
+                s.downvotes,
+                s.vote_score,
+                s.hot_score,
+                s.created_at,
+                s.community,
+                s.categories,
+                s.visibility,
+                s.rating,
+                s.usage_count,
+                s.comments_count,
+                s.views,
+                s.downloads_count,
+                a.username AS uploader_name,
+                a.display_name AS uploader_display_name,
+                a.agent_id AS uploader_id
+            FROM skills s
+            JOIN agents a ON s.agent_id = a.agent_id
+            WHERE s.visibility = 'public'
+            {community_filter}
+            ORDER BY {order_by}
+            LIMIT $1 OFFSET $2
+        """
 
-    def calculate_hot_score(self, upvotes: int, downvotes: int, created_at: datetime) -> float:
+    def calculate_hot_score(
+        self,
+        upvotes: int,
+        downvotes: int,
+        created_at: datetime,
+        now: Optional[datetime] = None
+    ) -> float:
         """
         Calculate the hot score for a skill using Reddit's algorithm.
 
@@ -41,6 +121,10 @@ class FeedAlgorithm:
             upvotes: Number of upvotes
             downvotes: Number of downvotes
             created_at: Timestamp when the skill was created
+            now: Reference time for the age term. Pass one value when scoring
+                many skills so they share a time basis, like SQL now() does
+                within a transaction. Defaults to the current time in
+                created_at's timezone, so aware database timestamps work too.
 
         Returns:
             float: The calculated hot score rounded to 4 decimal places
@@ -50,13 +134,15 @@ class FeedAlgorithm:
 
         # Calculate the order (logarithmic scale for vote score)
         # Using max(abs(score), 1) to avoid log(0) and handle negative scores
-        order = math.log(max(abs(score), 1), 10)
+        order = _log10(max(abs(score), 1))
 
         # Calculate the age in hours
-        age = (datetime.now() - created_at).total_seconds() / 3600
+        if now is None:
+            now = datetime.now(created_at.tzinfo)
+        age = (now - created_at).total_seconds() / 3600
 
         # Calculate hot score with time decay
-        hot = order + (age / self.GRAVITY)
+        hot = order + age * _INV_GRAVITY
 
         return round(hot, 4)
 
@@ -64,39 +150,31 @@ class FeedAlgorithm:
         """
         Batch update all skills' hot scores in the database.
 
-        This should be called periodically (e.g., every few minutes)
+        This should be called periodically (e.g., every minute)
         to keep hot scores current as skills age and receive votes.
 
+        The vote part of the formula (order_component) is maintained by a
+        trigger whenever upvotes/downvotes change, so the sweep only has to
+        add the age term. Everything runs as a single UPDATE statement,
+        followed by a concurrent refresh of the hot_feed_mv materialized view
+        so readers are never blocked while it rebuilds.
+
         Returns:
             dict with 'updated' count of skills processed
         """
         async with db.get_connection() as conn:
-            # Fetch all skills with their vote counts and creation time
-            rows = await conn.fetch("""
-                SELECT skill_id, upvotes, downvotes, created_at
-                FROM skills
+            # age_hours / GRAVITY == age_seconds / (3600 * 1.8) == age_seconds / 6480
+            status = await conn.execute("""
+                UPDATE skills
+                SET hot_score = order_component
+                    + EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - created_at)) / 6480.0
                 WHERE visibility = 'public'
             """)
 
-            updated_count = 0
-
-            # Update each skill's hot score
-            for row in rows:
-                hot_score = self.calculate_hot_score(
-                    upvotes=row['upvotes'],
-                    downvotes=row['downvotes'],
-                    created_at=row['created_at']
-                )
-
-                await conn.execute("""
-                    UPDATE skills
-                    SET hot_score = $1
-                    WHERE skill_id = $2
-                """, hot_score, row['skill_id'])
+            await conn.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY hot_feed_mv")
 
-                updated_count += 1
-
-            return {'updated': updated_count}
+            # asyncpg returns the command tag, e.g. "UPDATE 42"
+            return {'updated': int(status.split()[-1])}
 
     async def get_feed(
         self,
@@ -124,64 +202,32 @@ class FeedAlgorithm:
             ValueError: If sort_by is not one of 'hot', 'new', 'top'
         """
         # Validate sort_by parameter
-        valid_sort_options = ['hot', 'new', 'top']
-        if sort_by not in valid_sort_options:
+        if sort_by not in self.SORT_ORDER_BY:
             raise ValueError(
-                f"Invalid sort_by '{sort_by}'. Must be one of: {', '.join(valid_sort_options)}"
+                f"Invalid sort_by '{sort_by}'. Must be one of: {', '.join(self.SORT_ORDER_BY)}"
             )
 
-        # Determine sort column and direction
-        if sort_by == 'hot':
-            order_by = "hot_score DESC"
-        elif sort_by == 'new':
-            order_by = "created_at DESC"
-        elif sort_by == 'top':
-            order_by = "vote_score DESC"
-
-        # Build the query with community filter if provided
-        community_filter = ""
         params = [limit, offset]
 
+        # The materialized view only holds the unfiltered top of the hot feed
+        if (
+            self.use_hot_feed_view
+            and sort_by == 'hot'
+            and not community
+            and offset + limit <= self.HOT_FEED_VIEW_SIZE
+        ):
+            query = self.HOT_FEED_VIEW_QUERY
+        else:
+            query = self._feed_queries[(sort_by, bool(community))]
+
         if community:
-            community_filter = "AND s.community = $3"
-            params.insert(0, community)
+            params.append(community)
 
         async with db.get_connection() as conn:
-            query = f"""
-                SELECT
-                    s.skill_id,
-                    s.skill_name,
-                    s.description,
-                    s.upvotes,
-                    s.downvotes,
-                    s.vote_score,
-                    s.hot_score,
-                    s.created_at,
-                    s.community,
-                    s.categories,
-                    s.visibility,
-                    s.rating,
-                    s.usage_count,
-                    s.comments_count,
-                    s.views,
-                    s.downloads_count,
-                    a.username AS uploader_name,
-                    a.display_name AS uploader_display_name,
-                    a.agent_id AS uploader_id
-                FROM skills s
-                JOIN agents a ON s.agent_id = a.agent_id
-                WHERE s.visibility = 'public'
-                {community_filter}
-                ORDER BY {order_by}
-                LIMIT $1 OFFSET $2
-            """
-
             rows = await conn.fetch(query, *params)
 
-            # Convert to list of dictionaries
-            feed = [dict(row) for row in rows]
-
-            return feed
+        # Convert to list of dictionaries (map keeps the loop in C)
+        return list(map(dict, rows))
 
 
 # Singleton instance
@@ -0,0 +1,47 @@
+"""
+Skills Arena 生产级服务器 gunicorn 配置
+
+用法（在 scripts 目录下）：
+    gunicorn -c gunicorn.conf.py production_web_server:app
+
+上传可能持续较长时间，使用协程 worker（gevent）让慢速上传不阻塞其他请求；
+未安装 gevent 时退回到多线程 worker。
+"""
+
+import importlib.util
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+workers = int(os.getenv('WEB_CONCURRENCY', (os.cpu_count() or 1) * 2 + 1))
+
+# 在 master 中导入应用后再 fork：模块代码、预渲染的页面和样式表等只读数据
+# 以写时复制方式在 worker 间共享。代价是修改代码后需要完整重启（HUP 不会重新导入）
+preload_app = True
+
+if importlib.util.find_spec('gevent') is not None:
+    # 预加载时应用在 master 中导入，必须在此之前打补丁，
+    # 否则应用导入的 threading/queue 等模块不会被协程化
+    from gevent import monkey
+    monkey.patch_all()
+
+    worker_class = 'gevent'
+    worker_connections = 1000
+    # 事件流（/api/events）只占一个协程，上限只需给普通请求留出连接数
+    event_max_subscribers = worker_connections // 2
+else:
+    worker_class = 'gthread'
+    threads = 8
+    # 每个事件流占用一个线程，最多用掉一半线程
+    event_max_subscribers = threads // 2
+
+# 应用在 master 中预加载，此处设置的环境变量在导入应用时生效；显式设置的值优先
+os.environ.setdefault('EVENT_MAX_SUBSCRIBERS', str(event_max_subscribers))
+
+# 50MB 上传在慢速网络下需要较长时间
+timeout = 120
+keepalive = 5
+
+# 定期重启 worker，防止内存缓慢增长
+max_requests = 1000
+max_requests_jitter = 50
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+启动时预先压缩的静态内容
+
+供 Web 服务器共用：主页、样式表等不随请求变化的内容在导入时压缩一次，
+每个请求按 Accept-Encoding 直接返回对应的字节。
+"""
+
+import gzip
+import hashlib
+
+from flask import Response, request
+
+try:
+    import brotli
+except ImportError:  # 可选依赖：未安装时只提供 gzip
+    brotli = None
+
+
+class PrecompressedBody:
+    """
+    预先压缩好的响应内容
+
+    Attributes:
+        body: 原始字节
+        body_gz: gzip 压缩后的字节
+        body_br: brotli 压缩后的字节（未安装 brotli 时为 None）
+        content_type: Content-Type
+        etag: 原始内容的 MD5 十六进制摘要
+    """
+
+    def __init__(self, body: bytes, content_type: str):
+        self.body = body
+        self.body_gz = gzip.compress(body, compresslevel=9)
+        self.body_br = brotli.compress(body, quality=11) if brotli else None
+        self.content_type = content_type
+        self.etag = hashlib.md5(body).hexdigest()
+
+    def response(self) -> Response:
+        """按当前请求的 Accept-Encoding 返回预先压缩好的内容（优先 brotli，其次 gzip）"""
+        if self.body_br is not None and 'br' in request.accept_encodings:
+            response = Response(self.body_br, content_type=self.content_type)
+            response.headers['Content-Encoding'] = 'br'
+        elif 'gzip' in request.accept_encodings:
+            response = Response(self.body_gz, content_type=self.content_type)
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = Response(self.body, content_type=self.content_type)
+
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
@@ -5,30 +5,498 @@
 包含完整的 Skill 上传、验证、展示和管理功能
 """
 
-from flask import Flask, jsonify, request, render_template_string, send_file
+from flask import Flask, Request, Response, abort, jsonify, request
+import orjson
+import hashlib
 import json
 import os
+import queue
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import tempfile
 import shutil
+import zipfile
 
 # 导入管理器
 sys.path.insert(0, str(Path(__file__).parent))
 from arena_manager import ArenaManager
 from skill_validator import SkillValidator
 from skill_uploader import SkillUploader
+from json_provider import OrjsonProvider
+from precompressed import PrecompressedBody
+
+# 上传文件分块写盘的块大小（无法在内核中直接复制时使用）
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class DiskBufferedRequest(Request):
+    """
+    上传文件直接缓冲到磁盘临时文件的请求类
+
+    Werkzeug 默认对每个文件先在内存中缓冲 500KB 再落盘，上传整个 Skill
+    目录时会把大量文件同时留在内存里。这里让 multipart 解析器始终写入
+    磁盘临时文件，每个 worker 的内存占用与上传大小无关。
+    """
+
+    def _get_file_stream(self, total_content_length, content_type,
+                         filename=None, content_length=None):
+        return tempfile.TemporaryFile('wb+')
+
 
 app = Flask(__name__)
-app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB 最大上传
+app.json = OrjsonProvider(app)
+app.request_class = DiskBufferedRequest
+app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB 最大上传（硬上限）
 
 # 初始化管理器
+# gunicorn 预加载（preload_app）时本模块在 master 中导入一次，worker 通过写时复制共享。
+# 导入时只创建只读数据和空缓存，缓存在各 worker 首次写入时才分配私有内存
 data_dir = Path(__file__).parent.parent / "data"
 manager = ArenaManager(data_dir=str(data_dir))
 uploader = SkillUploader(upload_dir=str(data_dir / "uploads"), 
                          skills_dir=str(data_dir / "skills"))
 
+# 生产级样式表（独立文件名带内容哈希，可被浏览器/CDN 长期缓存）
+PRODUCTION_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+    background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
+    min-height: 100vh;
+    color: #eee;
+}
+
+.container {
+    max-width: 1400px;
+    margin: 0 auto;
+    padding: 20px;
+}
+
+/* 导航栏 */
+.navbar {
+    background: rgba(0, 0, 0, 0.3);
+    backdrop-filter: blur(10px);
+    padding: 20px 0;
+    margin-bottom: 30px;
+    border-bottom: 1px solid rgba(255, 255, 255, 0.1);
+}
+
+.navbar-content {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+
+.logo {
+    font-size: 24px;
+    font-weight: bold;
+    background: linear-gradient(90deg, #667eea, #764ba2);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+}
+
+.nav-tabs {
+    display: flex;
+    gap: 10px;
+}
+
+.nav-tab {
+    padding: 10px 20px;
+    background: rgba(255, 255, 255, 0.1);
+    border: none;
+    color: #fff;
+    cursor: pointer;
+    border-radius: 8px;
+    transition: all 0.3s;
+}
+
+.nav-tab:hover {
+    background: rgba(255, 255, 255, 0.2);
+}
+
+.nav-tab.active {
+    background: linear-gradient(90deg, #667eea, #764ba2);
+}
+
+/* 标签页内容 */
+.tab-content {
+    display: none;
+}
+
+.tab-content.active {
+    display: block;
+}
+
+/* 卡片样式 */
+.card {
+    background: rgba(255, 255, 255, 0.05);
+    backdrop-filter: blur(10px);
+    border-radius: 16px;
+    padding: 30px;
+    margin-bottom: 20px;
+    border: 1px solid rgba(255, 255, 255, 0.1);
+}
+
+.card-header {
+    margin-bottom: 20px;
+    padding-bottom: 15px;
+    border-bottom: 1px solid rgba(255, 255, 255, 0.1);
+}
+
+.card-title {
+    font-size: 24px;
+    font-weight: bold;
+    margin-bottom: 10px;
+}
+
+.card-subtitle {
+    color: #aaa;
+    font-size: 14px;
+}
+
+/* 上传区域 */
+.upload-zone {
+    border: 2px dashed rgba(255, 255, 255, 0.3);
+    border-radius: 12px;
+    padding: 60px;
+    text-align: center;
+    cursor: pointer;
+    transition: all 0.3s;
+}
+
+.upload-zone:hover {
+    border-color: #667eea;
+    background: rgba(102, 126, 234, 0.1);
+}
+
+.upload-zone.dragover {
+    border-color: #667eea;
+    background: rgba(102, 126, 234, 0.2);
+}
+
+.upload-icon {
+    font-size: 48px;
+    margin-bottom: 20px;
+}
+
+.upload-text {
+    font-size: 18px;
+    margin-bottom: 10px;
+}
+
+.upload-hint {
+    color: #888;
+    font-size: 14px;
+}
+
+/* 表单元素 */
+.form-group {
+    margin-bottom: 20px;
+}
+
+.form-label {
+    display: block;
+    margin-bottom: 8px;
+    font-weight: 500;
+}
+
+.form-input {
+    width: 100%;
+    padding: 12px 16px;
+    background: rgba(255, 255, 255, 0.1);
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    border-radius: 8px;
+    color: #fff;
+    font-size: 14px;
+}
+
+.form-input:focus {
+    outline: none;
+    border-color: #667eea;
+}
+
+.btn {
+    padding: 12px 24px;
+    border: none;
+    border-radius: 8px;
+    cursor: pointer;
+    font-size: 14px;
+    font-weight: 500;
+    transition: all 0.3s;
+}
+
+.btn-primary {
+    background: linear-gradient(90deg, #667eea, #764ba2);
+    color: #fff;
+}
+
+.btn-primary:hover {
+    opacity: 0.9;
+    transform: translateY(-2px);
+}
+
+.btn-secondary {
+    background: rgba(255, 255, 255, 0.1);
+    color: #fff;
+}
+
+.btn-secondary:hover {
+    background: rgba(255, 255, 255, 0.2);
+}
+
+/* 验证结果 */
+.validation-result {
+    margin-top: 20px;
+    padding: 20px;
+    border-radius: 12px;
+    display: none;
+}
+
+.validation-result.show {
+    display: block;
+}
+
+.validation-result.success {
+    background: rgba(76, 175, 80, 0.2);
+    border: 1px solid rgba(76, 175, 80, 0.5);
+}
+
+.validation-result.error {
+    background: rgba(244, 67, 54, 0.2);
+    border: 1px solid rgba(244, 67, 54, 0.5);
+}
+
+.validation-result.warning {
+    background: rgba(255, 193, 7, 0.2);
+    border: 1px solid rgba(255, 193, 7, 0.5);
+}
+
+.score-display {
+    font-size: 48px;
+    font-weight: bold;
+    margin-bottom: 10px;
+}
+
+.score-excellent {
+    color: #4caf50;
+}
+
+.score-good {
+    color: #2196f3;
+}
+
+.score-acceptable {
+    color: #ff9800;
+}
+
+.score-rejected {
+    color: #f44336;
+}
+
+/* 问题列表 */
+.issue-list {
+    margin-top: 15px;
+}
+
+.issue-item {
+    padding: 12px;
+    background: rgba(0, 0, 0, 0.2);
+    border-radius: 8px;
+    margin-bottom: 10px;
+}
+
+.issue-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 8px;
+}
+
+.issue-type {
+    font-weight: bold;
+}
+
+.issue-severity {
+    padding: 4px 8px;
+    border-radius: 4px;
+    font-size: 12px;
+    font-weight: bold;
+}
+
+.issue-severity.critical {
+    background: rgba(244, 67, 54, 0.3);
+    color: #f44336;
+}
+
+.issue-severity.high {
+    background: rgba(255, 152, 0, 0.3);
+    color: #ff9800;
+}
+
+.issue-severity.medium {
+    background: rgba(255, 193, 7, 0.3);
+    color: #ffc107;
+}
+
+.issue-severity.low {
+    background: rgba(76, 175, 80, 0.3);
+    color: #4caf50;
+}
+
+.issue-description {
+    color: #aaa;
+    font-size: 14px;
+}
+
+/* 技能列表 */
+.skill-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
+    gap: 20px;
+}
+
+.skill-card {
+    background: rgba(255, 255, 255, 0.05);
+    border: 1px solid rgba(255, 255, 255, 0.1);
+    border-radius: 12px;
+    padding: 20px;
+    transition: all 0.3s;
+}
+
+.skill-card:hover {
+    transform: translateY(-5px);
+    border-color: #667eea;
+}
+
+.skill-name {
+    font-size: 18px;
+    font-weight: bold;
+    margin-bottom: 10px;
+}
+
+.skill-meta {
+    color: #888;
+    font-size: 13px;
+    margin-bottom: 15px;
+}
+
+.skill-score {
+    display: flex;
+    align-items: center;
+    gap: 10px;
+    margin-bottom: 15px;
+}
+
+.score-badge {
+    padding: 6px 12px;
+    border-radius: 6px;
+    font-weight: bold;
+    font-size: 14px;
+}
+
+.score-badge.excellent {
+    background: rgba(76, 175, 80, 0.3);
+    color: #4caf50;
+}
+
+.score-badge.good {
+    background: rgba(33, 150, 243, 0.3);
+    color: #2196f3;
+}
+
+.score-badge.acceptable {
+    background: rgba(255, 152, 0, 0.3);
+    color: #ff9800;
+}
+
+.score-badge.rejected {
+    background: rgba(244, 67, 54, 0.3);
+    color: #f44336;
+}
+
+/* 统计数据 */
+.stats-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 20px;
+    margin-bottom: 30px;
+}
+
+.stat-card {
+    background: rgba(255, 255, 255, 0.05);
+    padding: 20px;
+    border-radius: 12px;
+    text-align: center;
+}
+
+.stat-value {
+    font-size: 36px;
+    font-weight: bold;
+    background: linear-gradient(90deg, #667eea, #764ba2);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+}
+
+.stat-label {
+    color: #888;
+    font-size: 14px;
+    margin-top: 5px;
+}
+
+/* 加载动画 */
+.loading {
+    display: flex;
+    justify-content: center;
+    align-items: center;
+    padding: 40px;
+}
+
+.spinner {
+    border: 3px solid rgba(255, 255, 255, 0.1);
+    border-top-color: #667eea;
+    border-radius: 50%;
+    width: 40px;
+    height: 40px;
+    animation: spin 1s linear infinite;
+}
+
+@keyframes spin {
+    to { transform: rotate(360deg); }
+}
+
+/* 进度条 */
+.progress-bar {
+    width: 100%;
+    height: 8px;
+    background: rgba(255, 255, 255, 0.1);
+    border-radius: 4px;
+    overflow: hidden;
+    margin-bottom: 10px;
+}
+
+.progress-fill {
+    height: 100%;
+    background: linear-gradient(90deg, #667eea, #764ba2);
+    transition: width 0.3s;
+}
+
+.progress-text {
+    text-align: center;
+    color: #888;
+    font-size: 13px;
+}
+"""
+
 # 生产级 HTML 模板
 PRODUCTION_TEMPLATE = """
 <!DOCTYPE html>
@@ -37,440 +505,7 @@ PRODUCTION_TEMPLATE = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Skills Arena - 生产级 Skills 上架平台</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-            min-height: 100vh;
-            color: #eee;
-        }
-
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-
-        /* 导航栏 */
-        .navbar {
-            background: rgba(0, 0, 0, 0.3);
-            backdrop-filter: blur(10px);
-            padding: 20px 0;
-            margin-bottom: 30px;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        }
-
-        .navbar-content {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-
-        .logo {
-            font-size: 24px;
-            font-weight: bold;
-            background: linear-gradient(90deg, #667eea, #764ba2);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-        }
-
-        .nav-tabs {
-            display: flex;
-            gap: 10px;
-        }
-
-        .nav-tab {
-            padding: 10px 20px;
-            background: rgba(255, 255, 255, 0.1);
-            border: none;
-            color: #fff;
-            cursor: pointer;
-            border-radius: 8px;
-            transition: all 0.3s;
-        }
-
-        .nav-tab:hover {
-            background: rgba(255, 255, 255, 0.2);
-        }
-
-        .nav-tab.active {
-            background: linear-gradient(90deg, #667eea, #764ba2);
-        }
-
-        /* 标签页内容 */
-        .tab-content {
-            display: none;
-        }
-
-        .tab-content.active {
-            display: block;
-        }
-
-        /* 卡片样式 */
-        .card {
-            background: rgba(255, 255, 255, 0.05);
-            backdrop-filter: blur(10px);
-            border-radius: 16px;
-            padding: 30px;
-            margin-bottom: 20px;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-        }
-
-        .card-header {
-            margin-bottom: 20px;
-            padding-bottom: 15px;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        }
-
-        .card-title {
-            font-size: 24px;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }
-
-        .card-subtitle {
-            color: #aaa;
-            font-size: 14px;
-        }
-
-        /* 上传区域 */
-        .upload-zone {
-            border: 2px dashed rgba(255, 255, 255, 0.3);
-            border-radius: 12px;
-            padding: 60px;
-            text-align: center;
-            cursor: pointer;
-            transition: all 0.3s;
-        }
-
-        .upload-zone:hover {
-            border-color: #667eea;
-            background: rgba(102, 126, 234, 0.1);
-        }
-
-        .upload-zone.dragover {
-            border-color: #667eea;
-            background: rgba(102, 126, 234, 0.2);
-        }
-
-        .upload-icon {
-            font-size: 48px;
-            margin-bottom: 20px;
-        }
-
-        .upload-text {
-            font-size: 18px;
-            margin-bottom: 10px;
-        }
-
-        .upload-hint {
-            color: #888;
-            font-size: 14px;
-        }
-
-        /* 表单元素 */
-        .form-group {
-            margin-bottom: 20px;
-        }
-
-        .form-label {
-            display: block;
-            margin-bottom: 8px;
-            font-weight: 500;
-        }
-
-        .form-input {
-            width: 100%;
-            padding: 12px 16px;
-            background: rgba(255, 255, 255, 0.1);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            border-radius: 8px;
-            color: #fff;
-            font-size: 14px;
-        }
-
-        .form-input:focus {
-            outline: none;
-            border-color: #667eea;
-        }
-
-        .btn {
-            padding: 12px 24px;
-            border: none;
-            border-radius: 8px;
-            cursor: pointer;
-            font-size: 14px;
-            font-weight: 500;
-            transition: all 0.3s;
-        }
-
-        .btn-primary {
-            background: linear-gradient(90deg, #667eea, #764ba2);
-            color: #fff;
-        }
-
-        .btn-primary:hover {
-            opacity: 0.9;
-            transform: translateY(-2px);
-        }
-
-        .btn-secondary {
-            background: rgba(255, 255, 255, 0.1);
-            color: #fff;
-        }
-
-        .btn-secondary:hover {
-            background: rgba(255, 255, 255, 0.2);
-        }
-
-        /* 验证结果 */
-        .validation-result {
-            margin-top: 20px;
-            padding: 20px;
-            border-radius: 12px;
-            display: none;
-        }
-
-        .validation-result.show {
-            display: block;
-        }
-
-        .validation-result.success {
-            background: rgba(76, 175, 80, 0.2);
-            border: 1px solid rgba(76, 175, 80, 0.5);
-        }
-
-        .validation-result.error {
-            background: rgba(244, 67, 54, 0.2);
-            border: 1px solid rgba(244, 67, 54, 0.5);
-        }
-
-        .validation-result.warning {
-            background: rgba(255, 193, 7, 0.2);
-            border: 1px solid rgba(255, 193, 7, 0.5);
-        }
-
-        .score-display {
-            font-size: 48px;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }
-
-        .score-excellent {
-            color: #4caf50;
-        }
-
-        .score-good {
-            color: #2196f3;
-        }
-
-        .score-acceptable {
-            color: #ff9800;
-        }
-
-        .score-rejected {
-            color: #f44336;
-        }
-
-        /* 问题列表 */
-        .issue-list {
-            margin-top: 15px;
-        }
-
-        .issue-item {
-            padding: 12px;
-            background: rgba(0, 0, 0, 0.2);
-            border-radius: 8px;
-            margin-bottom: 10px;
-        }
-
-        .issue-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 8px;
-        }
-
-        .issue-type {
-            font-weight: bold;
-        }
-
-        .issue-severity {
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-size: 12px;
-            font-weight: bold;
-        }
-
-        .issue-severity.critical {
-            background: rgba(244, 67, 54, 0.3);
-            color: #f44336;
-        }
-
-        .issue-severity.high {
-            background: rgba(255, 152, 0, 0.3);
-            color: #ff9800;
-        }
-
-        .issue-severity.medium {
-            background: rgba(255, 193, 7, 0.3);
-            color: #ffc107;
-        }
-
-        .issue-severity.low {
-            background: rgba(76, 175, 80, 0.3);
-            color: #4caf50;
-        }
-
-        .issue-description {
-            color: #aaa;
-            font-size: 14px;
-        }
-
-        /* 技能列表 */
-        .skill-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
-            gap: 20px;
-        }
-
-        .skill-card {
-            background: rgba(255, 255, 255, 0.05);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            border-radius: 12px;
-            padding: 20px;
-            transition: all 0.3s;
-        }
-
-        .skill-card:hover {
-            transform: translateY(-5px);
-            border-color: #667eea;
-        }
-
-        .skill-name {
-            font-size: 18px;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }
-
-        .skill-meta {
-            color: #888;
-            font-size: 13px;
-            margin-bottom: 15px;
-        }
-
-        .skill-score {
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            margin-bottom: 15px;
-        }
-
-        .score-badge {
-            padding: 6px 12px;
-            border-radius: 6px;
-            font-weight: bold;
-            font-size: 14px;
-        }
-
-        .score-badge.excellent {
-            background: rgba(76, 175, 80, 0.3);
-            color: #4caf50;
-        }
-
-        .score-badge.good {
-            background: rgba(33, 150, 243, 0.3);
-            color: #2196f3;
-        }
-
-        .score-badge.acceptable {
-            background: rgba(255, 152, 0, 0.3);
-            color: #ff9800;
-        }
-
-        .score-badge.rejected {
-            background: rgba(244, 67, 54, 0.3);
-            color: #f44336;
-        }
-
-        /* 统计数据 */
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }
-
-        .stat-card {
-            background: rgba(255, 255, 255, 0.05);
-            padding: 20px;
-            border-radius: 12px;
-            text-align: center;
-        }
-
-        .stat-value {
-            font-size: 36px;
-            font-weight: bold;
-            background: linear-gradient(90deg, #667eea, #764ba2);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-        }
-
-        .stat-label {
-            color: #888;
-            font-size: 14px;
-            margin-top: 5px;
-        }
-
-        /* 加载动画 */
-        .loading {
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            padding: 40px;
-        }
-
-        .spinner {
-            border: 3px solid rgba(255, 255, 255, 0.1);
-            border-top-color: #667eea;
-            border-radius: 50%;
-            width: 40px;
-            height: 40px;
-            animation: spin 1s linear infinite;
-        }
-
-        @keyframes spin {
-            to { transform: rotate(360deg); }
-        }
-
-        /* 进度条 */
-        .progress-bar {
-            width: 100%;
-            height: 8px;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 4px;
-            overflow: hidden;
-            margin-bottom: 10px;
-        }
-
-        .progress-fill {
-            height: 100%;
-            background: linear-gradient(90deg, #667eea, #764ba2);
-            transition: width 0.3s;
-        }
-
-        .progress-text {
-            text-align: center;
-            color: #888;
-            font-size: 13px;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ css_url }}">
 </head>
 <body>
     <div class="container">
@@ -581,6 +616,24 @@ PRODUCTION_TEMPLATE = """
                     <div class="spinner"></div>
                 </div>
             </div>
+
+            <template id="skill-card-tpl">
+                <div class="skill-card">
+                    <div class="skill-name"></div>
+                    <div class="skill-meta">
+                        ID: <span class="skill-id"></span><br>
+                        上传时间: <span class="skill-uploaded"></span>
+                    </div>
+                    <div class="skill-score">
+                        <span class="score-badge"></span>
+                        <span class="skill-status" style="color: #888;"></span>
+                    </div>
+                    <div style="color: #aaa; font-size: 13px;">
+                        文件数: <span class="skill-files"></span><br>
+                        大小: <span class="skill-size"></span> KB
+                    </div>
+                </div>
+            </template>
         </div>
 
         <!-- 擂台评比 -->
@@ -596,10 +649,83 @@ PRODUCTION_TEMPLATE = """
                     </div>
                 </div>
             </div>
+
+            <template id="scenario-card-tpl">
+                <div class="card">
+                    <div class="card-header">
+                        <h3 class="card-title"></h3>
+                        <p class="card-subtitle"></p>
+                    </div>
+                    <div class="scenario-metrics" style="margin-bottom: 15px; color: #888;"></div>
+                    <button class="btn btn-secondary">查看排行榜</button>
+                    <div class="scenario-leaderboard" style="margin-top: 15px; display: none;"></div>
+                </div>
+            </template>
+
+            <template id="leaderboard-tpl">
+                <div style="background: rgba(0,0,0,0.2); padding: 15px; border-radius: 8px;">
+                    <h4 style="margin-bottom: 10px;">🏆 排行榜 TOP 3</h4>
+                    <table style="width: 100%; color: #eee;">
+                        <thead>
+                            <tr style="border-bottom: 1px solid rgba(255,255,255,0.1);">
+                                <th style="text-align: left; padding: 8px;">排名</th>
+                                <th style="text-align: left; padding: 8px;">Skill</th>
+                                <th style="text-align: right; padding: 8px;">评分</th>
+                            </tr>
+                        </thead>
+                        <tbody></tbody>
+                    </table>
+                </div>
+            </template>
+
+            <template id="leaderboard-row-tpl">
+                <tr style="border-bottom: 1px solid rgba(255,255,255,0.1);">
+                    <td class="lb-rank" style="padding: 8px;"></td>
+                    <td class="lb-name" style="padding: 8px;"></td>
+                    <td class="lb-rating" style="text-align: right; padding: 8px;"></td>
+                </tr>
+            </template>
         </div>
     </div>
 
     <script>
+        // 复用的格式化器（避免每行都重新创建区域设置格式化对象）
+        const DATE_FMT = new Intl.DateTimeFormat('zh-CN', {
+            year: 'numeric', month: '2-digit', day: '2-digit',
+            hour: '2-digit', minute: '2-digit'
+        });
+        const KB_FMT = new Intl.NumberFormat('zh-CN', { maximumFractionDigits: 1 });
+
+        // 验证状态 -> CSS 类名（未知状态按 rejected 显示）
+        const STATUS_CLASS = Object.freeze({
+            excellent: 'excellent',
+            good: 'good',
+            acceptable: 'acceptable',
+            rejected: 'rejected'
+        });
+        const statusClass = status => STATUS_CLASS[status] || 'rejected';
+        const scoreClass = status => 'score-' + statusClass(status);
+
+        // 带超时的 fetch：后端无响应时不再无限等待。opts.signal 可用于提前取消
+        const FETCH_TIMEOUT_MS = 10000;
+        function fetchWithTimeout(url, opts = {}, ms = FETCH_TIMEOUT_MS) {
+            const ac = new AbortController();
+            let timedOut = false;
+            const timer = setTimeout(() => { timedOut = true; ac.abort(); }, ms);
+            if (opts.signal) opts.signal.addEventListener('abort', () => ac.abort());
+
+            return fetch(url, { ...opts, signal: ac.signal })
+                .catch(error => {
+                    throw timedOut ? new Error('请求超时') : error;
+                })
+                .finally(() => clearTimeout(timer));
+        }
+
+        function loadErrorHtml(message, retry) {
+            return `<div style="text-align: center; color: #f44336;">加载失败: ${message}
+                <button class="btn btn-secondary" style="margin-left: 10px;" onclick="${retry}()">重试</button></div>`;
+        }
+
         // 标签页切换
         function switchTab(tabName) {
             document.querySelectorAll('.tab-content').forEach(tab => {
@@ -657,14 +783,16 @@ PRODUCTION_TEMPLATE = """
             // 创建 FormData
             const formData = new FormData();
             for (let file of files) {
-                formData.append('files', file);
+                // 保留文件夹上传的相对路径，服务器据此还原目录结构
+                formData.append('files', file, file.webkitRelativePath || file.name);
             }
 
             // 发送上传请求
-            fetch('/api/upload', {
+            // 大文件上传需要更长时间，超时与服务器 worker 超时（120 秒）一致
+            fetchWithTimeout('/api/upload', {
                 method: 'POST',
                 body: formData
-            })
+            }, 120000)
             .then(response => response.json())
             .then(data => {
                 progressFill.style.width = '100%';
@@ -672,7 +800,17 @@ PRODUCTION_TEMPLATE = """
 
                 setTimeout(() => {
                     progressDiv.style.display = 'none';
-                    displayValidationResult(data);
+                    if (data.results) {
+                        // 一次上传了多个 Skill：逐个展示结果
+                        validationResult.className = 'validation-result show';
+                        validationResult.replaceChildren(...data.results.map(result => {
+                            const item = document.createElement('div');
+                            displayValidationResult(result, item);
+                            return item;
+                        }));
+                    } else {
+                        displayValidationResult(data);
+                    }
                 }, 1000);
             })
             .catch(error => {
@@ -681,8 +819,7 @@ PRODUCTION_TEMPLATE = """
             });
         }
 
-        function displayValidationResult(result) {
-            const validationResult = document.getElementById('validationResult');
+        function displayValidationResult(result, validationResult = document.getElementById('validationResult')) {
             validationResult.className = 'validation-result show';
             
             if (result.success) {
@@ -710,7 +847,7 @@ PRODUCTION_TEMPLATE = """
                 }
 
                 validationResult.innerHTML = `
-                    <div class="score-display score-${status}">${score}/100</div>
+                    <div class="score-display ${scoreClass(status)}">${score}/100</div>
                     <div style="margin-bottom: 15px;">
                         <strong>状态:</strong> ${status.toUpperCase()}<br>
                         <strong>Skill ID:</strong> ${result.skill_id}<br>
@@ -741,7 +878,7 @@ PRODUCTION_TEMPLATE = """
             output.className = 'validation-result show';
             output.innerHTML = '<div class="loading"><div class="spinner"></div></div>';
 
-            fetch(`/api/validate?path=${encodeURIComponent(path)}`)
+            fetchWithTimeout(`/api/validate?path=${encodeURIComponent(path)}`)
                 .then(response => response.json())
                 .then(data => {
                     const score = data.compliance_score;
@@ -768,7 +905,7 @@ PRODUCTION_TEMPLATE = """
                     }
 
                     output.innerHTML = `
-                        <div class="score-display score-${status}">${score}/100</div>
+                        <div class="score-display ${scoreClass(status)}">${score}/100</div>
                         <div style="margin-bottom: 15px;">
                             <strong>状态:</strong> ${status.toUpperCase()}<br>
                             <strong>检查项:</strong> ${data.passed_checks}/${data.total_checks}<br>
@@ -785,35 +922,82 @@ PRODUCTION_TEMPLATE = """
         }
 
         // 加载 Skills 列表
+        // /api/events 只推送处理该连接的服务器进程上的变化，仅作为刷新提示：
+        // 当前标签页直接渲染推送的数据，切换标签页和重连时仍向服务器重新校验
+        function isTabActive(tabName) {
+            return document.getElementById('tab-' + tabName).classList.contains('active');
+        }
+
+        function connectEvents() {
+            if (!window.EventSource) return;
+
+            const events = new EventSource('/api/events');
+            let opened = false;
+            events.addEventListener('open', () => {
+                // 断线期间（含服务器按时关闭连接）可能错过更新，重连后刷新当前标签页
+                if (opened) {
+                    if (isTabActive('skills')) loadSkills();
+                    if (isTabActive('arena')) loadArena();
+                }
+                opened = true;
+            });
+            events.addEventListener('skills_updated', e => {
+                if (!isTabActive('skills')) return;
+                const data = JSON.parse(e.data);
+                displaySkillsStats(data.stats);
+                displaySkillsList(data.skills);
+            });
+            events.addEventListener('arena_updated', e => {
+                if (!isTabActive('arena')) return;
+                const data = JSON.parse(e.data);
+                displayArena(data.scenarios, data.skills, data.leaderboards);
+            });
+        }
+
+        // /api/skills/uploaded 的 ETag 和请求序号（丢弃过期响应）
+        let skillsEtag = null;
+        let skillsLoadToken = 0;
+        let skillsCtrl = null;
+
         function loadSkills() {
             const container = document.getElementById('skillsList');
-            container.innerHTML = '<div class="loading"><div class="spinner"></div></div>';
+            const token = ++skillsLoadToken;
+            if (!skillsEtag) {
+                container.innerHTML = '<div class="loading"><div class="spinner"></div></div>';
+            }
 
-            fetch('/api/skills/uploaded')
-                .then(response => response.json())
+            // 取消仍在进行的上一次加载
+            if (skillsCtrl) skillsCtrl.abort();
+            skillsCtrl = new AbortController();
+
+            fetchWithTimeout('/api/skills/uploaded', {
+                headers: skillsEtag ? { 'If-None-Match': skillsEtag } : {},
+                signal: skillsCtrl.signal
+            })
+                .then(response => {
+                    // 已有更新的请求，或数据未变化（304）时保留当前渲染结果
+                    if (token !== skillsLoadToken || response.status === 304) return null;
+                    skillsEtag = response.headers.get('ETag');
+                    return response.json();
+                })
                 .then(data => {
-                    displaySkillsStats(data);
-                    displaySkillsList(data);
+                    if (!data || token !== skillsLoadToken) return;
+                    displaySkillsStats(data.stats);
+                    displaySkillsList(data.skills);
                 })
                 .catch(error => {
-                    container.innerHTML = `<div style="text-align: center; color: #f44336;">加载失败: ${error.message}</div>`;
+                    if (token !== skillsLoadToken) return;
+                    skillsEtag = null;
+                    container.innerHTML = loadErrorHtml(error.message, 'loadSkills');
                 });
         }
 
-        function displaySkillsStats(skills) {
-            const total = skills.length;
-            const excellent = skills.filter(s => s.compliance_score >= 90).length;
-            const avgScore = total > 0 ? Math.round(skills.reduce((sum, s) => sum + (s.compliance_score || 0), 0) / total) : 0;
-            const totalIssues = skills.reduce((sum, s) => {
-                const issues = (s.validation?.critical_issues?.length || 0) + 
-                               (s.validation?.warnings?.length || 0);
-                return sum + issues;
-            }, 0);
-
-            document.getElementById('totalSkills').textContent = total;
-            document.getElementById('excellentSkills').textContent = excellent;
-            document.getElementById('avgScore').textContent = avgScore;
-            document.getElementById('totalIssues').textContent = totalIssues;
+        function displaySkillsStats(stats) {
+            // 统计数据由服务器预先计算
+            document.getElementById('totalSkills').textContent = stats.total;
+            document.getElementById('excellentSkills').textContent = stats.excellent;
+            document.getElementById('avgScore').textContent = stats.avg_score;
+            document.getElementById('totalIssues').textContent = stats.total_issues;
         }
 
         function displaySkillsList(skills) {
@@ -824,28 +1008,30 @@ PRODUCTION_TEMPLATE = """
                 return;
             }
 
-            container.innerHTML = skills.map(skill => {
+            const tpl = document.getElementById('skill-card-tpl');
+            const frag = document.createDocumentFragment();
+
+            for (const skill of skills) {
                 const score = skill.compliance_score || 0;
                 const status = skill.validation?.overall_status || 'unknown';
+                const node = tpl.content.cloneNode(true);
+
+                node.querySelector('.skill-name').textContent = skill.skill_name;
+                node.querySelector('.skill-id').textContent = skill.skill_id;
+                // 旧元数据可能没有可解析的上传时间，不能让一条记录中断整个列表渲染
+                node.querySelector('.skill-uploaded').textContent =
+                    Number.isFinite(skill.uploaded_at_ms) ? DATE_FMT.format(new Date(skill.uploaded_at_ms)) : '-';
+                const badge = node.querySelector('.score-badge');
+                badge.classList.add(statusClass(status));
+                badge.textContent = `${score}/100`;
+                node.querySelector('.skill-status').textContent = status.toUpperCase();
+                node.querySelector('.skill-files').textContent = skill.file_stats?.total_files || 0;
+                node.querySelector('.skill-size').textContent = KB_FMT.format((skill.file_stats?.total_size_bytes || 0) / 1024);
+
+                frag.appendChild(node);
+            }
 
-                return `
-                    <div class="skill-card">
-                        <div class="skill-name">${skill.skill_name}</div>
-                        <div class="skill-meta">
-                            ID: ${skill.skill_id}<br>
-                            上传时间: ${new Date(skill.uploaded_at).toLocaleString()}
-                        </div>
-                        <div class="skill-score">
-                            <span class="score-badge ${status}">${score}/100</span>
-                            <span style="color: #888;">${status.toUpperCase()}</span>
-                        </div>
-                        <div style="color: #aaa; font-size: 13px;">
-                            文件数: ${skill.file_stats?.total_files || 0}<br>
-                            大小: ${(skill.file_stats?.total_size_bytes || 0) / 1024} KB
-                        </div>
-                    </div>
-                `;
-            }).join('');
+            container.replaceChildren(frag);
         }
 
         // 加载擂台评比
@@ -853,102 +1039,115 @@ PRODUCTION_TEMPLATE = """
             const container = document.getElementById('arenaContent');
             container.innerHTML = '<div class="loading"><div class="spinner"></div></div>';
 
-            Promise.all([
-                fetch('/api/scenarios').then(r => r.json()),
-                fetch('/api/skills').then(r => r.json())
-            ])
-            .then(([scenarios, skills]) => {
-                displayArena(scenarios, skills);
-            })
-            .catch(error => {
-                container.innerHTML = `<div style="text-align: center; color: #f44336;">加载失败: ${error.message}</div>`;
-            });
+            fetchWithTimeout('/api/arena/bootstrap')
+                .then(response => response.json())
+                .then(data => {
+                    displayArena(data.scenarios, data.skills, data.leaderboards);
+                })
+                .catch(error => {
+                    container.innerHTML = loadErrorHtml(error.message, 'loadArena');
+                });
         }
 
-        function displayArena(scenarios, skills) {
+        function displayArena(scenarios, skills, leaderboards) {
             const container = document.getElementById('arenaContent');
+            const tpl = document.getElementById('scenario-card-tpl');
 
-            let html = '<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(500px, 1fr)); gap: 20px;">';
+            const grid = document.createElement('div');
+            grid.style.cssText = 'display: grid; grid-template-columns: repeat(auto-fit, minmax(500px, 1fr)); gap: 20px;';
 
-            scenarios.forEach(scenario => {
-                html += `
-                    <div class="card">
-                        <div class="card-header">
-                            <h3 class="card-title">${scenario.title}</h3>
-                            <p class="card-subtitle">${scenario.description.substring(0, 100)}...</p>
-                        </div>
-                        <div style="margin-bottom: 15px; color: #888;">
-                            注册 Skills: ${scenario.metrics.total_skills} | 评价数: ${scenario.metrics.total_reviews}
-                        </div>
-                        <button class="btn btn-secondary" onclick="loadLeaderboard('${scenario.scenario_id}')">
-                            查看排行榜
-                        </button>
-                        <div id="leaderboard-${scenario.scenario_id}" style="margin-top: 15px;"></div>
-                    </div>
-                `;
-            });
+            for (const scenario of scenarios) {
+                const node = tpl.content.cloneNode(true);
+
+                node.querySelector('.card-title').textContent = scenario.title;
+                node.querySelector('.card-subtitle').textContent = `${scenario.description.substring(0, 100)}...`;
+                node.querySelector('.scenario-metrics').textContent =
+                    `注册 Skills: ${scenario.metrics.total_skills} | 评价数: ${scenario.metrics.total_reviews}`;
+                node.querySelector('button').addEventListener('click', () => loadLeaderboard(scenario.scenario_id));
+
+                const board = node.querySelector('.scenario-leaderboard');
+                board.id = 'leaderboard-' + scenario.scenario_id;
+                board.appendChild(renderLeaderboard(leaderboards[scenario.scenario_id] || []));
 
-            html += '</div>';
-            container.innerHTML = html;
+                grid.appendChild(node);
+            }
+
+            container.replaceChildren(grid);
         }
 
-        function loadLeaderboard(scenarioId) {
-            const container = document.getElementById('leaderboard-' + scenarioId);
-            container.innerHTML = '<div class="loading"><div class="spinner"></div></div>';
+        function renderLeaderboard(items) {
+            const node = document.getElementById('leaderboard-tpl').content.cloneNode(true);
+            const rowTpl = document.getElementById('leaderboard-row-tpl');
+            const tbody = node.querySelector('tbody');
 
-            fetch(`/api/leaderboard/${scenarioId}`)
-                .then(response => response.json())
-                .then(leaderboard => {
-                    let html = `
-                        <div style="background: rgba(0,0,0,0.2); padding: 15px; border-radius: 8px;">
-                            <h4 style="margin-bottom: 10px;">🏆 排行榜 TOP 3</h4>
-                            <table style="width: 100%; color: #eee;">
-                                <thead>
-                                    <tr style="border-bottom: 1px solid rgba(255,255,255,0.1);">
-                                        <th style="text-align: left; padding: 8px;">排名</th>
-                                        <th style="text-align: left; padding: 8px;">Skill</th>
-                                        <th style="text-align: right; padding: 8px;">评分</th>
-                                    </tr>
-                                </thead>
-                                <tbody>
-                    `;
+            for (const item of items.slice(0, 3)) {
+                const rankEmoji = item.rank === 1 ? '🥇' : item.rank === 2 ? '🥈' : '🥉';
+                const row = rowTpl.content.cloneNode(true);
 
-                    leaderboard.leaderboard.slice(0, 3).forEach(item => {
-                        const rankEmoji = item.rank === 1 ? '🥇' : item.rank === 2 ? '🥈' : '🥉';
-                        html += `
-                            <tr style="border-bottom: 1px solid rgba(255,255,255,0.1);">
-                                <td style="padding: 8px;">${rankEmoji} #${item.rank}</td>
-                                <td style="padding: 8px;">${item.skill_name}</td>
-                                <td style="text-align: right; padding: 8px;">${item.metrics.avg_rating.toFixed(2)}/5</td>
-                            </tr>
-                        `;
-                    });
+                row.querySelector('.lb-rank').textContent = `${rankEmoji} #${item.rank}`;
+                row.querySelector('.lb-name').textContent = item.skill_name;
+                row.querySelector('.lb-rating').textContent = `${item.metrics.avg_rating.toFixed(2)}/5`;
 
-                    html += '</tbody></table></div>';
-                    container.innerHTML = html;
-                })
-                .catch(error => {
-                    container.innerHTML = `<div style="color: #f44336;">加载失败: ${error.message}</div>`;
-                });
+                tbody.appendChild(row);
+            }
+
+            return node;
+        }
+
+        function loadLeaderboard(scenarioId) {
+            // 排行榜已随 /api/arena/bootstrap 一起加载，这里只切换显示
+            const container = document.getElementById('leaderboard-' + scenarioId);
+            container.style.display = container.style.display === 'none' ? 'block' : 'none';
         }
 
         // 页面加载时初始化
         window.addEventListener('DOMContentLoaded', () => {
             // 默认加载 Skills 列表
             loadSkills();
+            connectEvents();
         });
     </script>
 </body>
 </html>
 """
 
+# 样式表按内容哈希命名，内容变化即换 URL，因此可以 immutable 长期缓存
+_APP_CSS = PrecompressedBody(PRODUCTION_CSS.encode('utf-8'), 'text/css; charset=utf-8')
+_APP_CSS_HASH = _APP_CSS.etag[:12]
+_APP_CSS_URL = f"/assets/app.{_APP_CSS_HASH}.css"
+
+# 主页模板只引用样式表地址，启动时渲染并压缩一次，之后每个请求直接返回字节
+_INDEX_HTML = PrecompressedBody(
+    app.jinja_env.from_string(PRODUCTION_TEMPLATE).render(css_url=_APP_CSS_URL).encode('utf-8'),
+    'text/html; charset=utf-8'
+)
+
 
 # ============ API 路由 ============
 
 @app.route('/')
 def index():
     """主页"""
-    return render_template_string(PRODUCTION_TEMPLATE)
+    if request.if_none_match.contains(_INDEX_HTML.etag):
+        response = Response(status=304)
+        response.headers['Vary'] = 'Accept-Encoding'
+    else:
+        response = _INDEX_HTML.response()
+
+    response.set_etag(_INDEX_HTML.etag)
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
+
+
+@app.route('/assets/app.<css_hash>.css')
+def app_css(css_hash):
+    """样式表（内容哈希寻址，永久缓存）"""
+    if css_hash != _APP_CSS_HASH:
+        abort(404)
+
+    response = _APP_CSS.response()
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
 
 
 @app.route('/api/upload', methods=['POST'])
@@ -969,35 +1168,70 @@ def upload_skill():
                 'error': '文件为空'
             })
 
-        # 保存到临时目录
-        temp_dir = Path(data_dir / "uploads" / f"upload_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-        temp_dir.mkdir(parents=True, exist_ok=True)
+        # 保存到临时目录（mkdtemp 原子地创建唯一目录，并发上传互不干扰）。
+        # 使用上传管理器的暂存目录，与 skills 目录同一文件系统，之后移动只需重命名；
+        # 暂存目录已由 SkillUploader.__init__ 创建，这里只需创建叶子目录
+        temp_dir = Path(tempfile.mkdtemp(prefix="upload_", dir=str(uploader.staging_dir)))
+        temp_root = temp_dir.resolve()
 
-        # 处理上传文件
+        # 处理上传文件（分块流式写盘）
+        created_dirs = {temp_root}
         for file in files:
-            file_path = temp_dir / file.filename
-            
-            # 如果是目录，创建子目录
-            if '/' in file.filename:
+            file_path = (temp_root / file.filename).resolve()
+            if temp_root not in file_path.parents:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                return jsonify({
+                    'success': False,
+                    'error': f'非法文件路径: {file.filename}'
+                })
+
+            # 如果是目录，创建子目录（同一请求中每个目录只创建一次）
+            if file_path.parent not in created_dirs:
                 file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            file.save(str(file_path))
+                created_dirs.update(file_path.parent.parents)
+                created_dirs.add(file_path.parent)
+
+            _save_upload_stream(file, file_path)
 
         # 检查是否是 ZIP 文件
         zip_files = list(temp_dir.glob("*.zip"))
         if zip_files:
-            # 解压 ZIP 文件
-            import zipfile
-            with zipfile.ZipFile(zip_files[0], 'r') as zip_ref:
-                zip_ref.extractall(temp_dir / "extracted")
+            # 解压 ZIP 文件（大包并行解压；空包、过大的包在解压前拒绝）
+            try:
+                SkillUploader.extract_zip(zip_files[0], temp_dir / "extracted")
+            except (ValueError, zipfile.BadZipFile) as e:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                return jsonify({
+                    'success': False,
+                    'error': f'ZIP 文件无效: {e}'
+                })
             
             # 使用解压后的内容
             upload_path = str(temp_dir / "extracted")
         else:
             upload_path = str(temp_dir)
 
-        # 上传 Skill
-        result = uploader.upload_skill(upload_path, auto_validate=True)
+        # 上传 Skill（一次上传多个 Skill 文件夹时并行验证）
+        skill_roots = _find_skill_roots(Path(upload_path))
+        if len(skill_roots) == 1:
+            result = uploader.upload_skill(str(skill_roots[0]), auto_validate=True, move_source=True)
+            succeeded = result.get('success')
+        else:
+            results = uploader.upload_skills([str(root) for root in skill_roots],
+                                             auto_validate=True, move_source=True)
+            succeeded = any(r.get('success') for r in results)
+            result = {
+                'success': all(r.get('success') for r in results),
+                'results': results
+            }
+
+        # 清理剩余的暂存文件（如原始 ZIP），后台删除不阻塞响应
+        SkillUploader.discard_tree(temp_dir)
+        with _uploaded_skills_lock:
+            _uploaded_skills_cache['version'] += 1
+
+        if succeeded:
+            _publish_event_async('skills_updated', _uploaded_skills_payload)
 
         return jsonify(result)
 
@@ -1008,6 +1242,141 @@ def upload_skill():
         }), 500
 
 
+def _find_skill_roots(upload_path: Path) -> list:
+    """
+    定位上传内容中的 Skill 根目录
+
+    根目录本身含 SKILL.md 时即为单个 Skill；否则每个含 SKILL.md 的
+    直接子目录各算一个 Skill（文件夹上传、批量 ZIP）。都没有时返回根目录，
+    交给验证器报告缺失。
+    """
+    if (upload_path / "SKILL.md").is_file():
+        return [upload_path]
+
+    roots = sorted(
+        Path(entry.path) for entry in os.scandir(upload_path)
+        if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "SKILL.md"))
+    )
+    return roots or [upload_path]
+
+
+def _save_upload_stream(file, file_path: Path):
+    """
+    将上传文件写入目标路径
+
+    上传内容已由 DiskBufferedRequest 缓冲在磁盘临时文件中，优先用
+    os.sendfile 在内核中直接复制，数据不经过用户态缓冲区；不支持时
+    退回到按块复制。
+
+    Args:
+        file: Werkzeug FileStorage
+        file_path: 目标路径（必须不存在）
+    """
+    fd = os.open(str(file_path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'wb') as out:
+        if not _sendfile_stream(file.stream, out.fileno()):
+            shutil.copyfileobj(file.stream, out, UPLOAD_CHUNK_SIZE)
+
+
+def _sendfile_stream(stream, out_fd: int) -> bool:
+    """
+    用 os.sendfile 把文件流从当前位置复制到 out_fd
+
+    Returns:
+        是否已完成复制；流没有文件描述符或系统不支持时返回 False（未写入任何数据）
+    """
+    if not hasattr(os, 'sendfile'):
+        return False
+    try:
+        in_fd = stream.fileno()
+        offset = stream.tell()
+    except (AttributeError, OSError, ValueError):
+        return False
+
+    size = os.fstat(in_fd).st_size
+    copied = 0
+    while offset < size:
+        try:
+            sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+        except OSError:
+            if copied:
+                raise
+            return False
+        if sent == 0:
+            break
+        offset += sent
+        copied += sent
+
+    stream.seek(offset)
+    return True
+
+
+# 验证结果缓存：Skill 目录指纹 -> 验证结果（LRU）
+VALIDATION_CACHE_SIZE = 512
+_validation_cache = OrderedDict()
+_validation_cache_lock = threading.Lock()
+
+
+def _skill_fingerprint(path: Path) -> str:
+    """
+    计算 Skill 目录的指纹
+
+    基于每个文件的相对路径、大小和修改时间（不读取文件内容），
+    任一文件增删改都会改变指纹。
+
+    Args:
+        path: Skill 目录路径
+
+    Returns:
+        十六进制指纹
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(path.resolve()).encode('utf-8'))
+    for p in sorted(path.rglob('*')):
+        try:
+            st = p.stat()
+        except OSError:
+            # 悬空符号链接等无法跟随的条目：改用链接本身的信息；已被删除的条目跳过
+            try:
+                st = p.lstat()
+            except OSError:
+                continue
+        h.update(f"{p.relative_to(path)}:{st.st_size}:{st.st_mtime_ns}\n".encode('utf-8'))
+    return h.hexdigest()
+
+
+def _validate_cached(path: str) -> dict:
+    """
+    验证 Skill，目录内容未变化时直接返回缓存结果
+
+    Args:
+        path: Skill 目录路径
+
+    Returns:
+        验证结果
+    """
+    skill_path = Path(path)
+    if not skill_path.is_dir():
+        # 路径不存在等情况交给验证器报告，不缓存
+        return SkillValidator().validate_skill(path)
+
+    fingerprint = _skill_fingerprint(skill_path)
+    with _validation_cache_lock:
+        result = _validation_cache.get(fingerprint)
+        if result is not None:
+            _validation_cache.move_to_end(fingerprint)
+            return result
+
+    result = SkillValidator().validate_skill(path)
+
+    with _validation_cache_lock:
+        _validation_cache[fingerprint] = result
+        if len(_validation_cache) > VALIDATION_CACHE_SIZE:
+            _validation_cache.popitem(last=False)
+
+    return result
+
+
 @app.route('/api/validate', methods=['GET'])
 def validate_skill():
     """验证 Skill"""
@@ -1016,8 +1385,7 @@ def validate_skill():
         return jsonify({'success': False, 'error': '缺少路径参数'})
 
     try:
-        validator = SkillValidator()
-        result = validator.validate_skill(path)
+        result = _validate_cached(path)
         return jsonify(result)
     except Exception as e:
         return jsonify({
@@ -1026,16 +1394,232 @@ def validate_skill():
         }), 500
 
 
+@app.route('/api/validate/cache/clear', methods=['POST'])
+def clear_validation_cache():
+    """清空验证结果缓存"""
+    with _validation_cache_lock:
+        cleared = len(_validation_cache)
+        _validation_cache.clear()
+    return jsonify({'success': True, 'cleared': cleared})
+
+
+# 已上传 Skills 列表响应缓存：上传或 skills 目录变化时失效
+_uploaded_skills_cache = {'version': 0, 'key': None, 'entry': None}
+_uploaded_skills_lock = threading.Lock()
+
+
+def _compute_skills_stats(skills: list) -> dict:
+    """
+    计算已上传 Skills 的统计数据
+
+    Args:
+        skills: Skill 元数据列表
+
+    Returns:
+        统计数据（总数、优秀数、平均分、问题总数）
+    """
+    total = len(skills)
+    scores = [s.get('compliance_score') or 0 for s in skills]
+    total_issues = 0
+    for s in skills:
+        validation = s.get('validation') or {}
+        total_issues += len(validation.get('critical_issues') or []) + len(validation.get('warnings') or [])
+
+    return {
+        'total': total,
+        'excellent': sum(1 for score in scores if score >= 90),
+        'avg_score': int(sum(scores) / total + 0.5) if total else 0,
+        'total_issues': total_issues
+    }
+
+
+def _skill_list_item(skill: dict) -> dict:
+    """
+    列表接口中的 Skill 条目：上传时间以毫秒时间戳发送，省去 ISO 字符串
+
+    旧元数据只有 uploaded_at 字符串时在此换算一次（结果随列表缓存）。
+    """
+    item = dict(skill)
+    uploaded_at = item.pop('uploaded_at', None)
+    if 'uploaded_at_ms' not in item and uploaded_at:
+        try:
+            item['uploaded_at_ms'] = int(datetime.fromisoformat(uploaded_at).timestamp() * 1000)
+        except (TypeError, ValueError):
+            pass
+    return item
+
+
+def _uploaded_skills_entry() -> tuple:
+    """
+    已上传 Skills 列表及统计数据的 JSON 字节和 ETag，未变化时直接复用缓存
+
+    缓存键包含本进程的上传版本号和 skills 目录的修改时间，
+    其他 worker 或命令行上传新 Skill 时同样会失效。
+
+    Returns:
+        (JSON 字节, ETag)
+    """
+    cache = _uploaded_skills_cache
+    try:
+        dir_mtime = uploader.skills_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        dir_mtime = None
+
+    # 与上传处理中的版本号递增共用一把锁（gthread worker 中请求并发执行）
+    with _uploaded_skills_lock:
+        key = (cache['version'], dir_mtime)
+        entry = cache['entry']
+        if entry is None or cache['key'] != key:
+            skills = uploader.list_uploaded_skills()
+            payload = orjson.dumps({
+                'skills': [_skill_list_item(s) for s in skills],
+                'stats': _compute_skills_stats(skills)
+            }, default=OrjsonProvider._default, option=OrjsonProvider.OPTIONS)
+            entry = (payload, hashlib.md5(payload).hexdigest())
+            cache['key'] = key
+            cache['entry'] = entry
+
+    return entry
+
+
+def _uploaded_skills_payload() -> bytes:
+    """已上传 Skills 列表及统计数据的 JSON 字节"""
+    return _uploaded_skills_entry()[0]
+
+
 @app.route('/api/skills/uploaded', methods=['GET'])
 def get_uploaded_skills():
-    """获取已上传的 Skills"""
+    """获取已上传的 Skills 及统计数据"""
     try:
-        skills = uploader.list_uploaded_skills()
-        return jsonify(skills)
+        payload, etag = _uploaded_skills_entry()
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Response(payload, mimetype='application/json')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+# ============ 实时事件（Server-Sent Events） ============
+
+# 每个 /api/events 连接一个消息队列
+# 注意：订阅者只在本进程内，gunicorn 多 worker 下其他进程的上传和评价不会推送到这里，
+# 客户端只把事件当作刷新提示，切换标签页和重连时仍会向服务器重新校验数据
+_event_subscribers = set()
+_event_subscribers_lock = threading.Lock()
+
+# 无事件时发送心跳的间隔（秒），防止代理断开空闲连接
+EVENT_HEARTBEAT_SECONDS = 30
+
+# 单个连接的最长持续时间（秒），到期后由浏览器自动重连；
+# 多线程 worker 下每个事件流占用一个线程，不能无限期持有
+EVENT_STREAM_MAX_SECONDS = 300
+
+# 每个进程同时保持的事件流上限。gunicorn.conf.py 按 worker 类型设置该环境变量
+# （gevent 下很高，gthread 下为线程数的一半）；默认值对应 app.run() 的开发服务器
+EVENT_MAX_SUBSCRIBERS = int(os.getenv('EVENT_MAX_SUBSCRIBERS', '4'))
+
+
+def _sse_message(event: str, data: bytes) -> bytes:
+    """构造一条 SSE 消息（orjson 输出不含换行，可直接作为单行 data）"""
+    return b'event: ' + event.encode('utf-8') + b'\ndata: ' + data + b'\n\n'
+
+
+def _arena_payload() -> bytes:
+    """擂台概览的 JSON 字节"""
+    return orjson.dumps(
+        manager.get_arena_overview(top_n=3),
+        default=OrjsonProvider._default,
+        option=OrjsonProvider.OPTIONS
+    )
+
+
+def _publish_event(event: str, data: bytes):
+    """
+    向本进程所有已连接的客户端推送事件
+
+    Args:
+        event: 事件名称
+        data: JSON 字节
+    """
+    message = _sse_message(event, data)
+    with _event_subscribers_lock:
+        subscribers = list(_event_subscribers)
+    for q in subscribers:
+        try:
+            q.put_nowait(message)
+        except queue.Full:
+            # 客户端消费过慢，丢弃该消息（下次事件会带上完整数据）
+            pass
+
+
+# 事件数据在后台线程中构建和推送，请求无需等待；单个线程保证事件按提交顺序送达
+_event_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sse-publish')
+
+
+def _publish_event_async(event: str, build_payload):
+    """
+    在后台构建事件数据并推送，没有客户端连接时直接跳过
+
+    Args:
+        event: 事件名称
+        build_payload: 返回 JSON 字节的函数
+    """
+    with _event_subscribers_lock:
+        if not _event_subscribers:
+            return
+
+    def publish():
+        try:
+            _publish_event(event, build_payload())
+        except Exception as e:
+            print(f"⚠ 推送事件失败: {event} ({e})")
+
+    _event_executor.submit(publish)
+
+
+@app.route('/api/events', methods=['GET'])
+def event_stream():
+    """
+    实时事件流
+
+    在本进程处理上传或评价提交时推送 skills_updated / arena_updated 及完整的最新数据。
+    连接最长保持 EVENT_STREAM_MAX_SECONDS 秒，超过 EVENT_MAX_SUBSCRIBERS 个连接时返回 503。
+    """
+    q = queue.Queue(maxsize=100)
+
+    with _event_subscribers_lock:
+        if len(_event_subscribers) >= EVENT_MAX_SUBSCRIBERS:
+            # 浏览器收到 503 后不再重连，页面退回到切换标签页时请求数据
+            return jsonify({'success': False, 'error': '实时连接数已满'}), 503
+        _event_subscribers.add(q)
+
+    def unsubscribe():
+        with _event_subscribers_lock:
+            _event_subscribers.discard(q)
+
+    def stream():
+        deadline = time.monotonic() + EVENT_STREAM_MAX_SECONDS
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                yield q.get(timeout=min(EVENT_HEARTBEAT_SECONDS, remaining))
+            except queue.Empty:
+                yield b': keepalive\n\n'
+
+    response = Response(stream(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    # 生成器未开始迭代就被关闭时不会执行 finally，在响应关闭时取消订阅
+    response.call_on_close(unsubscribe)
+    return response
+
+
 @app.route('/api/scenarios', methods=['GET'])
 def get_scenarios():
     """获取所有场景"""
@@ -1056,11 +1640,20 @@ def get_skills():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/arena/bootstrap', methods=['GET'])
+def get_arena_bootstrap():
+    """获取擂台页面所需的全部数据（场景、Skills、各场景排行榜 TOP 3）"""
+    try:
+        return jsonify(manager.get_arena_overview(top_n=3))
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @app.route('/api/leaderboard/<scenario_id>', methods=['GET'])
 def get_leaderboard(scenario_id):
     """获取排行榜"""
     try:
-        leaderboard = manager.generate_leaderboard(scenario_id)
+        leaderboard = manager.get_leaderboard(scenario_id)
         return jsonify(leaderboard)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -1079,6 +1672,7 @@ def submit_review():
             metrics=data.get('metrics', {}),
             comment=data.get('comment', '')
         )
+        _publish_event_async('arena_updated', _arena_payload)
         return jsonify(review)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -1097,5 +1691,7 @@ if __name__ == '__main__':
     print("  • Skills 擂台评比")
     print("  • 实时排行榜")
     print("=" * 80)
-    
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    print("\n提示: 生产环境请使用 gunicorn 启动:")
+    print("  gunicorn -c gunicorn.conf.py production_web_server:app")
+
+    app.run(host='0.0.0.0', port=5000, debug=os.getenv('FLASK_DEBUG') == '1')
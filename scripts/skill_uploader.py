@@ -6,23 +6,55 @@ Skill 上传管理器
 """
 
 import os
+import re
 import sys
 import json
 import shutil
 import zipfile
 import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Sequence
 import hashlib
 
+import orjson
+
 # 导入验证器
 from skill_validator import SkillValidator
 
+# SKILL.md 元数据字段（模块加载时编译一次）
+_NAME_RE = re.compile(r'name:\s*["\']?([^"\'\n]+)["\']?')
+_DESC_RE = re.compile(r'description:\s*["\']([^"\']+)')
+
+# 元数据文件的必需字段及类型（读取时校验，损坏的文件不会进入列表）
+_METADATA_SCHEMA = {
+    "skill_id": str,
+    "skill_name": str,
+    "description": str,
+    "author": str,
+    "version": str,
+    "uploaded_at": str,
+    "file_stats": dict,
+    "status": str,
+}
+
 
 class SkillUploader:
     """Skill 上传管理器"""
 
+    # 批量上传时的最大并行验证数
+    MAX_UPLOAD_WORKERS = 8
+
+    # 解压后总大小超过该值的 ZIP 按成员并行解压（zlib 解压时释放 GIL）
+    ZIP_PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+    # ZIP 解压后的总大小上限（防止压缩炸弹）
+    ZIP_MAX_EXTRACTED_BYTES = 512 * 1024 * 1024
+
     def __init__(self, upload_dir: str = "../data/uploads", 
                  skills_dir: str = "../data/skills"):
         """
@@ -34,14 +66,39 @@ class SkillUploader:
         """
         self.upload_dir = Path(upload_dir)
         self.skills_dir = Path(skills_dir)
-        self.validator = SkillValidator()
+
+        # 已解析的元数据缓存：文件路径 -> ((mtime_ns, size), 元数据)
+        self._metadata_cache: Dict[str, tuple] = {}
+
+        # Skills 列表缓存：(skills 目录 mtime_ns, 构建时间 ns, 列表)
+        self._list_cache: Optional[tuple] = None
+        self._list_lock = threading.Lock()
         
         # 创建必要的目录
         self.upload_dir.mkdir(parents=True, exist_ok=True)
         self.skills_dir.mkdir(parents=True, exist_ok=True)
 
+        # 暂存目录必须与 skills 目录在同一文件系统，验证通过后才能直接重命名；
+        # 上传目录在其他卷上时改为在 skills 目录下暂存
+        if os.stat(self.upload_dir).st_dev == os.stat(self.skills_dir).st_dev:
+            self.staging_dir = self.upload_dir
+        else:
+            self.staging_dir = self.skills_dir / ".staging"
+            self.staging_dir.mkdir(exist_ok=True)
+            print(f"⚠ 上传目录与 skills 目录不在同一文件系统，暂存目录改为: {self.staging_dir}")
+
+        # 内容哈希索引：.by-hash/<content_hash> 是指向 skill_id 的符号链接
+        self.hash_index_dir = self.skills_dir / ".by-hash"
+        self.hash_index_dir.mkdir(exist_ok=True)
+
+        # 清理上次进程退出时未删完的目录（见 discard_tree）
+        with os.scandir(self.staging_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('.trash_') and entry.is_dir(follow_symlinks=False):
+                    self._rmtree_in_background(Path(entry.path))
+
     def upload_skill(self, source_path: str, skill_name: Optional[str] = None,
-                    auto_validate: bool = True) -> Dict:
+                    auto_validate: bool = True, move_source: bool = False) -> Dict:
         """
         上传 Skill
 
@@ -49,6 +106,8 @@ class SkillUploader:
             source_path: Skill 源路径（文件夹或 zip 文件）
             skill_name: 自定义 Skill 名称（可选）
             auto_validate: 是否自动验证
+            move_source: 源目录可被移走（如服务器自己的上传暂存目录），
+                         直接重命名而不是复制
 
         Returns:
             上传结果字典
@@ -68,7 +127,7 @@ class SkillUploader:
             }
 
         # 解压或复制到临时目录
-        temp_dir = self._prepare_upload(source, skill_name)
+        temp_dir = self._prepare_upload(source, skill_name, move_source)
         if not temp_dir:
             return {
                 "success": False,
@@ -76,6 +135,15 @@ class SkillUploader:
                 "path": str(source)
             }
 
+        # 内容完全相同且已验证通过的 Skill 直接返回之前的上传结果
+        content_hash = self._content_hash(temp_dir)
+        if auto_validate:
+            cached_report = self._find_duplicate(content_hash)
+            if cached_report is not None:
+                print(f"\n内容与已上传的 Skill 相同: {cached_report['skill_id']}")
+                self.discard_tree(temp_dir)
+                return {**cached_report, "cached": True}
+
         # 生成 Skill ID
         skill_id = self._generate_skill_id(temp_dir.name)
         skill_dir = self.skills_dir / skill_id
@@ -84,7 +152,8 @@ class SkillUploader:
         validation_result = None
         if auto_validate:
             print("\n执行自动化验证...")
-            validation_result = self.validator.validate_skill(str(temp_dir))
+            # 验证器在实例上累积结果，每次上传使用独立实例（也保证并行上传互不干扰）
+            validation_result = SkillValidator().validate_skill(str(temp_dir))
 
             # 检查验证结果
             if validation_result['overall_status'] == 'rejected':
@@ -92,8 +161,8 @@ class SkillUploader:
                 print(f"合规分数: {validation_result['compliance_score']}/100")
                 print(f"严重问题: {len(validation_result['critical_issues'])}")
                 
-                # 清理临时目录
-                shutil.rmtree(temp_dir, ignore_errors=True)
+                # 清理临时目录（后台删除，不阻塞返回）
+                self.discard_tree(temp_dir)
                 
                 return {
                     "success": False,
@@ -103,12 +172,13 @@ class SkillUploader:
 
         # 移动到目标目录
         print(f"\n移动 Skill 到: {skill_dir}")
-        shutil.move(str(temp_dir), str(skill_dir))
+        self._move_tree(temp_dir, skill_dir)
 
         # 生成 Skill 元数据
-        metadata = self._generate_metadata(skill_dir, skill_id, validation_result)
+        metadata = self._generate_metadata(skill_dir, skill_id, validation_result,
+                                           content_hash=content_hash)
         metadata_file = self.skills_dir / f"{skill_id}.json"
-        metadata_file.write_text(json.dumps(metadata, indent=2, ensure_ascii=False))
+        self._write_json(metadata_file, metadata)
 
         # 生成上传报告
         upload_report = {
@@ -124,7 +194,11 @@ class SkillUploader:
 
         # 保存上传记录
         upload_record_file = self.upload_dir / f"upload-{skill_id}.json"
-        upload_record_file.write_text(json.dumps(upload_report, indent=2, ensure_ascii=False))
+        self._write_json(upload_record_file, upload_report)
+
+        # 只索引验证过的上传，未验证的结果不能替代验证
+        if auto_validate:
+            self._index_content_hash(content_hash, skill_id)
 
         print(f"\n✅ Skill 上传成功！")
         print(f"   Skill ID: {skill_id}")
@@ -134,29 +208,54 @@ class SkillUploader:
 
         return upload_report
 
-    def _prepare_upload(self, source: Path, skill_name: Optional[str]) -> Optional[Path]:
+    def upload_skills(self, source_paths: Sequence[str], auto_validate: bool = True,
+                      move_source: bool = False) -> List[Dict]:
+        """
+        批量上传多个 Skill，并行执行解包和验证
+
+        Args:
+            source_paths: Skill 源路径列表（文件夹或 zip 文件）
+            auto_validate: 是否自动验证
+            move_source: 源目录可被移走，直接重命名而不是复制
+
+        Returns:
+            上传结果列表，顺序与 source_paths 一致
+        """
+        if len(source_paths) <= 1:
+            return [self.upload_skill(path, auto_validate=auto_validate, move_source=move_source)
+                    for path in source_paths]
+
+        workers = min(self.MAX_UPLOAD_WORKERS, os.cpu_count() or 1, len(source_paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(
+                lambda path: self.upload_skill(path, auto_validate=auto_validate,
+                                               move_source=move_source),
+                source_paths
+            ))
+
+    def _prepare_upload(self, source: Path, skill_name: Optional[str],
+                        move_source: bool = False) -> Optional[Path]:
         """
         准备上传文件
 
         Args:
             source: 源文件或目录
             skill_name: 自定义名称
+            move_source: 源目录可被移走，直接重命名到临时目录
 
         Returns:
             临时目录路径
         """
         print(f"\n准备上传: {source.name}")
 
-        # 创建临时目录
-        temp_dir = self.upload_dir / f"temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        temp_dir.mkdir(parents=True, exist_ok=True)
+        # 创建临时目录（与 skills 目录位于同一文件系统，后续移动只需重命名）
+        temp_dir = Path(tempfile.mkdtemp(prefix="temp_", dir=str(self.staging_dir)))
 
         if source.is_file() and source.suffix == '.zip':
             # 处理 zip 文件
             print(f"  解压 ZIP 文件...")
             try:
-                with zipfile.ZipFile(source, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
+                self.extract_zip(source, temp_dir)
                 
                 # 检查解压后的内容
                 extracted_items = list(temp_dir.iterdir())
@@ -175,19 +274,27 @@ class SkillUploader:
                 shutil.rmtree(temp_dir, ignore_errors=True)
                 return None
                 
+        elif source.is_dir() and move_source:
+            # 源目录归调用方所有，直接移动（同一文件系统上为 O(1) 重命名）
+            print(f"  移动目录...")
+            try:
+                temp_dir.rmdir()
+                self._move_tree(source, temp_dir)
+
+                print(f"  ✓ 移动完成")
+                return temp_dir
+
+            except Exception as e:
+                print(f"  ✗ 移动失败: {e}")
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                return None
+
         elif source.is_dir():
-            # 处理目录
+            # 处理目录：内容直接复制到临时目录
             print(f"  复制目录...")
             try:
-                # 如果有自定义名称，使用自定义名称
-                target_dir = temp_dir / (skill_name if skill_name else source.name)
-                shutil.copytree(source, target_dir)
-                
-                # 如果创建的是子目录，将内容移到 temp_dir
-                if target_dir != temp_dir:
-                    for item in target_dir.iterdir():
-                        shutil.move(str(item), str(temp_dir / item.name))
-                    shutil.rmtree(target_dir)
+                shutil.copytree(source, temp_dir, dirs_exist_ok=True,
+                                copy_function=self._clone_file)
                 
                 print(f"  ✓ 复制完成")
                 return temp_dir
@@ -202,16 +309,158 @@ class SkillUploader:
             shutil.rmtree(temp_dir, ignore_errors=True)
             return None
 
+    @classmethod
+    def extract_zip(cls, zip_path: Path, dest_dir: Path) -> None:
+        """
+        解压 ZIP 文件
+
+        解压前先检查中央目录（不解压任何数据）：空包或解压后超过
+        ZIP_MAX_EXTRACTED_BYTES 的包直接拒绝。小文件直接 extractall；
+        解压后较大的包按成员分发到线程池并行解压，zlib 解压时释放 GIL，
+        多线程可以利用多个 CPU 核心。
+
+        Args:
+            zip_path: ZIP 文件路径
+            dest_dir: 解压目标目录
+
+        Raises:
+            ValueError: ZIP 为空或解压后过大
+        """
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            members = zf.infolist()
+            total_size = sum(info.file_size for info in members)
+
+            if not members:
+                raise ValueError("ZIP 文件为空")
+            if total_size > cls.ZIP_MAX_EXTRACTED_BYTES:
+                raise ValueError(
+                    f"ZIP 解压后过大: {total_size} 字节（上限 {cls.ZIP_MAX_EXTRACTED_BYTES} 字节）"
+                )
+
+            workers = min(os.cpu_count() or 1, len(members))
+
+            if total_size < cls.ZIP_PARALLEL_MIN_BYTES or workers < 2:
+                zf.extractall(dest_dir)
+                return
+
+        def extract_batch(batch):
+            # ZipFile 对象不能在线程间共享，每个线程打开自己的句柄
+            with zipfile.ZipFile(zip_path, 'r') as zf:
+                for info in batch:
+                    try:
+                        zf.extract(info, dest_dir)
+                    except FileExistsError:
+                        # 另一个线程刚好创建了同一个父目录，重试一次即可
+                        zf.extract(info, dest_dir)
+
+        batches = [members[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # list() 取出结果，让任一线程的异常在此抛出
+            list(pool.map(extract_batch, batches))
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict) -> None:
+        """以 UTF-8 JSON 写入文件：orjson 直接生成字节，一次写入"""
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+    @staticmethod
+    def discard_tree(path: Path) -> None:
+        """
+        删除目录树而不阻塞调用方
+
+        先把目录重命名为同级的隐藏名称（一次系统调用，原路径立即可复用），
+        再由后台线程逐个删除文件。进程退出时未删完的残留由下次清理处理。
+
+        Args:
+            path: 要删除的目录
+        """
+        path = Path(path)
+        trash = path.with_name(f".trash_{path.name}")
+        try:
+            os.replace(path, trash)
+        except OSError:
+            # 无法重命名（如目标已存在或不在同一目录）时直接同步删除
+            shutil.rmtree(path, ignore_errors=True)
+            return
+
+        SkillUploader._rmtree_in_background(trash)
+
+    @staticmethod
+    def _rmtree_in_background(path: Path) -> None:
+        """在后台守护线程中删除目录树"""
+        threading.Thread(
+            target=shutil.rmtree, args=(path,), kwargs={'ignore_errors': True},
+            name="discard-tree", daemon=True
+        ).start()
+
+    @staticmethod
+    def _clone_file(src, dst):
+        """
+        复制单个文件（供 copytree 使用）
+
+        使用 os.copy_file_range 在内核中复制：支持 reflink 的文件系统
+        （btrfs、XFS）上只共享数据块，其他文件系统上数据也不经过用户态。
+        系统或文件系统不支持时退回到 shutil.copy2。
+
+        Args:
+            src: 源文件路径
+            dst: 目标文件路径
+
+        Returns:
+            目标文件路径
+        """
+        if hasattr(os, 'copy_file_range'):
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    else:
+                        shutil.copystat(src, dst)
+                        return dst
+            except OSError:
+                pass
+        return shutil.copy2(src, dst)
+
+    @staticmethod
+    def _move_tree(src: Path, dst: Path):
+        """
+        移动目录树
+
+        优先使用 os.replace 原子重命名；跨文件系统时退回到逐文件硬链接
+        （无法硬链接时复制），完成后删除源目录。
+
+        Args:
+            src: 源目录
+            dst: 目标路径（不能已存在）
+        """
+        try:
+            os.replace(src, dst)
+        except OSError:
+            def link_or_copy(s, d):
+                try:
+                    os.link(s, d)
+                except OSError:
+                    SkillUploader._clone_file(s, d)
+
+            shutil.copytree(src, dst, copy_function=link_or_copy)
+            shutil.rmtree(src)
+
     def _generate_skill_id(self, skill_name: str) -> str:
         """生成唯一的 Skill ID"""
         timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
         unique_str = f"{skill_name}_{timestamp}"
-        hash_obj = hashlib.md5(unique_str.encode())
-        return f"skill-{hash_obj.hexdigest()[:12]}"
+        # blake2b 直接输出 6 字节摘要（12 位十六进制），格式与原 MD5 截断一致
+        hash_obj = hashlib.blake2b(unique_str.encode(), digest_size=6)
+        return f"skill-{hash_obj.hexdigest()}"
 
     def _generate_metadata(self, skill_dir: Path, skill_id: str,
-                           validation_result: Optional[Dict]) -> Dict:
-        """生成 Skill 元数据"""
+                           validation_result: Optional[Dict],
+                           content_hash: Optional[str] = None) -> Dict:
+        """生成 Skill 元数据（content_hash 已算过时直接传入，避免重复读文件）"""
         # 尝试从 SKILL.md 读取基本信息
         skill_md = skill_dir / "SKILL.md"
         skill_name = skill_dir.name
@@ -224,76 +473,206 @@ class SkillUploader:
                 content = skill_md.read_text(encoding='utf-8')
                 
                 # 提取名称
-                import re
-                name_match = re.search(r'name:\s*["\']?([^"\'\n]+)["\']?', content)
+                name_match = _NAME_RE.search(content)
                 if name_match:
                     skill_name = name_match.group(1).strip()
                 
                 # 提取描述
-                desc_match = re.search(r'description:\s*["\']([^"\']+)', content)
+                desc_match = _DESC_RE.search(content)
                 if desc_match:
                     description = desc_match.group(1).strip()
                     
             except Exception as e:
                 print(f"  ⚠ 无法读取 SKILL.md: {e}")
 
-        # 计算文件统计
+        # 计算文件统计和内容哈希
         file_stats = self._calculate_file_stats(skill_dir)
+        if content_hash is None:
+            content_hash = self._content_hash(skill_dir)
 
+        uploaded_at = datetime.now()
         metadata = {
             "skill_id": skill_id,
             "skill_name": skill_name,
             "description": description,
             "author": author,
             "version": version,
-            "uploaded_at": datetime.now().isoformat(),
+            "uploaded_at": uploaded_at.isoformat(),
+            "uploaded_at_ms": int(uploaded_at.timestamp() * 1000),
             "file_stats": file_stats,
+            "content_hash": content_hash,
             "validation": validation_result,
             "status": "active"
         }
 
         return metadata
 
+    def _find_duplicate(self, content_hash: str) -> Optional[Dict]:
+        """
+        按内容哈希查找已上传的 Skill
+
+        Returns:
+            之前的上传记录；未找到或对应 Skill 已被删除时返回 None
+        """
+        link = self.hash_index_dir / content_hash
+        try:
+            skill_id = os.readlink(link)
+        except OSError:
+            return None
+
+        upload_record = self.upload_dir / f"upload-{skill_id}.json"
+        try:
+            if (self.skills_dir / skill_id).is_dir():
+                return orjson.loads(upload_record.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            pass
+
+        # Skill 已被删除或记录损坏，移除失效的索引
+        try:
+            link.unlink()
+        except OSError:
+            pass
+        return None
+
+    def _index_content_hash(self, content_hash: str, skill_id: str):
+        """记录内容哈希到 skill_id 的映射（已有映射时保留先上传的那个）"""
+        try:
+            os.symlink(skill_id, self.hash_index_dir / content_hash)
+        except FileExistsError:
+            pass
+        except OSError as e:
+            print(f"  ⚠ 无法写入内容索引: {e}")
+
+    @staticmethod
+    def _content_hash(skill_dir: Path) -> str:
+        """
+        计算 Skill 内容哈希（BLAKE2b），用于完整性校验和重复上传检测
+
+        按相对路径排序逐个哈希文件内容，与文件修改时间和目录位置无关。
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for item in sorted(skill_dir.rglob('*')):
+            if not item.is_file():
+                continue
+            with open(item, 'rb') as f:
+                file_hash = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16))
+            h.update(item.relative_to(skill_dir).as_posix().encode('utf-8'))
+            h.update(b'\0')
+            h.update(file_hash.digest())
+        return h.hexdigest()
+
     def _calculate_file_stats(self, skill_dir: Path) -> Dict:
-        """计算文件统计信息"""
-        stats = {
-            "total_files": 0,
-            "total_size_bytes": 0,
-            "file_types": {},
-            "directories": []
-        }
+        """
+        计算文件统计信息
 
-        for item in skill_dir.rglob('*'):
-            if item.is_file():
-                stats["total_files"] += 1
-                stats["total_size_bytes"] += item.stat().st_size
-                
-                # 统计文件类型
-                ext = item.suffix.lower()
-                if ext:
-                    stats["file_types"][ext] = stats["file_types"].get(ext, 0) + 1
-            elif item.is_dir() and item != skill_dir:
-                stats["directories"].append(item.name)
+        用 os.scandir 遍历目录树：文件类型来自目录项本身，每个文件只需
+        一次 stat 获取大小（rglob + is_file + stat 每个文件要两三次）。
+        """
+        total_files = 0
+        total_size = 0
+        file_types = Counter()
+        directories = []
+
+        pending = [str(skill_dir)]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        total_files += 1
+                        total_size += entry.stat().st_size
+
+                        # 统计文件类型（与 Path.suffix 规则一致）
+                        name = entry.name
+                        dot = name.rfind('.')
+                        if 0 < dot < len(name) - 1:
+                            file_types[name[dot:].lower()] += 1
+                    elif entry.is_dir():
+                        directories.append(entry.name)
+                        # 与 rglob 一致：不进入符号链接目录
+                        if not entry.is_symlink():
+                            pending.append(entry.path)
+
+        return {
+            "total_files": total_files,
+            "total_size_bytes": total_size,
+            "file_types": dict(file_types),
+            "directories": directories
+        }
 
-        return stats
+    # 目录 mtime 的时间戳粒度可能粗于纳秒：缓存构建时距目录修改不足该值时不信任缓存
+    _MTIME_SLACK_NS = 1_000_000_000
 
     def list_uploaded_skills(self) -> List[Dict]:
-        """列出已上传的 Skills"""
+        """
+        列出已上传的 Skills
+
+        skills 目录的修改时间未变（没有新增或删除 Skill）时直接返回上次的列表；
+        否则重新扫描目录，未修改的元数据文件复用已解析的结果。返回的列表和
+        数据是缓存中的共享对象，调用方只应读取。
+        """
+        with self._list_lock:
+            dir_mtime = self.skills_dir.stat().st_mtime_ns
+            cached_list = self._list_cache
+            if (cached_list is not None and cached_list[0] == dir_mtime
+                    and cached_list[1] - dir_mtime >= self._MTIME_SLACK_NS):
+                return cached_list[2]
+
+            built_at = time.time_ns()
+            skills = self._scan_uploaded_skills()
+            self._list_cache = (dir_mtime, built_at, skills)
+            return skills
+
+    def _scan_uploaded_skills(self) -> List[Dict]:
+        """扫描 skills 目录，读取每个 Skill 的元数据"""
         skills = []
-        
-        # 遍历 skills 目录
-        for skill_id_dir in self.skills_dir.iterdir():
-            if skill_id_dir.is_dir():
-                metadata_file = self.skills_dir / f"{skill_id_dir.name}.json"
-                if metadata_file.exists():
-                    try:
-                        metadata = json.loads(metadata_file.read_text(encoding='utf-8'))
-                        skills.append(metadata)
-                    except Exception as e:
-                        print(f"  ⚠ 无法读取元数据: {metadata_file.name}")
-        
+
+        # 单次遍历 skills 目录，记录子目录和元数据文件
+        skill_dirs = []
+        metadata_files = {}
+        with os.scandir(self.skills_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    skill_dirs.append(entry.name)
+                elif entry.name.endswith('.json'):
+                    metadata_files[entry.name] = entry
+
+        fresh_cache = {}
+        for skill_dir_name in skill_dirs:
+            entry = metadata_files.get(f"{skill_dir_name}.json")
+            if entry is None:
+                continue
+
+            # 元数据文件未修改时复用已解析的结果
+            try:
+                st = entry.stat()
+                key = (st.st_mtime_ns, st.st_size)
+                cached = self._metadata_cache.get(entry.path)
+                if cached is None or cached[0] != key:
+                    with open(entry.path, 'rb') as f:
+                        cached = (key, self._check_metadata(orjson.loads(f.read())))
+                fresh_cache[entry.path] = cached
+                skills.append(cached[1])
+            except Exception as e:
+                print(f"  ⚠ 无法读取元数据: {entry.name} ({e})")
+
+        self._metadata_cache = fresh_cache
         return skills
 
+    @staticmethod
+    def _check_metadata(metadata) -> Dict:
+        """
+        校验元数据结构
+
+        Raises:
+            ValueError: 不是对象，或缺少必需字段、字段类型不符
+        """
+        if not isinstance(metadata, dict):
+            raise ValueError("元数据不是 JSON 对象")
+        for field, field_type in _METADATA_SCHEMA.items():
+            if not isinstance(metadata.get(field), field_type):
+                raise ValueError(f"字段 {field} 缺失或类型错误")
+        return metadata
+
     def get_upload_status(self, skill_id: str) -> Optional[Dict]:
         """获取上传状态"""
         upload_record = self.upload_dir / f"upload-{skill_id}.json"
@@ -6,13 +6,17 @@ Skill 规范验证器
 检测硬编码依赖、安全风险和规范合规性
 """
 
-import json
+import bisect
+import mmap
 import re
 import os
-import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 import hashlib
 
 
@@ -32,10 +36,10 @@ class SkillValidator:
         r'https?://localhost:\d+',
         r'https?://127\.0\.0\.1:\d+',
         r'https?://192\.168\.\d+\.\d+:\d+',
-        r'file:///.*',
+        r'file:///\S*',
         r'/home/\w+/',
         r'/Users/\w+/',
-        r'C:\\Users\\\\w+\\',
+        r'C:\\Users\\\w+\\',
         
         # 固定外部 URL（允许的域名白名单）
         r'https?://api\.openai\.com',
@@ -58,6 +62,91 @@ class SkillValidator:
         r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d+\b',
     ]
 
+    # 预编译的检测模式（类加载时编译一次，所有实例和线程共享）
+    _HARDCODED_REGEXES = [re.compile(p, re.IGNORECASE) for p in HARDCODED_PATTERNS]
+
+    # 每个模式命中时必然包含的小写字面量（与 HARDCODED_PATTERNS 一一对应）。
+    # ASCII 行先做子串判断，不含字面量的模式无需运行正则
+    HARDCODED_LITERALS = [
+        '://localhost:',
+        '://127.0.0.1:',
+        '://192.168.',
+        'file:///',
+        '/home/',
+        '/users/',
+        'c:\\users\\',
+        '://api.openai.com',
+        '://api.anthropic.com',
+        '://generativelanguage.googleapis.com',
+        '://github.com',
+        '://coze.cn',
+        '://10.',
+        '://172.',
+        'api_key',
+        'secret',
+        'token',
+        'password',
+        ':',
+    ]
+
+    # 每个模式对应的 (严重程度, 描述, 修复建议)，与 HARDCODED_PATTERNS 一一对应。
+    # None 表示该项取决于匹配文本，由 _determine_severity / _describe_issue / _suggest_fix 计算
+    _LOCAL_DESC = "检测到本地地址硬编码，这将导致服务无法在其他环境运行"
+    _INTRANET_DESC = "检测到内网地址硬编码，服务将无法公网访问"
+    _SECRET_DESC = "检测到疑似硬编码的密钥信息，存在严重安全风险"
+    _HOST_FIX = "建议使用环境变量或配置文件，如: os.getenv('API_HOST')"
+    _SECRET_FIX = "建议从环境变量读取，如: os.getenv('API_KEY')"
+    _PATH_FIX = "建议使用相对路径或配置文件"
+    HARDCODED_ISSUE_META = [
+        ('critical', _LOCAL_DESC, _HOST_FIX),
+        ('critical', _LOCAL_DESC, _HOST_FIX),
+        ('critical', _INTRANET_DESC, _HOST_FIX),
+        ('low', "检测到本地文件路径硬编码，跨平台兼容性差", _PATH_FIX),
+        ('low', None, _PATH_FIX),
+        ('low', None, _PATH_FIX),
+        ('low', None, _PATH_FIX),
+        # 白名单域名，不会被报告
+        (None, None, None),
+        (None, None, None),
+        (None, None, None),
+        (None, None, None),
+        (None, None, None),
+        ('critical', _INTRANET_DESC, _HOST_FIX),
+        ('critical', _INTRANET_DESC, _HOST_FIX),
+        ('critical', _SECRET_DESC, _SECRET_FIX),
+        ('critical', _SECRET_DESC, _SECRET_FIX),
+        ('critical', _SECRET_DESC, _SECRET_FIX),
+        # 密码：较短的值多为示例，严重程度按长度判断
+        (None, _SECRET_DESC, _SECRET_FIX),
+        # IP:端口：内网地址为 critical，其余为 high
+        (None, None, None),
+    ]
+
+    _HARDCODED_CHECKS = list(zip(HARDCODED_LITERALS, _HARDCODED_REGEXES, HARDCODED_ISSUE_META))
+
+    # 所有模式的并集：整个文件只扫描一遍，定位可能命中的行
+    _HARDCODED_UNION_RE = re.compile(
+        '|'.join(f'(?:{p})' for p in HARDCODED_PATTERNS), re.IGNORECASE
+    )
+
+    # 上述模式的字节版本，直接在 mmap 映射或原始字节上匹配，省去 UTF-8 解码。
+    # 仅用于不含 _BYTES_UNSAFE_RE 字节的文件，此时字节与字符串语义一致
+    _HARDCODED_BYTES_RE = re.compile(
+        b'|'.join(b'(?:' + p.encode() + b')' for p in HARDCODED_PATTERNS),
+        re.IGNORECASE
+    )
+    _HARDCODED_BYTES_CHECKS = [
+        (literal.encode(), re.compile(p.encode(), re.IGNORECASE), meta)
+        for literal, p, meta in zip(HARDCODED_LITERALS, HARDCODED_PATTERNS, HARDCODED_ISSUE_META)
+    ]
+
+    # 字节匹配与逐行文本扫描结果可能不同的字节：非 ASCII（\w、忽略大小写的
+    # Unicode 语义）、\r（文本模式按换行处理）、\x1c-\x1f（字符串 \s 匹配，字节 \s 不匹配）
+    _BYTES_UNSAFE_RE = re.compile(rb'[\x80-\xff\r\x1c-\x1f]')
+
+    # 固定 IP:端口（用于判断严重程度）
+    _IP_PORT_RE = re.compile(r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d+')
+
     # 允许的域名白名单
     ALLOWED_DOMAINS = [
         'api.openai.com',
@@ -71,6 +160,7 @@ class SkillValidator:
         'googleapis.com',
         'example.com',  # 示例域名
     ]
+    _ALLOWED_DOMAIN_RE = re.compile('|'.join(re.escape(d) for d in ALLOWED_DOMAINS))
 
     # 危险导入检测
     DANGEROUS_IMPORTS = [
@@ -84,7 +174,38 @@ class SkillValidator:
         'yaml.load(',
     ]
 
-    def __init__(self):
+    # 所有危险调用的并集，整文件检索一次，未命中即可跳过逐行扫描
+    _DANGEROUS_RE = re.compile('|'.join(re.escape(p) for p in DANGEROUS_IMPORTS))
+    _DANGEROUS_BYTES = [p.encode() for p in DANGEROUS_IMPORTS]
+    _DANGEROUS_BYTES_RE = re.compile(b'|'.join(re.escape(p) for p in _DANGEROUS_BYTES))
+
+    # 需要扫描的文件类型
+    SCAN_EXTENSIONS = {'.py', '.md', '.txt', '.json', '.yaml', '.yml'}
+
+    # 不扫描的目录（版本库、缓存、第三方依赖）
+    SKIP_DIRS = {'.git', '__pycache__', 'node_modules'}
+
+    # 启用 parallel_scan、文件数达到该值且有多个 CPU 时，逐文件扫描分发到进程池（正则匹配持有 GIL）
+    PARALLEL_MIN_FILES = 64
+    MAX_SCAN_WORKERS = 8
+
+    # 同一文件中同一模式最多逐条报告的问题数，超出部分合并为一条汇总
+    MAX_ISSUES_PER_PATTERN = 50
+
+    # 脚本语法检查结果缓存：源码摘要 -> None 或 (行号, 错误信息)，所有实例共享。
+    # 同一内容的脚本（重复上传、重新验证）无需再次编译
+    SYNTAX_CACHE_SIZE = 1024
+    _syntax_cache: "OrderedDict[bytes, Optional[Tuple[int, str]]]" = OrderedDict()
+    _syntax_lock = threading.Lock()
+
+    def __init__(self, parallel_scan: bool = False):
+        """
+        Args:
+            parallel_scan: 是否允许使用进程池扫描文件。仅供命令行等独立进程使用；
+                Web 服务器中不启用（请求线程中 fork 会复制 gevent 补丁后的状态，
+                且并发上传会各自创建进程池）
+        """
+        self.parallel_scan = parallel_scan
         self.validation_results = {
             "overall_status": "pending",
             "compliance_score": 0,
@@ -101,19 +222,28 @@ class SkillValidator:
             "validated_at": None
         }
 
-    def validate_skill(self, skill_path: str) -> Dict:
+        # 当前验证阶段开始的时间，同一阶段记录的错误和警告共用（见 _timestamp）
+        self._phase_timestamp: Optional[str] = None
+
+        # 进度输出先缓存，每个阶段结束时一次写出（见 _log）
+        self._verbose = True
+        self._log_lines: List[str] = []
+
+    def validate_skill(self, skill_path: str, verbose: bool = True) -> Dict:
         """
         验证 Skill 包
 
         Args:
             skill_path: Skill 包路径（可以是文件夹或 zip 文件）
+            verbose: 是否输出进度信息（--json 模式下关闭，保证输出只有 JSON）
 
         Returns:
             验证结果字典
         """
-        print(f"\n{'='*80}")
-        print(f"开始验证 Skill: {skill_path}")
-        print(f"{'='*80}")
+        self._verbose = verbose
+        self._log(f"\n{'='*80}")
+        self._log(f"开始验证 Skill: {skill_path}")
+        self._log(f"{'='*80}")
 
         skill_dir = Path(skill_path)
 
@@ -129,13 +259,21 @@ class SkillValidator:
             self._finalize_validation()
             return self.validation_results
 
-        # 执行各项验证
-        self._check_file_structure(skill_dir)
-        self._validate_skill_md(skill_dir)
-        self._scan_hardcoded_dependencies(skill_dir)
-        self._detect_security_risks(skill_dir)
-        self._validate_scripts(skill_dir)
-        self._validate_references(skill_dir)
+        # 执行各项验证（目录树只遍历一次，两项扫描共用文件列表）
+        scan_files = self._collect_scan_files(skill_dir)
+        phases = [
+            (self._check_file_structure, (skill_dir,)),
+            (self._validate_skill_md, (skill_dir,)),
+            (self._scan_hardcoded_dependencies, (skill_dir, scan_files)),
+            (self._detect_security_risks, (skill_dir, scan_files)),
+            (self._validate_scripts, (skill_dir,)),
+            (self._validate_references, (skill_dir,)),
+        ]
+        for phase, args in phases:
+            self._phase_timestamp = datetime.now().isoformat()
+            phase(*args)
+            self._flush_log()
+        self._phase_timestamp = None
 
         # 计算合规分数
         self._calculate_compliance_score()
@@ -147,7 +285,7 @@ class SkillValidator:
 
     def _check_file_structure(self, skill_dir: Path) -> None:
         """检查文件结构是否符合规范"""
-        print("\n[1/6] 检查文件结构...")
+        self._log("\n[1/6] 检查文件结构...")
 
         results = {}
         self.validation_results["total_checks"] += len(self.REQUIRED_FILES)
@@ -164,17 +302,17 @@ class SkillValidator:
 
             if exists:
                 self.validation_results["passed_checks"] += 1
-                print(f"  ✓ {required}")
+                self._log(f"  ✓ {required}")
             else:
                 self.validation_results["failed_checks"] += 1
                 self._add_warning("文件缺失", f"缺少必需文件/目录: {required}")
-                print(f"  ✗ {required} (缺失)")
+                self._log(f"  ✗ {required} (缺失)")
 
         self.validation_results["file_structure_check"] = results
 
     def _validate_skill_md(self, skill_dir: Path) -> None:
         """验证 SKILL.md 文件内容"""
-        print("\n[2/6] 验证 SKILL.md 文件...")
+        self._log("\n[2/6] 验证 SKILL.md 文件...")
 
         skill_md_path = skill_dir / "SKILL.md"
         if not skill_md_path.exists():
@@ -205,87 +343,216 @@ class SkillValidator:
 
             if found:
                 self.validation_results["passed_checks"] += 1
-                print(f"  ✓ 包含: {field}")
+                self._log(f"  ✓ 包含: {field}")
             else:
                 self.validation_results["failed_checks"] += 1
                 self._add_warning("字段缺失", f"SKILL.md 缺少必需字段: {field}")
-                print(f"  ✗ 缺少: {field}")
+                self._log(f"  ✗ 缺少: {field}")
 
         # 检查文档完整性
         if len(content) < 100:
             self._add_warning("文档过短", "SKILL.md 内容过少，可能不完整")
-            print(f"  ⚠ 文档内容过短 ({len(content)} 字符)")
+            self._log(f"  ⚠ 文档内容过短 ({len(content)} 字符)")
 
         validation_result["content_length"] = len(content)
         self.validation_results["content_validation"] = validation_result
 
-    def _scan_hardcoded_dependencies(self, skill_dir: Path) -> None:
-        """扫描硬编码依赖"""
-        print("\n[3/6] 扫描硬编码依赖...")
+    def _collect_scan_files(self, skill_dir: Path) -> List[Path]:
+        """
+        单次遍历目录树，收集需要扫描的文件
 
-        # 需要扫描的文件类型
-        file_extensions = ['.py', '.md', '.txt', '.json', '.yaml', '.yml']
+        os.walk 只按目录项类型区分文件和目录，不对每个文件 stat；
+        跳过 SKIP_DIRS 中的目录，不跟随目录符号链接。
+        """
+        files = []
+        for root, dirnames, filenames in os.walk(skill_dir):
+            dirnames[:] = sorted(d for d in dirnames if d not in self.SKIP_DIRS)
+            root_path = Path(root)
+            for name in sorted(filenames):
+                if os.path.splitext(name)[1] in self.SCAN_EXTENSIONS:
+                    files.append(root_path / name)
+        return files
+
+    def _scan_hardcoded_dependencies(self, skill_dir: Path,
+                                     scan_files: Optional[List[Path]] = None) -> None:
+        """扫描硬编码依赖"""
+        self._log("\n[3/6] 扫描硬编码依赖...")
 
         # 扫描所有相关文件
-        all_files = []
-        for ext in file_extensions:
-            all_files.extend(skill_dir.rglob(f"*{ext}"))
+        all_files = scan_files if scan_files is not None else self._collect_scan_files(skill_dir)
 
-        print(f"  扫描 {len(all_files)} 个文件...")
+        self._log(f"  扫描 {len(all_files)} 个文件...")
 
         hardcoded_issues = []
 
-        for file_path in all_files:
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                self._scan_file_for_hardcoded(content, file_path, hardcoded_issues)
-            except Exception as e:
-                print(f"  ⚠ 无法读取文件: {file_path.name} ({e})")
+        for file_path, (issues, error) in zip(all_files, self._map_files(self._hardcoded_file_task, all_files, skill_dir)):
+            if error:
+                self._log(f"  ⚠ 无法读取文件: {file_path.name} ({error})")
+            hardcoded_issues.extend(issues)
 
         self.validation_results["hardcoded_dependencies"] = hardcoded_issues
 
         if hardcoded_issues:
             self.validation_results["critical_issues"].extend(hardcoded_issues)
-            print(f"  ✗ 发现 {len(hardcoded_issues)} 个硬编码依赖问题")
+            self._log(f"  ✗ 发现 {len(hardcoded_issues)} 个硬编码依赖问题")
             for issue in hardcoded_issues[:5]:  # 只显示前5个
-                print(f"    • {issue['type']}: {issue['pattern']} in {issue['file']}")
+                self._log(f"    • {issue['type']}: {issue['pattern']} in {issue['file']}")
             if len(hardcoded_issues) > 5:
-                print(f"    • ... 还有 {len(hardcoded_issues) - 5} 个问题")
+                self._log(f"    • ... 还有 {len(hardcoded_issues) - 5} 个问题")
         else:
-            print(f"  ✓ 未发现硬编码依赖")
+            self._log(f"  ✓ 未发现硬编码依赖")
+
+    def _map_files(self, task, files: List[Path],
+                   skill_dir: Path) -> List[Tuple[List[Dict], Optional[str]]]:
+        """
+        对每个文件执行扫描任务 task(file_path, skill_dir)，结果顺序与 files 一致
+
+        启用 parallel_scan 且文件较多、有多个 CPU 时使用进程池，否则在当前线程顺序执行
+        （进程启动开销高于少量文件的扫描时间）。
+        """
+        cpus = os.cpu_count() or 1
+        if not self.parallel_scan or len(files) < self.PARALLEL_MIN_FILES or cpus < 2:
+            return [task(path, skill_dir) for path in files]
+
+        with ProcessPoolExecutor(max_workers=min(cpus, self.MAX_SCAN_WORKERS)) as pool:
+            return list(pool.map(task, files, repeat(skill_dir), chunksize=16))
+
+    @staticmethod
+    def _hardcoded_file_task(file_path: Path, skill_dir: Path) -> Tuple[List[Dict], Optional[str]]:
+        """扫描单个文件的硬编码依赖（可在子进程中执行），返回 (问题列表, 读取错误)"""
+        issues = []
+        try:
+            validator = SkillValidator()
+            content = validator._load_for_scan(file_path, validator._HARDCODED_BYTES_RE)
+            if content is not None:
+                validator._scan_file_for_hardcoded(content, file_path, issues,
+                                                   rel_file=file_path.relative_to(skill_dir).as_posix())
+        except Exception as e:
+            return issues, str(e)
+        return issues, None
+
+    @staticmethod
+    def _dangerous_file_task(file_path: Path, skill_dir: Path) -> Tuple[List[Dict], Optional[str]]:
+        """检测单个 Python 文件的危险代码（可在子进程中执行），返回 (问题列表, 读取错误)"""
+        issues = []
+        try:
+            validator = SkillValidator()
+            content = validator._load_for_scan(file_path, validator._DANGEROUS_BYTES_RE)
+            if content is not None:
+                validator._detect_dangerous_code(content, file_path, issues,
+                                                 rel_file=file_path.relative_to(skill_dir).as_posix())
+        except Exception as e:
+            return issues, str(e)
+        return issues, None
+
+    def _load_for_scan(self, file_path: Path, prefilter: re.Pattern) -> Union[str, bytes, None]:
+        """
+        读取待扫描的文件内容
 
-    def _scan_file_for_hardcoded(self, content: str, file_path: Path, 
-                                  issues: List[Dict]) -> None:
-        """扫描单个文件的硬编码依赖"""
-        lines = content.split('\n')
+        文件通过内存映射检查：不含 _BYTES_UNSAFE_RE 字节的文件先在映射上运行
+        字节预筛 prefilter，未命中返回 None（无需读取），命中则直接返回字节，
+        不做 UTF-8 解码。其他文件按文本读取，与逐行扫描语义一致。
 
-        for line_num, line in enumerate(lines, 1):
-            for pattern in self.HARDCODED_PATTERNS:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
-                for match in matches:
+        Returns:
+            bytes 或 str 内容；空文件或预筛未命中时返回 None
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if not self._BYTES_UNSAFE_RE.search(mm):
+                    if prefilter.search(mm) is None:
+                        return None
+                    return mm[:]
+        return file_path.read_text(encoding='utf-8')
+
+    def _scan_file_for_hardcoded(self, content: Union[str, bytes], file_path: Path,
+                                  issues: List[Dict], rel_file: Optional[str] = None) -> None:
+        """
+        扫描单个文件的硬编码依赖
+
+        先用所有模式的并集在整个文件上查找，只对命中的行逐个模式匹配，
+        未命中的行不进入 Python 循环。并集能匹配到的行是逐行匹配结果的超集
+        （\\s 可能跨行），逐行匹配保证结果与逐行扫描完全一致。
+        content 为字节时（见 _load_for_scan）使用字节版本的模式。
+        同一模式超过 MAX_ISSUES_PER_PATTERN 条时，其余匹配只计数并合并为一条汇总。
+        rel_file 为问题中报告的文件路径（相对 Skill 根目录），未提供时取文件上两级目录之后的部分。
+        """
+        if rel_file is None:
+            rel_file = str(file_path.relative_to(file_path.parent.parent))
+        if isinstance(content, str):
+            search, checks, newline = self._HARDCODED_UNION_RE.search, self._HARDCODED_CHECKS, '\n'
+        else:
+            search, checks, newline = self._HARDCODED_BYTES_RE.search, self._HARDCODED_BYTES_CHECKS, b'\n'
+        line_num = 1
+        counted_to = 0
+        pos = 0
+        reported = [0] * len(checks)
+        # 模式序号 -> [未列出的匹配数, 第一处的行号, 第一处的问题]
+        omitted = {}
+
+        while True:
+            hit = search(content, pos)
+            if hit is None:
+                break
+
+            line_start = content.rfind(newline, 0, hit.start()) + 1
+            line_end = content.find(newline, hit.start())
+            if line_end == -1:
+                line_end = len(content)
+            line_num += content.count(newline, counted_to, line_start)
+            counted_to = line_start
+            pos = line_end + 1
+
+            line = content[line_start:line_end]
+            # 非 ASCII 行在忽略大小写时可能有特殊折叠（如 ſ 与 s），不做字面量筛选
+            lowered = line.lower() if line.isascii() else None
+            for index, (literal, regex, (severity, description, suggestion)) in enumerate(checks):
+                if lowered is not None and literal not in lowered:
+                    continue
+                for match in regex.finditer(line):
                     matched_text = match.group()
+                    if not isinstance(matched_text, str):
+                        matched_text = matched_text.decode('ascii')
                     
                     # 检查是否在允许的域名白名单中
                     if self._is_allowed_domain(matched_text):
                         continue
 
+                    if reported[index] >= self.MAX_ISSUES_PER_PATTERN:
+                        if index in omitted:
+                            omitted[index][0] += 1
+                        else:
+                            omitted[index] = [1, line_num, matched_text]
+                        continue
+                    reported[index] += 1
+
                     issue = {
                         "type": "硬编码依赖",
-                        "severity": self._determine_severity(matched_text),
-                        "file": str(file_path.relative_to(file_path.parent.parent)),
+                        "severity": severity or self._determine_severity(matched_text),
+                        "file": rel_file,
                         "line": line_num,
                         "pattern": matched_text,
-                        "description": self._describe_issue(matched_text),
-                        "suggestion": self._suggest_fix(matched_text)
+                        "description": description or self._describe_issue(matched_text),
+                        "suggestion": suggestion or self._suggest_fix(matched_text)
                     }
                     issues.append(issue)
 
+        for index, (count, first_line, matched_text) in omitted.items():
+            severity, _, suggestion = checks[index][2]
+            issues.append({
+                "type": "硬编码依赖",
+                "severity": severity or self._determine_severity(matched_text),
+                "file": rel_file,
+                "line": first_line,
+                "pattern": matched_text,
+                "description": f"同类硬编码在本文件中还有 {count} 处（自第 {first_line} 行起），未逐条列出",
+                "suggestion": suggestion or self._suggest_fix(matched_text)
+            })
+
     def _is_allowed_domain(self, matched_text: str) -> bool:
-        """检查是否在允许的域名白名单中"""
-        for domain in self.ALLOWED_DOMAINS:
-            if domain in matched_text.lower():
-                return True
-        return False
+        """检查是否在允许的域名白名单中（所有域名合并为一个正则，一次查找）"""
+        return self._ALLOWED_DOMAIN_RE.search(matched_text.lower()) is not None
 
     def _determine_severity(self, matched_text: str) -> str:
         """确定问题严重程度"""
@@ -301,7 +568,7 @@ class SkillValidator:
                 return "critical"
         
         # 中危：固定 IP 地址
-        if re.match(r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d+', matched_text):
+        if self._IP_PORT_RE.match(matched_text):
             return "high"
         
         # 低危：其他硬编码
@@ -335,22 +602,23 @@ class SkillValidator:
         else:
             return "建议使用配置项或环境变量"
 
-    def _detect_security_risks(self, skill_dir: Path) -> None:
+    def _detect_security_risks(self, skill_dir: Path,
+                               scan_files: Optional[List[Path]] = None) -> None:
         """检测安全风险"""
-        print("\n[4/6] 检测安全风险...")
+        self._log("\n[4/6] 检测安全风险...")
 
         security_issues = []
 
         # 扫描 Python 文件
-        python_files = list(skill_dir.rglob("*.py"))
-        print(f"  扫描 {len(python_files)} 个 Python 文件...")
+        if scan_files is None:
+            scan_files = self._collect_scan_files(skill_dir)
+        python_files = [path for path in scan_files if path.suffix == '.py']
+        self._log(f"  扫描 {len(python_files)} 个 Python 文件...")
 
-        for file_path in python_files:
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                self._detect_dangerous_code(content, file_path, security_issues)
-            except Exception as e:
-                print(f"  ⚠ 无法读取文件: {file_path.name} ({e})")
+        for file_path, (issues, error) in zip(python_files, self._map_files(self._dangerous_file_task, python_files, skill_dir)):
+            if error:
+                self._log(f"  ⚠ 无法读取文件: {file_path.name} ({error})")
+            security_issues.extend(issues)
 
         self.validation_results["security_risks"] = security_issues
 
@@ -358,36 +626,60 @@ class SkillValidator:
             self.validation_results["critical_issues"].extend([
                 i for i in security_issues if i.get("severity") == "critical"
             ])
-            print(f"  ✗ 发现 {len(security_issues)} 个安全问题")
+            self._log(f"  ✗ 发现 {len(security_issues)} 个安全问题")
             for issue in security_issues[:5]:
-                print(f"    • {issue['type']}: {issue['pattern']} in {issue['file']}")
+                self._log(f"    • {issue['type']}: {issue['pattern']} in {issue['file']}")
             if len(security_issues) > 5:
-                print(f"    • ... 还有 {len(security_issues) - 5} 个问题")
+                self._log(f"    • ... 还有 {len(security_issues) - 5} 个问题")
         else:
-            print(f"  ✓ 未发现安全风险")
+            self._log(f"  ✓ 未发现安全风险")
 
-    def _detect_dangerous_code(self, content: str, file_path: Path, 
-                                issues: List[Dict]) -> None:
-        """检测危险代码"""
-        lines = content.split('\n')
+    def _detect_dangerous_code(self, content: Union[str, bytes], file_path: Path,
+                                issues: List[Dict], rel_file: Optional[str] = None) -> None:
+        """
+        检测危险代码
 
-        for line_num, line in enumerate(lines, 1):
-            for pattern in self.DANGEROUS_IMPORTS:
-                if pattern in line:
-                    issue = {
-                        "type": "安全风险",
-                        "severity": "high" if pattern in ["eval(", "exec(", "subprocess.call", "os.system"] else "medium",
-                        "file": str(file_path.relative_to(file_path.parent.parent)),
-                        "line": line_num,
-                        "pattern": pattern,
-                        "description": f"检测到危险函数使用: {pattern}",
-                        "suggestion": "请确保使用环境变量配置或经过严格的输入验证"
-                    }
-                    issues.append(issue)
+        每个危险调用在整个文件上用 str.find 查找，命中后再用换行位置二分
+        得到行号（同一行同一调用只报告一次），按行号、模式顺序输出。
+        rel_file 为问题中报告的文件路径（相对 Skill 根目录），未提供时取文件上两级目录之后的部分。
+        """
+        if rel_file is None:
+            rel_file = str(file_path.relative_to(file_path.parent.parent))
+        if isinstance(content, str):
+            prefilter, needles, newline = self._DANGEROUS_RE, self.DANGEROUS_IMPORTS, '\n'
+        else:
+            prefilter, needles, newline = self._DANGEROUS_BYTES_RE, self._DANGEROUS_BYTES, b'\n'
+        if not prefilter.search(content):
+            return
+
+        newlines = [m.start() for m in re.finditer(newline, content)]
+        hits = []
+
+        for pattern_index, pattern in enumerate(needles):
+            idx = content.find(pattern)
+            while idx != -1:
+                line_index = bisect.bisect_right(newlines, idx)
+                hits.append((line_index + 1, pattern_index))
+                if line_index == len(newlines):
+                    break
+                idx = content.find(pattern, newlines[line_index] + 1)
+
+        for line_num, pattern_index in sorted(hits):
+            pattern = self.DANGEROUS_IMPORTS[pattern_index]
+            issue = {
+                "type": "安全风险",
+                "severity": "high" if pattern in ["eval(", "exec(", "subprocess.call", "os.system"] else "medium",
+                "file": rel_file,
+                "line": line_num,
+                "pattern": pattern,
+                "description": f"检测到危险函数使用: {pattern}",
+                "suggestion": "请确保使用环境变量配置或经过严格的输入验证"
+            }
+            issues.append(issue)
 
     def _validate_scripts(self, skill_dir: Path) -> None:
         """验证 scripts 目录"""
-        print("\n[5/6] 验证 scripts 目录...")
+        self._log("\n[5/6] 验证 scripts 目录...")
 
         scripts_dir = skill_dir / "scripts"
         if not scripts_dir.exists():
@@ -395,19 +687,20 @@ class SkillValidator:
             return
 
         python_files = list(scripts_dir.glob("*.py"))
-        print(f"  发现 {len(python_files)} 个 Python 脚本")
+        self._log(f"  发现 {len(python_files)} 个 Python 脚本")
 
         # 检查每个脚本的基本语法
         syntax_errors = 0
         for py_file in python_files:
-            try:
-                compile(py_file.read_text(encoding='utf-8'), str(py_file), 'exec')
-                print(f"  ✓ {py_file.name}")
-            except SyntaxError as e:
+            error = self._check_syntax(py_file.read_text(encoding='utf-8'), str(py_file))
+            if error is None:
+                self._log(f"  ✓ {py_file.name}")
+            else:
                 syntax_errors += 1
+                lineno, msg = error
                 self._add_error("语法错误", 
-                    f"{py_file.name} 第 {e.lineno} 行: {e.msg}")
-                print(f"  ✗ {py_file.name}: 语法错误")
+                    f"{py_file.name} 第 {lineno} 行: {msg}")
+                self._log(f"  ✗ {py_file.name}: 语法错误")
 
         if syntax_errors > 0:
             self.validation_results["critical_issues"].append({
@@ -415,9 +708,37 @@ class SkillValidator:
                 "count": syntax_errors
             })
 
+    def _check_syntax(self, source: str, filename: str) -> Optional[Tuple[int, str]]:
+        """
+        检查 Python 源码语法，按内容摘要缓存结果
+
+        仍使用 compile 而不是 ast.parse：return/break 位置错误等
+        在编译阶段才报告的 SyntaxError 也需要检出。
+
+        Returns:
+            语法正确返回 None，否则返回 (行号, 错误信息)
+        """
+        key = hashlib.blake2b(source.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with self._syntax_lock:
+            if key in self._syntax_cache:
+                self._syntax_cache.move_to_end(key)
+                return self._syntax_cache[key]
+
+        try:
+            compile(source, filename, 'exec')
+            result = None
+        except SyntaxError as e:
+            result = (e.lineno, e.msg)
+
+        with self._syntax_lock:
+            self._syntax_cache[key] = result
+            if len(self._syntax_cache) > self.SYNTAX_CACHE_SIZE:
+                self._syntax_cache.popitem(last=False)
+        return result
+
     def _validate_references(self, skill_dir: Path) -> None:
         """验证 references 目录"""
-        print("\n[6/6] 验证 references 目录...")
+        self._log("\n[6/6] 验证 references 目录...")
 
         refs_dir = skill_dir / "references"
         if not refs_dir.exists():
@@ -425,11 +746,11 @@ class SkillValidator:
             return
 
         ref_files = list(refs_dir.glob("*"))
-        print(f"  发现 {len(ref_files)} 个参考文件")
+        self._log(f"  发现 {len(ref_files)} 个参考文件")
 
         for ref_file in ref_files:
             if ref_file.is_file():
-                print(f"  ✓ {ref_file.name}")
+                self._log(f"  ✓ {ref_file.name}")
 
     def _calculate_compliance_score(self) -> None:
         """计算合规分数"""
@@ -461,12 +782,16 @@ class SkillValidator:
         else:
             self.validation_results["overall_status"] = "rejected"
 
+    def _timestamp(self) -> str:
+        """错误/警告的时间戳：验证阶段内使用阶段开始时间，阶段外取当前时间"""
+        return self._phase_timestamp or datetime.now().isoformat()
+
     def _add_error(self, error_type: str, message: str) -> None:
         """添加错误"""
         self.validation_results["errors"].append({
             "type": error_type,
             "message": message,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self._timestamp()
         })
 
     def _add_warning(self, warning_type: str, message: str) -> None:
@@ -474,7 +799,7 @@ class SkillValidator:
         self.validation_results["warnings"].append({
             "type": warning_type,
             "message": message,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self._timestamp()
         })
 
     def _finalize_validation(self) -> None:
@@ -482,16 +807,27 @@ class SkillValidator:
         self.validation_results["validated_at"] = datetime.now().isoformat()
 
         # 打印总结
-        print(f"\n{'='*80}")
-        print(f"验证总结")
-        print(f"{'='*80}")
-        print(f"总体状态: {self._get_status_emoji()} {self.validation_results['overall_status'].upper()}")
-        print(f"合规分数: {self.validation_results['compliance_score']}/100")
-        print(f"检查项:   {self.validation_results['passed_checks']}/{self.validation_results['total_checks']} 通过")
-        print(f"错误:     {len(self.validation_results['errors'])}")
-        print(f"警告:     {len(self.validation_results['warnings'])}")
-        print(f"严重问题: {len(self.validation_results['critical_issues'])}")
-        print(f"{'='*80}\n")
+        self._log(f"\n{'='*80}")
+        self._log(f"验证总结")
+        self._log(f"{'='*80}")
+        self._log(f"总体状态: {self._get_status_emoji()} {self.validation_results['overall_status'].upper()}")
+        self._log(f"合规分数: {self.validation_results['compliance_score']}/100")
+        self._log(f"检查项:   {self.validation_results['passed_checks']}/{self.validation_results['total_checks']} 通过")
+        self._log(f"错误:     {len(self.validation_results['errors'])}")
+        self._log(f"警告:     {len(self.validation_results['warnings'])}")
+        self._log(f"严重问题: {len(self.validation_results['critical_issues'])}")
+        self._log(f"{'='*80}\n")
+        self._flush_log()
+
+    def _log(self, message: str = "") -> None:
+        """记录一行进度信息（缓存到阶段结束，由 _flush_log 一次写出）"""
+        self._log_lines.append(message)
+
+    def _flush_log(self) -> None:
+        """写出缓存的进度信息；verbose 关闭时直接丢弃"""
+        if self._log_lines and self._verbose:
+            print("\n".join(self._log_lines), flush=True)
+        self._log_lines.clear()
 
     def _get_status_emoji(self) -> str:
         """获取状态对应的 emoji"""
@@ -505,6 +841,17 @@ class SkillValidator:
         }
         return emojis.get(status, "❓")
 
+    # 报告中单个问题的格式
+    _ISSUE_TEMPLATE = """
+{idx}. **{type}** ({severity})
+   - 文件: `{file}`
+   - 行号: {line}
+   - 模式: `{pattern}`
+   - 描述: {description}
+   - 建议: {suggestion}
+
+"""
+
     def generate_report(self, output_file: Optional[str] = None) -> str:
         """
         生成验证报告
@@ -515,7 +862,7 @@ class SkillValidator:
         Returns:
             报告内容
         """
-        report = f"""
+        parts = [f"""
 # Skill 规范验证报告
 
 **验证时间**: {self.validation_results['validated_at']}
@@ -549,56 +896,42 @@ class SkillValidator:
 
 {len(self.validation_results['hardcoded_dependencies'])} 个硬编码依赖问题
 
-"""
+"""]
         # 添加硬编码依赖详情
         if self.validation_results['hardcoded_dependencies']:
-            report += "\n### 详情\n\n"
-            for idx, issue in enumerate(self.validation_results['hardcoded_dependencies'], 1):
-                report += f"""
-{idx}. **{issue['type']}** ({issue['severity']})
-   - 文件: `{issue['file']}`
-   - 行号: {issue['line']}
-   - 模式: `{issue['pattern']}`
-   - 描述: {issue['description']}
-   - 建议: {issue['suggestion']}
-
-"""
+            parts.append("\n### 详情\n\n")
+            parts.extend(self._ISSUE_TEMPLATE.format(idx=idx, **issue)
+                         for idx, issue in enumerate(self.validation_results['hardcoded_dependencies'], 1))
 
         # 添加安全风险
-        report += f"""
+        parts.append(f"""
 
 ## 安全风险
 
 {len(self.validation_results['security_risks'])} 个安全问题
 
-"""
+""")
         if self.validation_results['security_risks']:
-            report += "\n### 详情\n\n"
-            for idx, issue in enumerate(self.validation_results['security_risks'], 1):
-                report += f"""
-{idx}. **{issue['type']}** ({issue['severity']})
-   - 文件: `{issue['file']}`
-   - 行号: {issue['line']}
-   - 模式: `{issue['pattern']}`
-   - 描述: {issue['description']}
-   - 建议: {issue['suggestion']}
-
-"""
+            parts.append("\n### 详情\n\n")
+            parts.extend(self._ISSUE_TEMPLATE.format(idx=idx, **issue)
+                         for idx, issue in enumerate(self.validation_results['security_risks'], 1))
 
         # 添加错误和警告
-        report += "\n## 错误列表\n\n"
+        parts.append("\n## 错误列表\n\n")
         if self.validation_results['errors']:
-            for error in self.validation_results['errors']:
-                report += f"- {error['type']}: {error['message']}\n"
+            parts.extend(f"- {error['type']}: {error['message']}\n"
+                         for error in self.validation_results['errors'])
         else:
-            report += "无错误\n"
+            parts.append("无错误\n")
 
-        report += "\n## 警告列表\n\n"
+        parts.append("\n## 警告列表\n\n")
         if self.validation_results['warnings']:
-            for warning in self.validation_results['warnings']:
-                report += f"- {warning['type']}: {warning['message']}\n"
+            parts.extend(f"- {warning['type']}: {warning['message']}\n"
+                         for warning in self.validation_results['warnings'])
         else:
-            report += "无警告\n"
+            parts.append("无警告\n")
+
+        report = "".join(parts)
 
         # 保存到文件
         if output_file:
@@ -612,6 +945,8 @@ class SkillValidator:
 def main():
     """命令行入口"""
     import argparse
+    import json
+    import sys
 
     parser = argparse.ArgumentParser(description="Skill 规范验证器")
     parser.add_argument("skill_path", help="Skill 包路径")
@@ -620,11 +955,11 @@ def main():
 
     args = parser.parse_args()
 
-    # 创建验证器
-    validator = SkillValidator()
+    # 创建验证器（独立进程，可以使用进程池扫描）
+    validator = SkillValidator(parallel_scan=True)
 
     # 执行验证
-    results = validator.validate_skill(args.skill_path)
+    results = validator.validate_skill(args.skill_path, verbose=not args.json)
 
     # 输出结果
     if args.json:
@@ -7,13 +7,341 @@ Handles voting on skills and comments, including:
 - Vote type changes (upvote -> downvote and vice versa)
 - Automatic upvote for duplicate uploads
 """
-from typing import Dict, Optional, Tuple
+import asyncio
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
 from scripts.database.db import db
 
 
+# target_type -> (table, id column)
+TARGET_TABLES = {
+    'skill': ('skills', 'skill_id'),
+    'comment': ('comments', 'comment_id'),
+}
+
+VOTE_TYPES = ('upvote', 'downvote', 'cancel')
+
+# Agent lookup plus the agent's existing vote
+_LOOKUP_SQL = """
+    SELECT a.agent_id,
+           (SELECT v.vote_type FROM votes v
+            WHERE v.agent_id = a.agent_id
+              AND v.target_type = $2 AND v.target_id = $3) AS vote_type
+    FROM agents a
+    WHERE a.did = $1
+"""
+
+# Same lookup, locking the existing vote until the transaction commits
+_LOOKUP_LOCKED_SQL = """
+    SELECT a.agent_id,
+           (SELECT v.vote_type FROM votes v
+            WHERE v.agent_id = a.agent_id
+              AND v.target_type = $2 AND v.target_id = $3
+            FOR UPDATE) AS vote_type
+    FROM agents a
+    WHERE a.did = $1
+"""
+
+# Statements on the votes table: $1-$3 = agent_id, target_type, target_id,
+# $4 = new vote_type (old vote_type for the DELETE). Each only applies if the
+# vote is still in the state the lookup saw, and returns a row only if it
+# changed a vote.
+_INSERT_VOTE_SQL = """
+    INSERT INTO votes (agent_id, target_type, target_id, vote_type)
+    VALUES ($1, $2, $3, $4)
+    ON CONFLICT (agent_id, target_type, target_id) DO NOTHING
+    RETURNING 1
+"""
+
+_CHANGE_VOTE_SQL = """
+    UPDATE votes
+    SET vote_type = $4, updated_at = CURRENT_TIMESTAMP
+    WHERE agent_id = $1 AND target_type = $2 AND target_id = $3
+      AND vote_type <> $4
+    RETURNING 1
+"""
+
+_DELETE_VOTE_SQL = """
+    DELETE FROM votes
+    WHERE agent_id = $1 AND target_type = $2 AND target_id = $3
+      AND vote_type = $4
+    RETURNING 1
+"""
+
+# (old vote_type, new vote_type) -> (votes statement, upvotes change, downvotes change);
+# None stands for "no vote"
+VOTE_TRANSITIONS = {
+    (None, 'upvote'): (_INSERT_VOTE_SQL, 1, 0),
+    (None, 'downvote'): (_INSERT_VOTE_SQL, 0, 1),
+    # upvote -> downvote: decrease upvote, increase downvote, net change = -2
+    ('upvote', 'downvote'): (_CHANGE_VOTE_SQL, -1, 1),
+    # downvote -> upvote: decrease downvote, increase upvote, net change = +2
+    ('downvote', 'upvote'): (_CHANGE_VOTE_SQL, 1, -1),
+    ('upvote', None): (_DELETE_VOTE_SQL, -1, 0),
+    ('downvote', None): (_DELETE_VOTE_SQL, 0, -1),
+}
+
+
+def _counted_write_sql(table: str, id_column: str, vote_sql: str, upvotes: int, downvotes: int) -> str:
+    """
+    Build the single statement that changes a vote and the target's counters.
+
+    It always returns one row: applied (whether the vote changed) and the new
+    counts, which are NULL when the target does not exist.
+    """
+    counters = [f"vote_score = vote_score + ({upvotes - downvotes})"]
+    if upvotes:
+        counters.append(f"upvotes = upvotes + ({upvotes})")
+    if downvotes:
+        counters.append(f"downvotes = downvotes + ({downvotes})")
+
+    return f"""
+        WITH vote AS ({vote_sql}),
+        counted AS (
+            UPDATE {table}
+                SET {', '.join(counters)}
+                WHERE {id_column} = $3 AND EXISTS (SELECT 1 FROM vote)
+                RETURNING upvotes, downvotes, vote_score
+        )
+        SELECT EXISTS (SELECT 1 FROM vote) AS applied,
+               counted.upvotes, counted.downvotes, counted.vote_score
+        FROM (SELECT 1) AS one
+        LEFT JOIN counted ON TRUE
+    """
+
+
+# (target_type, transition) -> vote change + counter UPDATE, as one statement
+_COUNTED_WRITE_SQL = {
+    (target_type, transition): _counted_write_sql(table, id_column, *change)
+    for target_type, (table, id_column) in TARGET_TABLES.items()
+    for transition, change in VOTE_TRANSITIONS.items()
+}
+
+# target_type -> counter SELECT
+_GET_VOTES_SQL = {
+    target_type: f"SELECT upvotes, downvotes, vote_score FROM {table} WHERE {id_column} = $1"
+    for target_type, (table, id_column) in TARGET_TABLES.items()
+}
+
+# target_type -> counter SELECT for a list of targets ($1 = ids)
+_GET_VOTES_BULK_SQL = {
+    target_type: f"""
+        SELECT {id_column} AS target_id, upvotes, downvotes, vote_score
+        FROM {table}
+        WHERE {id_column} = ANY($1::varchar[])
+    """
+    for target_type, (table, id_column) in TARGET_TABLES.items()
+}
+
+# Batch of duplicate-upload upvotes ($1 = skill_ids, $2 = agent DIDs) in one
+# statement; agents that already voted on a skill keep their vote
+_DUPLICATE_UPVOTES_SQL = """
+    WITH uploads AS (
+        SELECT DISTINCT skill_id, did
+        FROM unnest($1::varchar[], $2::varchar[]) AS u(skill_id, did)
+    ),
+    inserted AS (
+        INSERT INTO votes (agent_id, target_type, target_id, vote_type)
+        SELECT a.agent_id, 'skill', u.skill_id, 'upvote'
+        FROM uploads u
+        JOIN agents a ON a.did = u.did
+        ON CONFLICT (agent_id, target_type, target_id) DO NOTHING
+        RETURNING target_id
+    ),
+    added AS (
+        SELECT target_id, COUNT(*)::int AS n
+        FROM inserted
+        GROUP BY target_id
+    )
+    UPDATE skills s
+    SET upvotes = s.upvotes + added.n,
+        vote_score = s.vote_score + added.n
+    FROM added
+    WHERE s.skill_id = added.target_id
+    RETURNING s.skill_id, s.upvotes, s.downvotes, s.vote_score
+"""
+
+# target_type -> batched counter UPDATE used by the aggregator
+_ADD_COUNTS_SQL = {
+    target_type: f"""
+        UPDATE {table}
+        SET upvotes = upvotes + $2,
+            downvotes = downvotes + $3,
+            vote_score = vote_score + $2 - $3
+        WHERE {id_column} = $1
+    """
+    for target_type, (table, id_column) in TARGET_TABLES.items()
+}
+
+
+class VoteCounterAggregator:
+    """
+    Coalesces vote counter changes and writes them to the database in batches.
+
+    Under a burst of votes on one target every vote would otherwise UPDATE the
+    same skills/comments row, serialising voters on its row lock. The
+    aggregator sums the changes per target in memory and a background task
+    applies them every flush_interval seconds (or as soon as max_pending
+    targets are waiting) with one executemany per table in one transaction.
+
+    Counts only cover this process, so run one aggregator per worker. Changes
+    still pending when the process dies are lost; call stop() on shutdown.
+    """
+
+    def __init__(self, flush_interval: float = 0.05, max_pending: int = 100):
+        """
+        Initialize the aggregator.
+
+        Args:
+            flush_interval: Seconds between flushes
+            max_pending: Number of targets with pending changes that triggers
+                an early flush
+        """
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._deltas: Dict[Tuple[str, str], List[int]] = {}
+        # Changes taken by the running flush; still pending until it commits
+        self._inflight: Dict[Tuple[str, str], List[int]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._flush_listeners: List[Callable[[List[Tuple[str, str]]], None]] = []
+
+    def add_flush_listener(self, listener: Callable[[List[Tuple[str, str]]], None]) -> None:
+        """Register a callback receiving the (target_type, target_id) keys written by each flush."""
+        self._flush_listeners.append(listener)
+
+    def add(self, target_type: str, target_id: str, upvotes: int, downvotes: int) -> None:
+        """Queue a change of the upvote and downvote counts of a target."""
+        delta = self._deltas.get((target_type, target_id))
+        if delta is None:
+            delta = self._deltas[(target_type, target_id)] = [0, 0]
+        delta[0] += upvotes
+        delta[1] += downvotes
+
+        if len(self._deltas) >= self.max_pending:
+            self._wakeup.set()
+
+    def pending(self, target_type: str, target_id: str) -> Tuple[int, int]:
+        """Return the (upvotes, downvotes) change not yet committed for a target."""
+        upvotes = downvotes = 0
+        for deltas in (self._deltas, self._inflight):
+            delta = deltas.get((target_type, target_id))
+            if delta:
+                upvotes += delta[0]
+                downvotes += delta[1]
+        return upvotes, downvotes
+
+    def start(self) -> None:
+        """Start the background flush task (call from the running event loop)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and write out everything still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        """Flush periodically until cancelled."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except Exception:
+                # Changes were re-queued by flush(); retry on the next round
+                pass
+
+    async def flush(self) -> int:
+        """
+        Write all pending changes to the database.
+
+        Returns:
+            int: Number of targets updated
+
+        Raises:
+            Exception: Any database error; the changes stay queued
+        """
+        async with self._flush_lock:
+            if not self._deltas:
+                return 0
+
+            # Keep the changes visible to pending() until the UPDATEs commit,
+            # otherwise counts read meanwhile would miss them
+            deltas = self._inflight = self._deltas
+            self._deltas = {}
+            batches: Dict[str, List[Tuple[str, int, int]]] = {}
+            for (target_type, target_id), (upvotes, downvotes) in deltas.items():
+                if upvotes or downvotes:
+                    batches.setdefault(target_type, []).append((target_id, upvotes, downvotes))
+
+            try:
+                async with db.get_connection() as conn:
+                    async with conn.transaction():
+                        for target_type, rows in batches.items():
+                            await conn.executemany(_ADD_COUNTS_SQL[target_type], rows)
+            except BaseException:
+                # Put the changes back (merging with any queued meanwhile)
+                self._inflight = {}
+                for (target_type, target_id), (upvotes, downvotes) in deltas.items():
+                    self.add(target_type, target_id, upvotes, downvotes)
+                raise
+
+            self._inflight = {}
+            keys = list(deltas)
+            for listener in self._flush_listeners:
+                listener(keys)
+
+            return len(deltas)
+
+
 class VoteSystem:
     """Manages voting operations for skills and comments."""
 
+    # Optimistic vote attempts before falling back to a locking transaction
+    MAX_VOTE_RETRIES = 3
+
+    def __init__(
+        self,
+        counter_aggregator: Optional[VoteCounterAggregator] = None,
+        counter_cache_size: int = 0
+    ):
+        """
+        Initialize the vote system.
+
+        Args:
+            counter_aggregator: Queue counter changes in this aggregator
+                instead of updating the skills/comments row on every vote.
+                The vote record itself is still written synchronously, and
+                returned counts include the queued changes. The caller starts
+                and stops the aggregator with the application. Off by default.
+            counter_cache_size: Keep the counts of up to this many targets in
+                an in-process LRU cache so get_votes() can skip the SELECT.
+                Entries are written through from every vote made by this
+                instance, so enable it only when all votes go through a
+                single VoteSystem (one worker process). 0 disables the cache.
+        """
+        self.counter_aggregator = counter_aggregator
+        self.counter_cache_size = counter_cache_size
+        self._counter_cache: "OrderedDict[Tuple[str, str], Tuple[int, int, int]]" = OrderedDict()
+        # Bumped on every invalidation; rows read across a bump may predate the flush
+        self._counter_generation = 0
+
+        # Flushed targets changed in the database behind the cache's back
+        if counter_aggregator is not None and counter_cache_size:
+            counter_aggregator.add_flush_listener(self._invalidate_counts)
+
     async def vote(
         self,
         target_type: str,
@@ -42,42 +370,78 @@ class VoteSystem:
             ValueError: If invalid parameters provided
         """
         # Validate inputs
-        if target_type not in ['skill', 'comment']:
+        if target_type not in TARGET_TABLES:
             raise ValueError(f"Invalid target_type: {target_type}. Must be 'skill' or 'comment'")
 
-        if vote_type not in ['upvote', 'downvote', 'cancel']:
+        if vote_type not in VOTE_TYPES:
             raise ValueError(f"Invalid vote_type: {vote_type}. Must be 'upvote', 'downvote', or 'cancel'")
 
         async with db.get_connection() as conn:
+            # Optimistic attempts without an explicit transaction: every write
+            # is a single statement, which is atomic on its own, and only
+            # applies if the vote is still in the state the lookup saw. No-op
+            # requests (same vote again, nothing to cancel) therefore never
+            # open a write transaction.
+            for _ in range(self.MAX_VOTE_RETRIES):
+                result = await self._apply_vote(conn, _LOOKUP_SQL, target_type, target_id, agent_did, vote_type)
+                if result is not None:
+                    return result
+
+            # Concurrent requests kept changing this agent's vote between the
+            # lookup and the write: lock the vote and apply it in a transaction
             async with conn.transaction():
-                # Get agent_id from did
-                agent_id = await conn.fetchval(
-                    "SELECT agent_id FROM agents WHERE did = $1",
-                    agent_did
-                )
-
-                if not agent_id:
-                    return {
-                        "success": False,
-                        "message": "Agent not found",
-                        "upvotes": 0,
-                        "downvotes": 0,
-                        "vote_score": 0
-                    }
-
-                # Check for existing vote
-                existing_vote = await conn.fetchrow(
-                    "SELECT vote_type FROM votes WHERE agent_id = $1 AND target_type = $2 AND target_id = $3",
-                    agent_id, target_type, target_id
-                )
-
-                # Handle different scenarios
-                if vote_type == 'cancel':
-                    return await self._cancel_vote(conn, existing_vote, target_type, target_id, agent_id)
-                elif existing_vote:
-                    return await self._change_vote(conn, existing_vote, target_type, target_id, agent_id, vote_type)
-                else:
-                    return await self._new_vote(conn, target_type, target_id, agent_id, vote_type)
+                result = await self._apply_vote(conn, _LOOKUP_LOCKED_SQL, target_type, target_id, agent_did, vote_type)
+                if result is None:
+                    # Lost an insert race (there was no vote to lock); the
+                    # other vote is committed now, so this lookup locks it
+                    result = await self._apply_vote(conn, _LOOKUP_LOCKED_SQL, target_type, target_id, agent_did, vote_type)
+                return result
+
+    async def _apply_vote(
+        self,
+        conn,
+        lookup_sql: str,
+        target_type: str,
+        target_id: str,
+        agent_did: str,
+        vote_type: str
+    ) -> Optional[Dict[str, any]]:
+        """
+        Look up the agent's existing vote and apply the requested vote.
+
+        Args:
+            conn: Database connection
+            lookup_sql: _LOOKUP_SQL, or _LOOKUP_LOCKED_SQL inside a transaction
+            target_type: Type of target ('skill' or 'comment')
+            target_id: ID of the skill or comment
+            agent_did: DID of the agent casting the vote
+            vote_type: Type of vote ('upvote', 'downvote', or 'cancel')
+
+        Returns:
+            The vote() result, or None if a concurrent request changed the
+            agent's vote between the lookup and the write
+        """
+        # Get agent_id from did together with the agent's existing vote
+        row = await conn.fetchrow(lookup_sql, agent_did, target_type, target_id)
+
+        if not row:
+            return {
+                "success": False,
+                "message": "Agent not found",
+                "upvotes": 0,
+                "downvotes": 0,
+                "vote_score": 0
+            }
+
+        agent_id = row['agent_id']
+        existing_vote = row if row['vote_type'] else None
+
+        # Handle different scenarios
+        if vote_type == 'cancel':
+            return await self._cancel_vote(conn, existing_vote, target_type, target_id, agent_id)
+        if existing_vote:
+            return await self._change_vote(conn, existing_vote, target_type, target_id, agent_id, vote_type)
+        return await self._new_vote(conn, target_type, target_id, agent_id, vote_type)
 
     async def _new_vote(
         self,
@@ -86,42 +450,15 @@ class VoteSystem:
         target_id: str,
         agent_id: str,
         vote_type: str
-    ) -> Dict[str, any]:
-        """Handle a new vote."""
-        # Insert vote record
-        await conn.execute(
-            """INSERT INTO votes (agent_id, target_type, target_id, vote_type)
-               VALUES ($1, $2, $3, $4)""",
-            agent_id, target_type, target_id, vote_type
+    ) -> Optional[Dict[str, any]]:
+        """Handle a new vote (None if a concurrent vote got there first)."""
+        stats = await self._write_vote(
+            conn, (None, vote_type),
+            (agent_id, target_type, target_id, vote_type),
+            target_type, target_id
         )
-
-        # Update target table (skills or comments)
-        if target_type == 'skill':
-            table = 'skills'
-            id_column = 'skill_id'
-        else:  # comment
-            table = 'comments'
-            id_column = 'comment_id'
-
-        if vote_type == 'upvote':
-            await conn.execute(
-                f"""UPDATE {table}
-                    SET upvotes = upvotes + 1,
-                        vote_score = vote_score + 1
-                    WHERE {id_column} = $1""",
-                target_id
-            )
-        else:  # downvote
-            await conn.execute(
-                f"""UPDATE {table}
-                    SET downvotes = downvotes + 1,
-                        vote_score = vote_score - 1
-                    WHERE {id_column} = $1""",
-                target_id
-            )
-
-        # Get updated counts
-        stats = await self.get_votes(conn, target_type, target_id)
+        if stats is None:
+            return None
 
         return {
             "success": True,
@@ -137,8 +474,8 @@ class VoteSystem:
         target_id: str,
         agent_id: str,
         new_vote_type: str
-    ) -> Dict[str, any]:
-        """Handle changing an existing vote."""
+    ) -> Optional[Dict[str, any]]:
+        """Handle changing an existing vote (None if it changed concurrently)."""
         old_vote_type = existing_vote['vote_type']
 
         # If same vote type, no change needed
@@ -150,46 +487,14 @@ class VoteSystem:
                 **stats
             }
 
-        # Update vote record
-        await conn.execute(
-            """UPDATE votes
-               SET vote_type = $1, updated_at = CURRENT_TIMESTAMP
-               WHERE agent_id = $2 AND target_type = $3 AND target_id = $4""",
-            new_vote_type, agent_id, target_type, target_id
-        )
-
-        # Update target table (skills or comments)
-        if target_type == 'skill':
-            table = 'skills'
-            id_column = 'skill_id'
-        else:  # comment
-            table = 'comments'
-            id_column = 'comment_id'
-
         # Adjust counts: remove old vote, add new vote
-        if old_vote_type == 'upvote' and new_vote_type == 'downvote':
-            # upvote -> downvote: decrease upvote, increase downvote, net change = -2
-            await conn.execute(
-                f"""UPDATE {table}
-                    SET upvotes = upvotes - 1,
-                        downvotes = downvotes + 1,
-                        vote_score = vote_score - 2
-                    WHERE {id_column} = $1""",
-                target_id
-            )
-        else:  # downvote -> upvote
-            # downvote -> upvote: decrease downvote, increase upvote, net change = +2
-            await conn.execute(
-                f"""UPDATE {table}
-                    SET downvotes = downvotes - 1,
-                        upvotes = upvotes + 1,
-                        vote_score = vote_score + 2
-                    WHERE {id_column} = $1""",
-                target_id
-            )
-
-        # Get updated counts
-        stats = await self.get_votes(conn, target_type, target_id)
+        stats = await self._write_vote(
+            conn, (old_vote_type, new_vote_type),
+            (agent_id, target_type, target_id, new_vote_type),
+            target_type, target_id
+        )
+        if stats is None:
+            return None
 
         return {
             "success": True,
@@ -204,8 +509,8 @@ class VoteSystem:
         target_type: str,
         target_id: str,
         agent_id: str
-    ) -> Dict[str, any]:
-        """Handle vote cancellation."""
+    ) -> Optional[Dict[str, any]]:
+        """Handle vote cancellation (None if the vote changed concurrently)."""
         if not existing_vote:
             stats = await self.get_votes(conn, target_type, target_id)
             return {
@@ -216,40 +521,14 @@ class VoteSystem:
 
         old_vote_type = existing_vote['vote_type']
 
-        # Delete vote record
-        await conn.execute(
-            "DELETE FROM votes WHERE agent_id = $1 AND target_type = $2 AND target_id = $3",
-            agent_id, target_type, target_id
-        )
-
-        # Update target table (skills or comments)
-        if target_type == 'skill':
-            table = 'skills'
-            id_column = 'skill_id'
-        else:  # comment
-            table = 'comments'
-            id_column = 'comment_id'
-
         # Adjust counts
-        if old_vote_type == 'upvote':
-            await conn.execute(
-                f"""UPDATE {table}
-                    SET upvotes = upvotes - 1,
-                        vote_score = vote_score - 1
-                    WHERE {id_column} = $1""",
-                target_id
-            )
-        else:  # downvote
-            await conn.execute(
-                f"""UPDATE {table}
-                    SET downvotes = downvotes - 1,
-                        vote_score = vote_score + 1
-                    WHERE {id_column} = $1""",
-                target_id
-            )
-
-        # Get updated counts
-        stats = await self.get_votes(conn, target_type, target_id)
+        stats = await self._write_vote(
+            conn, (old_vote_type, None),
+            (agent_id, target_type, target_id, old_vote_type),
+            target_type, target_id
+        )
+        if stats is None:
+            return None
 
         return {
             "success": True,
@@ -257,6 +536,90 @@ class VoteSystem:
             **stats
         }
 
+    async def _write_vote(
+        self,
+        conn,
+        transition: Tuple[Optional[str], Optional[str]],
+        args: Tuple,
+        target_type: str,
+        target_id: str
+    ) -> Optional[Dict[str, int]]:
+        """
+        Apply a vote transition to the votes table and the target's counters.
+
+        Without an aggregator the votes statement runs as a data-modifying CTE
+        in front of the counter UPDATE, which returns the new counts, so the
+        whole write is a single round trip. With an aggregator only the votes
+        statement runs here and the counter change is queued. Nothing changes
+        if the vote is no longer in the transition's old state, e.g. when a
+        concurrent request inserted the same agent's vote first.
+
+        Args:
+            conn: Database connection
+            transition: (old vote_type, new vote_type) key of VOTE_TRANSITIONS
+            args: agent_id, target_type, target_id, new vote_type (old
+                vote_type when cancelling)
+            target_type: Type of target ('skill' or 'comment')
+            target_id: ID of the skill or comment
+
+        Returns:
+            Dict with the new upvotes, downvotes, and vote_score counts, or
+            None if the vote was not in the expected state
+        """
+        if self.counter_aggregator is not None:
+            vote_sql, upvotes, downvotes = VOTE_TRANSITIONS[transition]
+            if not await conn.fetchval(vote_sql, *args):
+                return None
+            self.counter_aggregator.add(target_type, target_id, upvotes, downvotes)
+            return await self.get_votes(conn, target_type, target_id)
+
+        row = await conn.fetchrow(_COUNTED_WRITE_SQL[(target_type, transition)], *args)
+        if not row['applied']:
+            return None
+
+        if row['upvotes'] is None:
+            # No such target: the vote is recorded but there is nothing to count
+            return self._stats_from_row(None)
+
+        self._cache_counts(target_type, target_id, row)
+        return self._stats_from_row(row)
+
+    def _cache_counts(
+        self,
+        target_type: str,
+        target_id: str,
+        row,
+        generation: Optional[int] = None
+    ) -> None:
+        """
+        Store a target's counts in the LRU cache (no-op when disabled).
+
+        Args:
+            target_type: Type of target ('skill' or 'comment')
+            target_id: ID of the skill or comment
+            row: Record with upvotes, downvotes, and vote_score
+            generation: _counter_generation read before the query that
+                produced row. If an aggregator flush invalidated the cache
+                since then, the row may not include the flushed changes
+                and is not cached.
+        """
+        if not self.counter_cache_size:
+            return
+        if generation is not None and generation != self._counter_generation:
+            return
+
+        key = (target_type, target_id)
+        self._counter_cache[key] = (row['upvotes'], row['downvotes'], row['vote_score'])
+        self._counter_cache.move_to_end(key)
+        if len(self._counter_cache) > self.counter_cache_size:
+            self._counter_cache.popitem(last=False)
+
+    def _invalidate_counts(self, keys: List[Tuple[str, str]]) -> None:
+        """Drop cached counts for the given (target_type, target_id) keys."""
+        self._counter_generation += 1
+        for key in keys:
+            self._counter_cache.pop(key, None)
+
     async def get_votes(
         self,
         conn,
@@ -266,26 +629,101 @@ class VoteSystem:
         """
         Get vote statistics for a target.
 
+        Served from the counter cache when enabled and the target is cached.
+
         Args:
             conn: Database connection
             target_type: Type of target ('skill' or 'comment')
             target_id: ID of the skill or comment
 
         Returns:
-            Dict with upvotes, downvotes, and vote_score counts
+            Dict with upvotes, downvotes, and vote_score counts, including
+            changes still pending in the counter aggregator
         """
-        if target_type == 'skill':
-            table = 'skills'
-            id_column = 'skill_id'
-        else:  # comment
-            table = 'comments'
-            id_column = 'comment_id'
-
-        row = await conn.fetchrow(
-            f"SELECT upvotes, downvotes, vote_score FROM {table} WHERE {id_column} = $1",
-            target_id
-        )
+        key = (target_type, target_id)
+        cached = self._counter_cache.get(key)
+        if cached is not None:
+            self._counter_cache.move_to_end(key)
+            stats = {
+                "upvotes": cached[0],
+                "downvotes": cached[1],
+                "vote_score": cached[2]
+            }
+        else:
+            generation = self._counter_generation
+            row = await conn.fetchrow(_GET_VOTES_SQL[target_type], target_id)
+            if row:
+                self._cache_counts(target_type, target_id, row, generation)
+            stats = self._stats_from_row(row)
+
+        # Counter changes queued in the aggregator are not in the row yet
+        if self.counter_aggregator is not None:
+            upvotes, downvotes = self.counter_aggregator.pending(target_type, target_id)
+            stats["upvotes"] += upvotes
+            stats["downvotes"] += downvotes
+            stats["vote_score"] += upvotes - downvotes
+
+        return stats
+
+    async def get_votes_bulk(
+        self,
+        conn,
+        target_type: str,
+        target_ids: List[str]
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Get vote statistics for many targets with a single query.
+
+        Meant for listing pages, which would otherwise call get_votes() once
+        per item. Cached targets are not queried.
+
+        Args:
+            conn: Database connection
+            target_type: Type of target ('skill' or 'comment')
+            target_ids: IDs of the skills or comments
 
+        Returns:
+            Dict mapping each target_id to its upvotes, downvotes, and
+            vote_score counts (zeros for unknown targets), including changes
+            still pending in the counter aggregator
+        """
+        target_ids = list(dict.fromkeys(target_ids))
+        results = {}
+        missing = []
+        for target_id in target_ids:
+            cached = self._counter_cache.get((target_type, target_id))
+            if cached is not None:
+                results[target_id] = {
+                    "upvotes": cached[0],
+                    "downvotes": cached[1],
+                    "vote_score": cached[2]
+                }
+            else:
+                missing.append(target_id)
+
+        if missing:
+            generation = self._counter_generation
+            rows = await conn.fetch(_GET_VOTES_BULK_SQL[target_type], missing)
+            for row in rows:
+                self._cache_counts(target_type, row['target_id'], row, generation)
+                results[row['target_id']] = self._stats_from_row(row)
+
+        for target_id in target_ids:
+            stats = results.get(target_id)
+            if stats is None:
+                stats = results[target_id] = self._stats_from_row(None)
+
+            if self.counter_aggregator is not None:
+                upvotes, downvotes = self.counter_aggregator.pending(target_type, target_id)
+                stats["upvotes"] += upvotes
+                stats["downvotes"] += downvotes
+                stats["vote_score"] += upvotes - downvotes
+
+        return results
+
+    @staticmethod
+    def _stats_from_row(row) -> Dict[str, int]:
+        """Convert an (upvotes, downvotes, vote_score) row to a stats dict; zeros if missing."""
         if not row:
             return {
                 "upvotes": 0,
@@ -323,3 +761,39 @@ class VoteSystem:
             agent_did=agent_did,
             vote_type='upvote'
         )
+
+    async def handle_duplicate_uploads(
+        self,
+        uploads: List[Tuple[str, str]]
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Handle automatic upvotes for a batch of duplicate uploads.
+
+        Equivalent to handle_duplicate_upload() for each (skill_id, agent_did)
+        pair, except that an agent who already voted on the skill keeps that
+        vote, and the whole batch is a single statement in one transaction
+        instead of one transaction per upload. Unknown agents are skipped.
+
+        Args:
+            uploads: List of (skill_id, agent_did) pairs
+
+        Returns:
+            Dict mapping each skill_id that gained upvotes to its new
+            upvotes, downvotes, and vote_score counts
+        """
+        if not uploads:
+            return {}
+
+        skill_ids = [skill_id for skill_id, _ in uploads]
+        agent_dids = [agent_did for _, agent_did in uploads]
+
+        generation = self._counter_generation
+        async with db.get_connection() as conn:
+            rows = await conn.fetch(_DUPLICATE_UPVOTES_SQL, skill_ids, agent_dids)
+
+        results = {}
+        for row in rows:
+            self._cache_counts('skill', row['skill_id'], row, generation)
+            results[row['skill_id']] = self._stats_from_row(row)
+
+        return results
@@ -5,7 +5,7 @@ Skills Arena Web Server
 基于 Flask 的轻量级 Web 服务器，提供 RESTful API 和前端界面
 """
 
-from flask import Flask, jsonify, request, render_template_string
+from flask import Flask, jsonify, request
 import json
 from pathlib import Path
 from datetime import datetime
@@ -15,9 +15,12 @@ import os
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
 from arena_manager import ArenaManager
+from json_provider import OrjsonProvider
+from precompressed import PrecompressedBody
 
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # 初始化管理器
 data_dir = Path(__file__).parent.parent / "data"
@@ -651,13 +654,22 @@ INDEX_TEMPLATE = """
 </html>
 """
 
+# 主页模板不含任何模板变量，启动时渲染一次，之后每个请求直接返回字节
+_INDEX_HTML = PrecompressedBody(
+    app.jinja_env.from_string(INDEX_TEMPLATE).render().encode('utf-8'),
+    'text/html; charset=utf-8'
+)
+
 
 # API 路由
 
 @app.route('/')
 def index():
-    """主页"""
-    return render_template_string(INDEX_TEMPLATE)
+    """主页（按 Accept-Encoding 返回预先压缩好的内容）"""
+    response = _INDEX_HTML.response()
+    response.set_etag(_INDEX_HTML.etag)
+    response.headers['Cache-Control'] = 'public, max-age=300'
+    return response.make_conditional(request)
 
 
 @app.route('/api/scenarios', methods=['GET'])
@@ -670,7 +682,7 @@ def get_scenarios():
 @app.route('/api/scenarios/<scenario_id>', methods=['GET'])
 def get_scenario(scenario_id):
     """获取特定场景"""
-    scenario = manager.load_scenario(scenario_id)
+    scenario = manager.get_scenario(scenario_id)
     if not scenario:
         return jsonify({"error": "Scenario not found"}), 404
     return jsonify(scenario)
@@ -736,7 +748,7 @@ def add_skill_to_scenario(scenario_id, skill_id):
 def get_leaderboard(scenario_id):
     """获取排行榜"""
     try:
-        leaderboard = manager.generate_leaderboard(scenario_id)
+        leaderboard = manager.get_leaderboard(scenario_id)
         return jsonify(leaderboard)
     except Exception as e:
         return jsonify({"error": str(e)}), 400
@@ -807,7 +819,9 @@ def main():
     print(f"Data Directory: {data_dir}")
     print("=" * 80)
 
-    app.run(host=args.host, port=args.port, debug=args.debug)
+    # 使用 Werkzeug 的多线程服务器：处理函数都是阻塞的本地文件读写，gevent 即使打了
+    # monkey 补丁也不会让文件 I/O 让出，线程反而能在读盘时释放 GIL 并行处理其他请求
+    app.run(host=args.host, port=args.port, debug=args.debug, threaded=True)
 
 
 if __name__ == '__main__':
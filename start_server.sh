@@ -67,5 +67,10 @@ echo ""
 echo "按 Ctrl+C 停止服务器"
 echo ""
 
-# 启动服务器
-python3 production_web_server.py
+# 启动服务器（优先使用 gunicorn）
+if command -v gunicorn &> /dev/null; then
+    exec gunicorn -c gunicorn.conf.py production_web_server:app
+else
+    echo "⚠️  未检测到 gunicorn，使用开发服务器启动"
+    python3 production_web_server.py
+fi
@@ -3,7 +3,7 @@ Tests for Reddit-style hot algorithm and feed system.
 """
 import pytest
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from scripts.feed_algorithm import FeedAlgorithm
 from scripts.database.db import db
 
@@ -394,3 +394,49 @@ async def test_hot_score_formula_accuracy():
 
     # Should be very close (within rounding error)
     assert abs(score - expected_hot) < 0.01
+
+
+def test_feed_query_variants_prebuilt():
+    """Test that every sort/community combination has a prebuilt query."""
+    feed_algo = FeedAlgorithm()
+
+    assert len(feed_algo._feed_queries) == 6
+
+    for sort_by, order_by in FeedAlgorithm.SORT_ORDER_BY.items():
+        plain = feed_algo._feed_queries[(sort_by, False)]
+        filtered = feed_algo._feed_queries[(sort_by, True)]
+
+        assert f"ORDER BY {order_by}" in plain
+        assert "$3" not in plain
+        # Community is bound as the third parameter after LIMIT/OFFSET
+        assert "AND s.community = $3" in filtered
+        assert "LIMIT $1 OFFSET $2" in filtered
+
+
+def test_calculate_hot_score_reference_time():
+    """Test hot score with an explicit reference time and aware timestamps."""
+    feed_algo = FeedAlgorithm()
+
+    now = datetime(2024, 1, 2, 12, 0, tzinfo=timezone.utc)
+    created_at = now - timedelta(hours=18)
+
+    # log10(100) + 18 / 1.8 == 2 + 10
+    assert feed_algo.calculate_hot_score(110, 10, created_at, now=now) == 12.0
+
+    # Aware timestamps (as returned by asyncpg) work without a reference time
+    assert feed_algo.calculate_hot_score(0, 0, datetime.now(timezone.utc)) >= 0
+
+
+@pytest.mark.asyncio
+async def test_get_feed_hot_view(setup_test_data):
+    """Test hot feed served from the materialized view matches the live query."""
+    live_algo = FeedAlgorithm()
+    view_algo = FeedAlgorithm(use_hot_feed_view=True)
+
+    await view_algo.update_hot_scores()
+
+    live = await live_algo.get_feed(sort_by='hot', limit=10)
+    from_view = await view_algo.get_feed(sort_by='hot', limit=10)
+
+    assert [s['hot_score'] for s in from_view] == [s['hot_score'] for s in live]
+    assert set(from_view[0].keys()) == set(live[0].keys())
@@ -0,0 +1,238 @@
+"""
+Tests for the skill validator's hardcoded-dependency and dangerous-code scans.
+"""
+import os
+import time
+
+import pytest
+from scripts import skill_validator as skill_validator_module
+from scripts.skill_validator import SkillValidator
+
+
+@pytest.fixture
+def validator():
+    """Provide a fresh validator instance."""
+    return SkillValidator()
+
+
+@pytest.fixture
+def file_path(tmp_path):
+    """Path of a file inside a skill directory (only used for reporting)."""
+    return tmp_path / "skill" / "scripts" / "main.py"
+
+
+def scan_hardcoded(validator, file_path, content):
+    """Run the hardcoded-dependency scan and return (line, pattern) pairs."""
+    issues = []
+    validator._scan_file_for_hardcoded(content, file_path, issues)
+    return [(issue["line"], issue["pattern"]) for issue in issues]
+
+
+def scan_dangerous(validator, file_path, content):
+    """Run the dangerous-code scan and return (line, pattern) pairs."""
+    issues = []
+    validator._detect_dangerous_code(content, file_path, issues)
+    return [(issue["line"], issue["pattern"]) for issue in issues]
+
+
+# ============================================================================
+# Hardcoded dependency tests
+# ============================================================================
+
+def test_hardcoded_reports_line_numbers(validator, file_path):
+    """Test that matches on later lines get the right line number."""
+    content = "import os\n\nBASE = 'http://localhost:8080'\nHOME = '/home/alice/data'\n"
+
+    assert scan_hardcoded(validator, file_path, content) == [
+        (3, "http://localhost:8080"),
+        (4, "/home/alice/"),
+    ]
+
+
+def test_hardcoded_allowed_domains_are_skipped(validator, file_path):
+    """Test that whitelisted domains are not reported."""
+    content = "URL = 'https://api.openai.com/v1'\nREPO = 'https://github.com/x/y'\n"
+
+    assert scan_hardcoded(validator, file_path, content) == []
+
+
+def test_hardcoded_case_insensitive(validator, file_path):
+    """Test that patterns match regardless of case."""
+    content = "URL = 'HTTP://LOCALHOST:3000'\n"
+
+    assert scan_hardcoded(validator, file_path, content) == [(1, "HTTP://LOCALHOST:3000")]
+
+
+def test_hardcoded_windows_user_path(validator, file_path):
+    """Test that a Windows user directory is detected."""
+    content = 'CONFIG = r"C:\\Users\\alice\\config.ini"\n'
+
+    assert scan_hardcoded(validator, file_path, content) == [(1, "C:\\Users\\alice\\")]
+
+
+def test_hardcoded_file_url_stops_at_whitespace(validator, file_path):
+    """Test that a file URL match ends at the URL, not the end of the line."""
+    content = "see file:///etc/hosts and file:///tmp/x for details\n"
+
+    assert scan_hardcoded(validator, file_path, content) == [
+        (1, "file:///etc/hosts"),
+        (1, "file:///tmp/x"),
+    ]
+
+
+def test_hardcoded_classification_by_pattern(validator, file_path):
+    """Test that each issue takes its severity and texts from the pattern that fired."""
+    content = (
+        'TOKEN = "' + "x" * 40 + '"\n'
+        'password="hunter22"\n'
+        'HOST = "http://10.0.0.1"\n'
+        'DNS = "8.8.8.8:53"\n'
+    )
+    issues = []
+    validator._scan_file_for_hardcoded(content, file_path, issues)
+
+    assert [issue["severity"] for issue in issues] == ["critical", "low", "critical", "high"]
+    assert issues[0]["description"] == SkillValidator._SECRET_DESC
+    assert issues[1]["suggestion"] == SkillValidator._SECRET_FIX
+    assert issues[2]["description"] == SkillValidator._INTRANET_DESC
+    assert issues[3]["description"] == "检测到硬编码依赖: 8.8.8.8:53"
+
+
+def test_hardcoded_repeated_matches_are_capped(validator, file_path):
+    """Test that repeats of one pattern beyond the cap collapse into one summary issue."""
+    cap = SkillValidator.MAX_ISSUES_PER_PATTERN
+    content = "URL = 'http://localhost:8080'\n" * (cap + 30) + "HOME = '/home/alice/'\n"
+    issues = []
+    validator._scan_file_for_hardcoded(content, file_path, issues)
+
+    assert len(issues) == cap + 2
+    assert issues[cap]["pattern"] == "/home/alice/"
+    summary = issues[-1]
+    assert summary["line"] == cap + 1
+    assert "30" in summary["description"]
+
+
+def test_hardcoded_bytes_content_matches_text(validator, file_path):
+    """Test that scanning raw ASCII bytes reports the same issues as text."""
+    content = "a = 1\nURL = 'http://localhost:8080'\nKEY = 'https://api.openai.com'\n"
+
+    assert scan_hardcoded(validator, file_path, content.encode()) == \
+        scan_hardcoded(validator, file_path, content)
+
+
+def test_hardcoded_file_task_handles_text_only_whitespace(validator, file_path):
+    """Test that files needing text semantics are not scanned as bytes."""
+    file_path.parent.mkdir(parents=True)
+    # \x1c is whitespace for str patterns but not for bytes patterns
+    file_path.write_bytes(b'password=\x1c"abcdefghi"\r\nURL = "http://localhost:1"\n')
+
+    skill_dir = file_path.parent.parent
+    issues, error = SkillValidator._hardcoded_file_task(file_path, skill_dir)
+
+    assert error is None
+    assert {issue["file"] for issue in issues} == {"scripts/main.py"}
+    assert [(issue["line"], issue["pattern"]) for issue in issues] == [
+        (1, 'password=\x1c"abcdefghi"'),
+        (2, "http://localhost:1"),
+    ]
+
+
+@pytest.mark.parametrize("content", [
+    'api_key = "' + "a" * 200_000,
+    "/home/" + "a" * 200_000,
+    "1." * 100_000,
+    "file:///" + "a" * 200_000,
+])
+def test_hardcoded_pathological_input_is_linear(validator, file_path, content):
+    """Test that long near-miss inputs do not trigger catastrophic backtracking."""
+    start = time.perf_counter()
+    scan_hardcoded(validator, file_path, content)
+
+    assert time.perf_counter() - start < 2.0
+
+
+def test_map_files_process_pool_matches_inline(tmp_path, monkeypatch):
+    """Test that the opt-in process pool returns the same results as the inline scan."""
+    skill_dir = tmp_path / "skill"
+    skill_dir.mkdir()
+    files = []
+    for i in range(SkillValidator.PARALLEL_MIN_FILES):
+        path = skill_dir / f"f{i}.py"
+        path.write_text(f'URL = "http://localhost:{i}"\nx = {i}\n' if i % 2 else "x = 1\n")
+        files.append(path)
+
+    pools = []
+
+    class RecordingPool(skill_validator_module.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(skill_validator_module, "ProcessPoolExecutor", RecordingPool)
+
+    task = SkillValidator._hardcoded_file_task
+    inline = SkillValidator()._map_files(task, files, skill_dir)
+    assert pools == []
+
+    parallel = SkillValidator(parallel_scan=True)._map_files(task, files, skill_dir)
+    assert len(pools) == 1
+    assert parallel == inline
+    assert sum(len(issues) for issues, _ in parallel) == SkillValidator.PARALLEL_MIN_FILES // 2
+
+
+# ============================================================================
+# Dangerous code tests
+# ============================================================================
+
+def test_dangerous_reports_each_call_once_per_line(validator, file_path):
+    """Test that repeated calls on one line are reported once, in line order."""
+    content = "x = 1\nos.system('a'); os.system('b')\ny = eval(z)\n"
+
+    assert scan_dangerous(validator, file_path, content) == [
+        (2, "os.system"),
+        (3, "eval("),
+    ]
+
+
+def test_dangerous_orders_patterns_within_line(validator, file_path):
+    """Test that several calls on one line follow DANGEROUS_IMPORTS order."""
+    content = "exec(eval(code))\n"
+
+    assert scan_dangerous(validator, file_path, content) == [(1, "eval("), (1, "exec(")]
+
+
+def test_dangerous_bytes_content_matches_text(validator, file_path):
+    """Test that scanning raw ASCII bytes reports the same issues as text."""
+    content = "import os\nos.system(cmd)\nexec(code)\n"
+
+    assert scan_dangerous(validator, file_path, content.encode()) == \
+        scan_dangerous(validator, file_path, content)
+
+
+def test_dangerous_clean_file(validator, file_path):
+    """Test that a file without dangerous calls yields no issues."""
+    assert scan_dangerous(validator, file_path, "print('hello')\n") == []
+
+
+# ============================================================================
+# Script syntax tests
+# ============================================================================
+
+def test_check_syntax_valid_source(validator):
+    """Test that valid source yields no error."""
+    assert validator._check_syntax("def f():\n    return 1\n", "ok.py") is None
+
+
+def test_check_syntax_reports_parser_and_compiler_errors(validator):
+    """Test that both parse errors and compile-stage errors are reported."""
+    assert validator._check_syntax("x = 1\ndef (:\n", "bad.py")[0] == 2
+    assert validator._check_syntax("return 1\n", "bad.py") == (1, "'return' outside function")
+
+
+def test_check_syntax_cached_result_matches(validator):
+    """Test that a repeated check of the same source returns the cached result."""
+    source = "x = (\n"
+    first = validator._check_syntax(source, "a.py")
+
+    assert SkillValidator()._check_syntax(source, "b.py") == first
@@ -3,7 +3,7 @@ Tests for voting system.
 """
 import pytest
 import asyncio
-from scripts.vote_system import VoteSystem
+from scripts.vote_system import VoteSystem, VoteCounterAggregator
 from scripts.database.db import db
 
 
@@ -413,3 +413,135 @@ async def test_cancel_without_voting(setup_test_data):
     assert result['downvotes'] == 0
     assert result['vote_score'] == 0
     assert 'no vote to cancel' in result['message'].lower()
+
+
+@pytest.mark.asyncio
+async def test_vote_with_counter_aggregator(setup_test_data):
+    """Test that aggregated counter changes are returned at once and written on flush."""
+    aggregator = VoteCounterAggregator()
+    vote_system = VoteSystem(counter_aggregator=aggregator)
+
+    await vote_system.vote('skill', 'test_skill_1', 'did:openclaw:00000000000000000000000000000001', 'upvote')
+    result = await vote_system.vote(
+        target_type='skill',
+        target_id='test_skill_1',
+        agent_did='did:openclaw:00000000000000000000000000000002',
+        vote_type='downvote'
+    )
+
+    # Returned counts include the pending changes
+    assert result['upvotes'] == 1
+    assert result['downvotes'] == 1
+    assert result['vote_score'] == 0
+    assert aggregator.pending('skill', 'test_skill_1') == (1, 1)
+
+    async with db.get_connection() as conn:
+        skill = await conn.fetchrow(
+            "SELECT upvotes, downvotes FROM skills WHERE skill_id = $1",
+            'test_skill_1'
+        )
+        assert skill['upvotes'] == 0
+
+    assert await aggregator.flush() == 1
+    assert aggregator.pending('skill', 'test_skill_1') == (0, 0)
+
+    async with db.get_connection() as conn:
+        skill = await conn.fetchrow(
+            "SELECT upvotes, downvotes, vote_score FROM skills WHERE skill_id = $1",
+            'test_skill_1'
+        )
+        assert skill['upvotes'] == 1
+        assert skill['downvotes'] == 1
+        assert skill['vote_score'] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_votes_served_from_counter_cache(setup_test_data):
+    """Test that counts returned by a vote are cached for get_votes."""
+    vote_system = VoteSystem(counter_cache_size=10)
+
+    await vote_system.vote('skill', 'test_skill_1', 'did:openclaw:00000000000000000000000000000001', 'upvote')
+
+    async with db.get_connection() as conn:
+        # Change the row directly; the cached counts are still served
+        await conn.execute("UPDATE skills SET upvotes = 5 WHERE skill_id = $1", 'test_skill_1')
+        stats = await vote_system.get_votes(conn, 'skill', 'test_skill_1')
+
+    assert stats == {"upvotes": 1, "downvotes": 0, "vote_score": 1}
+
+
+@pytest.mark.asyncio
+async def test_get_votes_skips_cache_for_rows_read_across_flush(setup_test_data):
+    """Test that a row read while the aggregator flushed is not cached."""
+    aggregator = VoteCounterAggregator()
+    vote_system = VoteSystem(counter_aggregator=aggregator, counter_cache_size=10)
+
+    class FlushDuringFetch:
+        """Connection wrapper that flushes right after the SELECT has read the row."""
+
+        def __init__(self, conn):
+            self.conn = conn
+
+        async def fetchrow(self, *args):
+            row = await self.conn.fetchrow(*args)
+            await aggregator.flush()
+            return row
+
+    aggregator.add('skill', 'test_skill_1', 1, 0)
+
+    async with db.get_connection() as conn:
+        # The row predates the flush and the flushed change is no longer pending
+        await vote_system.get_votes(FlushDuringFetch(conn), 'skill', 'test_skill_1')
+        stats = await vote_system.get_votes(conn, 'skill', 'test_skill_1')
+
+    assert stats == {"upvotes": 1, "downvotes": 0, "vote_score": 1}
+
+
+@pytest.mark.asyncio
+async def test_duplicate_uploads_batch(setup_test_data):
+    """Test batched duplicate-upload upvotes, including repeats and existing votes."""
+    vote_system = VoteSystem()
+    did_1 = 'did:openclaw:00000000000000000000000000000001'
+    did_2 = 'did:openclaw:00000000000000000000000000000002'
+
+    # Agent 2 already downvoted skill 2; that vote is kept
+    await vote_system.vote('skill', 'test_skill_2', did_2, 'downvote')
+
+    results = await vote_system.handle_duplicate_uploads([
+        ('test_skill_1', did_1),
+        ('test_skill_1', did_1),
+        ('test_skill_1', did_2),
+        ('test_skill_2', did_2),
+        ('test_skill_2', 'did:openclaw:unknown'),
+    ])
+
+    assert results == {
+        'test_skill_1': {"upvotes": 2, "downvotes": 0, "vote_score": 2},
+    }
+
+    async with db.get_connection() as conn:
+        skill = await conn.fetchrow(
+            "SELECT upvotes, downvotes FROM skills WHERE skill_id = $1",
+            'test_skill_2'
+        )
+        assert skill['upvotes'] == 0
+        assert skill['downvotes'] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_votes_bulk(setup_test_data):
+    """Test fetching the counts of several targets at once."""
+    vote_system = VoteSystem()
+
+    await vote_system.vote('skill', 'test_skill_1', 'did:openclaw:00000000000000000000000000000001', 'upvote')
+
+    async with db.get_connection() as conn:
+        results = await vote_system.get_votes_bulk(
+            conn, 'skill', ['test_skill_1', 'test_skill_2', 'test_skill_missing']
+        )
+
+    assert results == {
+        'test_skill_1': {"upvotes": 1, "downvotes": 0, "vote_score": 1},
+        'test_skill_2': {"upvotes": 0, "downvotes": 0, "vote_score": 0},
+        'test_skill_missing': {"upvotes": 0, "downvotes": 0, "vote_score": 0},
+    }